@@ -1,27 +1,174 @@
-from flask import Flask,render_template,request
-import os
-import numpy as np  # Numerical operations library.
-import pandas as pd  # Data manipulation library.
+from flask import Flask,render_template,request,jsonify,url_for,make_response,g
+import time
+from functools import wraps
+from werkzeug.exceptions import RequestEntityTooLarge
+from mlproject import logger, setup_logging
 from mlproject.pipeline.prediction import PredictionPipeline
+from mlproject.pipeline.model_cache import model_cache
+from mlproject.pipeline.model_registry import get_registry
+from mlproject.pipeline.batch_prediction import BatchPredictionPipeline, BatchTooLargeError
+from mlproject.pipeline.training_jobs import TrainingJobRunner, TrainingInProgressError
+from mlproject.config.configuration import ConfigurationManager
+from mlproject.utils.instrumentation import metrics
+from mlproject.utils.profiling import Profiler
+# NumPy, pandas, joblib and scikit-learn are imported lazily on the first request that needs them.
 
 
+setup_logging()
 app = Flask(__name__) # initializing a flask app
+config_manager = ConfigurationManager()
+prediction_config = config_manager.get_prediction_config()
+app.config['MAX_CONTENT_LENGTH'] = prediction_config.max_body_bytes  # Larger bodies get 413 unread.
+metrics.configure(enabled=config_manager.config.get("instrumentation", {}).get("enabled", True))
+
+# Opt-in profiling of a sampled share of prediction requests (profiling in config.yaml).
+profiler = Profiler.from_config(config_manager.get_profiling_config())
+
+# Optional per-row cache of predictions (prediction.cache in config.yaml).
+prediction_cache = None
+if prediction_config.cache:
+    from mlproject.pipeline.prediction_cache import PredictionCache
+    prediction_cache = PredictionCache(
+        max_entries=prediction_config.cache_max_entries,
+        ttl_seconds=prediction_config.cache_ttl_seconds,
+        decimals=prediction_config.cache_decimals
+    )
+
+batch_pipeline = BatchPredictionPipeline(config=prediction_config, cache=prediction_cache)
+
+
+def on_training_success(job):
+    """Drops the cached model and predictions so the next request serves the new model."""
+    model_cache.invalidate()
+    if prediction_cache is not None:
+        prediction_cache.clear()
+
+
+# Background training; a finished run hot-swaps the model.
+training_runner = TrainingJobRunner(on_success=on_training_success)
+
+# Optional micro-batching of concurrent single-row requests (prediction.micro_batching in config.yaml).
+micro_batcher = None
+if prediction_config.micro_batching:
+    from mlproject.pipeline.micro_batching import MicroBatcher
+    micro_batcher = MicroBatcher(
+        predict_fn=lambda data: PredictionPipeline(
+            model_path=prediction_config.model_path,
+            linear_model_path=prediction_config.linear_model_path,
+            registry_dir=prediction_config.registry_dir,
+            version=prediction_config.model_version,
+            cache=prediction_cache
+        ).predict(data),
+        max_wait_ms=prediction_config.micro_batch_wait_ms,
+        max_batch_rows=prediction_config.micro_batch_rows
+    )
+
+# Optional A/B split and shadow scoring of /predict between registry versions (prediction.variants in config.yaml).
+variant_router = None
+if prediction_config.variants:
+    from mlproject.pipeline.model_variants import VariantRouter
+    variant_router = VariantRouter(
+        routes=prediction_config.variant_routes,
+        shadow=prediction_config.shadow_version,
+        registry_dir=prediction_config.registry_dir,
+        model_path=prediction_config.model_path,
+        linear_model_path=prediction_config.linear_model_path,
+        shadow_queue_size=prediction_config.shadow_queue_size,
+        cache=prediction_cache
+    )
+
+def predict_rows(data, routing_key=None):
+    """
+    Scores the rows of a /predict request with the A/B variants, the micro-batcher or the served model.
+
+    Args:
+        data: Feature matrix of shape (n_rows, 11).
+        routing_key (str, optional): Routing key of the A/B split. Defaults to None.
+
+    Returns:
+        tuple: Name of the variant that answered (None without variants) and the predictions.
+    """
+    if variant_router is not None:
+        return variant_router.predict(data, key=routing_key)
+    if micro_batcher is not None:
+        return None, micro_batcher.predict(data)
+    obj = PredictionPipeline(
+        model_path=prediction_config.model_path,
+        linear_model_path=prediction_config.linear_model_path,
+        registry_dir=prediction_config.registry_dir,
+        version=prediction_config.model_version,
+        cache=prediction_cache
+    )
+    return None, obj.predict(data)
+
+
+def profiled(endpoint):
+    """Profiles the sampled requests of a route; ?profile=1 forces it when profiling.allow_query_flag is set."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not profiler.sample_request(request.args.get('profile')):
+                return view(*args, **kwargs)
+            with profiler.profile("requests", endpoint):
+                return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@app.before_request
+def start_timer():
+    g.start_time = time.perf_counter()
+
+
+@app.after_request
+def record_request(response):
+    # Requests are labelled by route function, which keeps the number of series bounded.
+    if metrics.enabled and hasattr(g, 'start_time'):
+        metrics.observe("mlproject_http_request_seconds", time.perf_counter() - g.start_time,
+                        endpoint=request.endpoint or "unknown", status=str(response.status_code))
+    return response
+
+
+@app.errorhandler(RequestEntityTooLarge)
+def body_too_large(e):
+    return jsonify(error=f"Request body exceeds {prediction_config.max_body_bytes} bytes"), 413
+
+
+@app.route('/metrics',methods=['GET'])  # route to scrape the metrics in the Prometheus text format
+def prometheus_metrics():
+    return metrics.render_prometheus(), 200, {'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+
 
 @app.route('/',methods=['GET'])  # route to display the home page
 def homePage():
     return render_template("index.html")
 
 
-@app.route('/train',methods=['GET'])  # route to train the pipeline
+@app.route('/train',methods=['GET'])  # route to start training the pipeline in the background
 def training():
-    os.system("python main.py")
-    return "Training Successful!" 
+    try:
+        job = training_runner.submit()
+    except TrainingInProgressError as e:
+        return jsonify(error=str(e)), 409
+    return jsonify(job_id=job.id, status_url=url_for('training_status', job_id=job.id)), 202
+
+
+@app.route('/train/<job_id>',methods=['GET'])  # route to follow a training job
+def training_status(job_id):
+    job = training_runner.get(job_id)
+    if job is None:
+        return jsonify(error=f"Unknown training job: {job_id}"), 404
+    return jsonify(job.to_dict())
 
 @app.route('/predict',methods=['POST','GET']) # route to show the predictions in a web UI
+@profiled("predict")
 def index():
     if request.method == 'POST':
         try:
+            import numpy as np  # Numerical operations library, imported on first request.
+
             #  reading the inputs given by the user
+            parse_start = time.perf_counter()
             fixed_acidity =float(request.form['fixed_acidity'])
             volatile_acidity =float(request.form['volatile_acidity'])
             citric_acid =float(request.form['citric_acid'])
@@ -37,19 +184,105 @@ def index():
          
             data = [fixed_acidity,volatile_acidity,citric_acid,residual_sugar,chlorides,free_sulfur_dioxide,total_sulfur_dioxide,density,pH,sulphates,alcohol]
             data = np.array(data).reshape(1, 11)
+            metrics.observe("mlproject_request_parse_seconds", time.perf_counter() - parse_start, endpoint="predict")
             
-            obj = PredictionPipeline()
-            predict = obj.predict(data)
+            # Requests with the same X-Routing-Key header always get the same variant.
+            variant, predict = predict_rows(data, routing_key=request.headers.get('X-Routing-Key'))
 
-            return render_template('results.html', prediction = str(predict))
+            response = make_response(render_template('results.html', prediction = str(predict)))
+            if variant is not None:
+                response.headers['X-Model-Variant'] = variant
+            return response
 
+        except RequestEntityTooLarge:
+            raise  # Answered by body_too_large.
         except Exception as e:
-            print('The Exception message is: ',e)
+            logger.exception(f"Prediction failed: {e}")
             return 'something is wrong'
 
     else:
         return render_template('index.html')
-    
+
+
+@app.route('/predict/batch',methods=['POST']) # route to score many rows (JSON, NDJSON or CSV) in one request
+@profiled("batch")
+def batch_predict():
+    try:
+        with metrics.timer("mlproject_request_parse_seconds", endpoint="batch"):
+            data = batch_pipeline.parse(request.get_data(), request.content_type)
+    except BatchTooLargeError as e:
+        return jsonify(error=str(e)), 413
+    except ValueError as e:
+        return jsonify(error=str(e)), 400
+
+    if len(data) == 0:
+        return jsonify(error="Batch has no rows"), 400
+
+    start = time.perf_counter()
+    predictions = batch_pipeline.predict(data)
+    elapsed = time.perf_counter() - start
+
+    response = jsonify(predictions=predictions.tolist())
+    response.headers['X-Batch-Rows'] = str(len(data))
+    response.headers['X-Inference-Seconds'] = f"{elapsed:.6f}"
+    response.headers['X-Rows-Per-Second'] = f"{len(data) / elapsed:.1f}" if elapsed > 0 else "inf"
+    return response
+
+
+@app.route('/model/stats',methods=['GET'])  # route to inspect the model cache
+def model_stats():
+    stats = model_cache.stats()
+    if micro_batcher is not None:
+        stats['micro_batching'] = micro_batcher.stats()
+    if prediction_cache is not None:
+        stats['prediction_cache'] = prediction_cache.stats()
+    return jsonify(stats)
+
+
+@app.route('/model/variants',methods=['GET'])  # route to compare the A/B and shadow variants
+def model_variants():
+    if variant_router is None:
+        return jsonify(error="Model variants are disabled (prediction.variants.enabled in config.yaml)"), 404
+    return jsonify(variant_router.stats())
+
+
+@app.route('/model/versions',methods=['GET'])  # route to list the registered model versions
+def model_versions():
+    registry = get_registry(prediction_config.registry_dir)
+    versions = []
+    for version in registry.versions():
+        metadata = registry.metadata(version)
+        scores = metadata.get("metrics", {})
+        versions.append({"version": version, "created_at": metadata.get("created_at"), "sha256": metadata.get("sha256"),
+                         **{name: scores.get(name) for name in ("rmse", "mae", "r2")}})
+    return jsonify(current=registry.current(), serving=prediction_config.model_version, versions=versions,
+                   history=registry.history())
+
+
+@app.route('/model/promote/<version>',methods=['POST'])  # route to promote a version, gated on its metrics
+def model_promote(version):
+    from mlproject.components.model_registration import ModelRegistration  # Imported on first use.
+
+    registration = ModelRegistration(config=config_manager.get_model_registry_config())
+    try:
+        # Loading the version before the pointer swap, so no request waits for the load.
+        PredictionPipeline(registry_dir=prediction_config.registry_dir, version=version)
+        decision = registration.promote(version, force=request.args.get('force') in ('1', 'true'))
+    except KeyError as e:
+        return jsonify(error=str(e.args[0])), 404
+    status = 200 if decision["promoted"] or decision["reason"] == "already current" else 409
+    return jsonify(current=registration.registry.current(), **decision), status
+
+
+@app.route('/model/rollback',methods=['POST'])  # route to return to the previously promoted version
+def model_rollback():
+    registry = get_registry(prediction_config.registry_dir)
+    try:
+        pointer = registry.rollback()
+    except ValueError as e:
+        return jsonify(error=str(e)), 409
+    return jsonify(current=pointer["version"])
+
 
 
 if __name__=="__main__":
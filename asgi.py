@@ -0,0 +1,296 @@
+# File: asgi.py
+# Purpose: Asynchronous (ASGI) entry point serving the web UI, prediction and training routes of application.py
+# with asyncio, e.g. `uvicorn asgi:app`; model inference runs on a bounded thread pool off the event loop.
+
+import os  # Static file paths.
+import json  # JSON responses.
+import time  # Request and inference timings.
+import asyncio  # Event loop and executor bridge.
+import mimetypes  # Content types of static files.
+from urllib.parse import parse_qs  # Form bodies and query strings.
+from concurrent.futures import ThreadPoolExecutor  # Inference threads.
+import application as wsgi  # Shares the configuration, caches, models and training runner with the WSGI app.
+from mlproject import logger
+from mlproject.pipeline.batch_prediction import BatchTooLargeError
+from mlproject.pipeline.training_jobs import TrainingInProgressError
+from mlproject.utils.instrumentation import metrics
+# NumPy is imported lazily on the first prediction, as in application.py.
+
+# Form fields of the web UI, in the feature order of the model.
+FORM_FIELDS = ("fixed_acidity", "volatile_acidity", "citric_acid", "residual_sugar", "chlorides",
+               "free_sulfur_dioxide", "total_sulfur_dioxide", "density", "pH", "sulphates", "alcohol")
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+
+class OverloadedError(Exception):
+    """Raised when more requests are waiting for inference than the executor accepts."""
+
+
+class BodyTooLargeError(Exception):
+    """Raised when a request body exceeds prediction.max_body_mb."""
+
+
+class InferenceExecutor:
+    def __init__(self, workers: int, max_pending: int):
+        """
+        Initializes the bounded pool running model inference off the event loop.
+
+        The event loop only parses requests and writes responses, so one process keeps thousands of connections
+        open while `workers` threads score. At most `max_pending` requests wait for or run inference; further
+        ones are rejected at once (503) instead of piling up memory and latency in an unbounded queue.
+
+        Args:
+            workers (int): Inference threads.
+            max_pending (int): Requests waiting for or running inference.
+        """
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0  # Only touched from the event loop thread.
+        self.rejected = 0
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="inference")
+
+    async def run(self, fn, *args):
+        """
+        Runs fn(*args) on an inference thread.
+
+        Args:
+            fn: Blocking function to run.
+            *args: Its arguments.
+
+        Returns:
+            The result of fn(*args).
+
+        Raises:
+            OverloadedError: If max_pending requests are already waiting for or running inference.
+        """
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise OverloadedError(f"{self.pending} requests are already waiting for inference")
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+        finally:
+            self.pending -= 1
+
+    def shutdown(self):
+        """Stops the inference threads once their current work is done."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+executor = InferenceExecutor(workers=wsgi.prediction_config.async_workers,
+                             max_pending=wsgi.prediction_config.async_max_pending)
+
+
+async def read_body(receive, limit: int) -> bytes:
+    """Reads the request body, up to `limit` bytes."""
+    chunks, size = [], 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > limit:
+            raise BodyTooLargeError(f"Request body exceeds {limit} bytes")
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+async def respond(send, status: int, body: bytes, content_type: str, headers=None) -> int:
+    """Sends a complete response and returns its status."""
+    raw_headers = [(b"content-type", content_type.encode()), (b"content-length", str(len(body)).encode())]
+    raw_headers += [(key.lower().encode(), str(value).encode()) for key, value in (headers or {}).items()]
+    await send({"type": "http.response.start", "status": status, "headers": raw_headers})
+    await send({"type": "http.response.body", "body": body})
+    return status
+
+
+async def respond_json(send, status: int, payload: dict, headers=None) -> int:
+    """Sends a JSON response and returns its status."""
+    return await respond(send, status, json.dumps(payload).encode(), "application/json", headers)
+
+
+def read_file(path) -> bytes:
+    """Reads a whole file."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def render(template: str, **context) -> bytes:
+    """Renders one of the Flask app's templates."""
+    return wsgi.app.jinja_env.get_template(template).render(**context).encode()
+
+
+def profiled_call(endpoint: str, profile: bool, fn, *args):
+    """Runs fn(*args), under the profiler when the request was sampled; runs on an inference thread."""
+    if not profile:
+        return fn(*args)
+    with wsgi.profiler.profile("requests", endpoint):
+        return fn(*args)
+
+
+def score_form(values, routing_key):
+    """Scores one row of form values with the same variants, micro-batcher or model as application.py."""
+    import numpy as np  # Numerical operations library, imported on first request.
+    return wsgi.predict_rows(np.array(values, dtype=np.float64).reshape(1, len(FORM_FIELDS)), routing_key=routing_key)
+
+
+def score_batch(body: bytes, content_type: str):
+    """Parses and scores a /predict/batch body; returns the rows and the inference seconds."""
+    with metrics.timer("mlproject_request_parse_seconds", endpoint="batch"):
+        data = wsgi.batch_pipeline.parse(body, content_type)
+    if len(data) == 0:
+        raise ValueError("Batch has no rows")
+    start = time.perf_counter()
+    predictions = wsgi.batch_pipeline.predict(data)
+    return len(data), predictions.tolist(), time.perf_counter() - start
+
+
+async def home_page(scope, receive, send, query, headers):
+    return await respond(send, 200, render("index.html"), "text/html; charset=utf-8")
+
+
+async def predict(scope, receive, send, query, headers):
+    if scope["method"] == "GET":
+        return await home_page(scope, receive, send, query, headers)
+    try:
+        # Reading the inputs given by the user; the event loop only parses, inference runs on the executor.
+        parse_start = time.perf_counter()
+        form = parse_qs((await read_body(receive, wsgi.prediction_config.max_body_bytes)).decode())
+        values = [float(form[field][0]) for field in FORM_FIELDS]
+        metrics.observe("mlproject_request_parse_seconds", time.perf_counter() - parse_start, endpoint="predict")
+
+        profile = wsgi.profiler.sample_request(query.get("profile", [None])[0])
+        variant, prediction = await executor.run(profiled_call, "predict", profile, score_form, values,
+                                                 headers.get("x-routing-key"))
+    except BodyTooLargeError as e:
+        return await respond_json(send, 413, {"error": str(e)})
+    except OverloadedError as e:
+        return await respond_json(send, 503, {"error": str(e)}, {"Retry-After": 1})
+    except Exception as e:
+        logger.exception(f"Prediction failed: {e}")
+        return await respond(send, 200, b"something is wrong", "text/html; charset=utf-8")
+
+    response_headers = {"X-Model-Variant": variant} if variant is not None else None
+    return await respond(send, 200, render("results.html", prediction=str(prediction)), "text/html; charset=utf-8",
+                         response_headers)
+
+
+async def batch_predict(scope, receive, send, query, headers):
+    try:
+        body = await read_body(receive, wsgi.prediction_config.max_body_bytes)
+        profile = wsgi.profiler.sample_request(query.get("profile", [None])[0])
+        rows, predictions, elapsed = await executor.run(profiled_call, "batch", profile, score_batch, body,
+                                                        headers.get("content-type"))
+    except (BodyTooLargeError, BatchTooLargeError) as e:
+        return await respond_json(send, 413, {"error": str(e)})
+    except ValueError as e:
+        return await respond_json(send, 400, {"error": str(e)})
+    except OverloadedError as e:
+        return await respond_json(send, 503, {"error": str(e)}, {"Retry-After": 1})
+
+    return await respond_json(send, 200, {"predictions": predictions}, {
+        "X-Batch-Rows": rows,
+        "X-Inference-Seconds": f"{elapsed:.6f}",
+        "X-Rows-Per-Second": f"{rows / elapsed:.1f}" if elapsed > 0 else "inf",
+    })
+
+
+async def training(scope, receive, send, query, headers):
+    try:
+        job = await asyncio.to_thread(wsgi.training_runner.submit)  # May start the worker process.
+    except TrainingInProgressError as e:
+        return await respond_json(send, 409, {"error": str(e)})
+    return await respond_json(send, 202, {"job_id": job.id, "status_url": f"/train/{job.id}"})
+
+
+async def training_status(scope, receive, send, query, headers):
+    job_id = scope["path"][len("/train/"):]
+    job = wsgi.training_runner.get(job_id)
+    if job is None:
+        return await respond_json(send, 404, {"error": f"Unknown training job: {job_id}"})
+    return await respond_json(send, 200, job.to_dict())
+
+
+async def prometheus_metrics(scope, receive, send, query, headers):
+    return await respond(send, 200, metrics.render_prometheus().encode(), "text/plain; version=0.0.4; charset=utf-8")
+
+
+async def static_file(scope, receive, send, query, headers):
+    # Resolving the path inside static/ only, and reading the file off the event loop.
+    path = os.path.realpath(os.path.join(STATIC_DIR, scope["path"][len("/static/"):]))
+    if not path.startswith(STATIC_DIR + os.sep) or not os.path.isfile(path):
+        return await respond_json(send, 404, {"error": "Not found"})
+    body = await asyncio.to_thread(read_file, path)
+    return await respond(send, 200, body, mimetypes.guess_type(path)[0] or "application/octet-stream")
+
+
+# Path -> (endpoint label, allowed methods, handler); labels match the Flask view names in /metrics.
+ROUTES = {
+    "/": ("homePage", ("GET",), home_page),
+    "/predict": ("index", ("GET", "POST"), predict),
+    "/predict/batch": ("batch_predict", ("POST",), batch_predict),
+    "/train": ("training", ("GET",), training),
+    "/metrics": ("prometheus_metrics", ("GET",), prometheus_metrics),
+}
+# Path prefix -> (endpoint label, allowed methods, handler).
+PREFIX_ROUTES = {
+    "/train/": ("training_status", ("GET",), training_status),
+    "/static/": ("static", ("GET",), static_file),
+}
+
+
+async def lifespan(receive, send):
+    """Handles the ASGI lifespan protocol: the inference threads are stopped on shutdown."""
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            executor.shutdown()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    """
+    ASGI application serving /, /predict, /predict/batch, /train, /train/<job_id>, /metrics and static files.
+
+    It shares application.py's configuration, model cache, prediction cache, A/B variants, micro-batcher,
+    profiler and training runner, so both entry points answer identically.
+
+    Args:
+        scope (dict): ASGI connection scope.
+        receive: ASGI receive channel.
+        send: ASGI send channel.
+    """
+    if scope["type"] == "lifespan":
+        return await lifespan(receive, send)
+    if scope["type"] != "http":
+        return
+
+    start = time.perf_counter()
+    path = scope["path"]
+    route = ROUTES.get(path) or next((route for prefix, route in PREFIX_ROUTES.items() if path.startswith(prefix)), None)
+    if route is None:
+        status = await respond_json(send, 404, {"error": "Not found"})
+        endpoint = "unknown"
+    else:
+        endpoint, methods, handler = route
+        if scope["method"] not in methods:
+            status = await respond_json(send, 405, {"error": "Method not allowed"}, {"Allow": ", ".join(methods)})
+        else:
+            query = parse_qs(scope.get("query_string", b"").decode())
+            headers = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope.get("headers", [])}
+            limit = wsgi.prediction_config.max_body_bytes
+            if headers.get("content-length", "0").isdigit() and int(headers.get("content-length", "0")) > limit:
+                # Announced bodies over the limit are refused before they are read, like the WSGI app does.
+                status = await respond_json(send, 413, {"error": f"Request body exceeds {limit} bytes"})
+            else:
+                status = await handler(scope, receive, send, query, headers)
+
+    if metrics.enabled:
+        metrics.observe("mlproject_http_request_seconds", time.perf_counter() - start, endpoint=endpoint,
+                        status=str(status))
@@ -0,0 +1,82 @@
+# File: bench_artifact_formats.py
+# Purpose: Compares parse time and peak RSS of CSV, Parquet, Feather and NumPy dataset artifacts.
+#
+# Usage (from the project root):
+#     python benchmarks/bench_artifact_formats.py --scales 1 100 1000
+# Each load runs in a fresh interpreter so that its peak RSS is measured in isolation.
+
+import argparse  # Command line parsing.
+import json  # Results passed back from the child processes.
+import os  # File sizes.
+import resource  # Peak RSS of the child process.
+import subprocess  # Fresh interpreter per load.
+import sys  # Path of the running interpreter.
+import tempfile  # Scratch directory for the generated artifacts.
+import time  # Wall-clock timers.
+
+FORMATS = ("csv", "parquet", "feather", "npy")
+
+
+def load_in_child(path, fmt):
+    """Loads one artifact, touches every value and prints load time and peak RSS as JSON."""
+    from mlproject.utils.artifacts import load_dataset
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    data = load_dataset(path, fmt)
+    load_seconds = time.perf_counter() - start
+    data.sum(numeric_only=True)  # Forces memory-mapped formats to page the data in.
+    total_seconds = time.perf_counter() - start
+
+    print(json.dumps({
+        "load_seconds": load_seconds,
+        "load_and_scan_seconds": total_seconds,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "rss_increase_mb": (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_kb) / 1024,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse time and peak RSS per artifact format.")
+    parser.add_argument("--data", default="artifacts/data_ingestion/winequality-red.csv")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--formats", nargs="+", default=list(FORMATS))
+    parser.add_argument("--output", help="Optional JSON file to write the results to.")
+    parser.add_argument("--child", nargs=2, metavar=("PATH", "FORMAT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        load_in_child(*args.child)
+        return
+
+    import pandas as pd
+    from mlproject.utils.artifacts import save_dataset
+
+    base = pd.read_csv(args.data)
+    results = []
+    print(f"{'scale':>6} {'rows':>9} {'format':>8} {'size MB':>8} {'write s':>8} {'load s':>8} {'scan s':>8} {'peak MB':>8} {'+RSS MB':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scales:
+            data = pd.concat([base] * scale, ignore_index=True)
+            for fmt in args.formats:
+                start = time.perf_counter()
+                path = save_dataset(data, os.path.join(tmp, f"data_{scale}"), fmt)
+                write_seconds = time.perf_counter() - start
+
+                child = subprocess.run([sys.executable, __file__, "--child", str(path), fmt],
+                                       capture_output=True, text=True, check=True)
+                result = json.loads(child.stdout.strip().splitlines()[-1])
+                result.update(scale=scale, rows=len(data), format=fmt, write_seconds=write_seconds,
+                              size_mb=os.path.getsize(path) / 2 ** 20)
+                results.append(result)
+                print(f"{scale:>6} {len(data):>9} {fmt:>8} {result['size_mb']:8.1f} {write_seconds:8.3f} "
+                      f"{result['load_seconds']:8.3f} {result['load_and_scan_seconds']:8.3f} "
+                      f"{result['peak_rss_mb']:8.1f} {result['rss_increase_mb']:8.1f}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# File: bench_cross_validation.py
+# Purpose: Measures how the parallel k-fold cross-validation stage scales with the number of worker processes.
+#
+# Usage (from the project root, after the trainer stage):
+#     python benchmarks/bench_cross_validation.py --n-workers 1 2 4 8 --scale 50
+
+import argparse  # Command line parsing.
+import os  # Core count.
+import tempfile  # Scratch directory for the scaled dataset.
+from pathlib import Path  # Object-oriented interface to filesystem paths.
+import numpy as np  # Numerical operations library.
+import pandas as pd  # Reads the training split.
+from mlproject.components.cross_validation import CrossValidation
+from mlproject.entity.config_entity import CrossValidationConfig
+from mlproject.utils.artifacts import save_dataset
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaling of k-fold cross-validation with worker count.")
+    parser.add_argument("--data", default="artifacts/data_transformation/train.csv")
+    parser.add_argument("--model", default="artifacts/model_trainer/model.joblib")
+    parser.add_argument("--target", default="quality")
+    parser.add_argument("--scale", type=int, default=50, help="Times the training rows are replicated.")
+    parser.add_argument("--n-workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count()])
+    parser.add_argument("--n-splits", type=int, default=5)
+    parser.add_argument("--n-repeats", type=int, default=2)
+    args = parser.parse_args()
+
+    data = pd.read_csv(args.data)
+    data = pd.concat([data] * args.scale, ignore_index=True)
+    feature_columns = tuple(col for col in data.columns if col != args.target)
+    print(f"{len(data)} rows, {args.n_splits}-fold CV x {args.n_repeats} repeats")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Memory-mapped NumPy artifact, so loading the data is not part of what is compared.
+        train_path = save_dataset(data, Path(tmp) / "train", "npy")
+
+        baseline = None
+        print(f"{'workers':>7} {'seconds':>9} {'speedup':>8} {'efficiency':>10} {'rmse':>14}")
+        for n_workers in sorted(set(args.n_workers)):
+            config = CrossValidationConfig(
+                root_dir=tmp, train_data_path=train_path, artifact_format="npy", model_path=args.model,
+                metric_file_name=os.path.join(tmp, "cv_metrics.json"), target_column=args.target,
+                feature_columns=feature_columns, n_splits=args.n_splits, n_repeats=args.n_repeats,
+                random_state=42, n_workers=n_workers,
+            )
+            report = CrossValidation(config=config).run()
+            seconds = report["seconds"]
+            baseline = baseline or seconds
+            speedup = baseline / seconds
+            rmse = f"{report['rmse']['mean']:.4f}+/-{report['rmse']['std']:.4f}"
+            print(f"{report['n_workers']:>7} {seconds:9.2f} {speedup:7.2f}x {speedup / report['n_workers']:9.0%} {rmse:>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# File: bench_fused_preprocessing.py
+# Purpose: Compares serving a model with preprocessing as a scikit-learn Pipeline (log1p, standardization, PCA,
+# then ElasticNet) with the fused LinearScorer the trainer exports, for several batch sizes.
+#
+# Usage (from the project root, after the transformation stage):
+#     python benchmarks/bench_fused_preprocessing.py --batch-sizes 1 64 1024 100000 --pca 8
+
+import argparse  # Command line parsing.
+import time  # High resolution timers.
+import numpy as np  # Numerical operations library.
+import pandas as pd  # Reads the data splits.
+from sklearn.linear_model import ElasticNet
+from sklearn.pipeline import Pipeline
+from mlproject.components.preprocessing import FeaturePreprocessor
+from mlproject.pipeline.linear_scorer import LinearScorer
+
+TARGET = "quality"
+
+
+def time_per_call(fn, data, repeat):
+    """Returns the median seconds per call of fn(data) over the given number of repeats."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(data)
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pipeline versus fused linear scoring.")
+    parser.add_argument("--train", default="artifacts/data_transformation/train.csv")
+    parser.add_argument("--test", default="artifacts/data_transformation/test.csv")
+    parser.add_argument("--log-columns", nargs="*", default=["residual sugar", "chlorides"])
+    parser.add_argument("--pca", type=int, default=8, help="Principal components kept; 0 disables PCA.")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 64, 1024, 100000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    train, test = pd.read_csv(args.train), pd.read_csv(args.test)
+    feature_columns = tuple(col for col in train.columns if col != TARGET)
+
+    preprocessor = FeaturePreprocessor(feature_columns=feature_columns, log_columns=tuple(args.log_columns),
+                                       standardize=True, pca_components=args.pca or None)
+    model = Pipeline([("preprocess", preprocessor), ("model", ElasticNet(alpha=0.01, l1_ratio=0.1))])
+    model.fit(train[list(feature_columns)], train[TARGET])
+    scorer = LinearScorer.from_estimator(model, feature_columns)
+
+    test_x = test[list(feature_columns)]
+    print(f"max |pipeline - fused| on the test split: {np.abs(model.predict(test_x) - scorer.predict(test_x)).max():.2e}")
+
+    print(f"{'batch':>8} {'pipeline us/row':>16} {'fused us/row':>13} {'speedup':>8}")
+    for batch_size in args.batch_sizes:
+        batch = test_x.sample(batch_size, replace=True, random_state=0).to_numpy()
+        pipeline_seconds = time_per_call(model.predict, batch, args.repeat)
+        fused_seconds = time_per_call(scorer.predict, batch, args.repeat)
+        print(f"{batch_size:>8} {pipeline_seconds / batch_size * 1e6:16.3f} {fused_seconds / batch_size * 1e6:13.3f} "
+              f"{pipeline_seconds / fused_seconds:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
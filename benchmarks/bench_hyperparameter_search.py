@@ -0,0 +1,45 @@
+# File: bench_hyperparameter_search.py
+# Purpose: Measures how the parallel ElasticNet grid search scales with the number of worker processes.
+#
+# Usage (from the project root, after the transformation stage):
+#     python benchmarks/bench_hyperparameter_search.py --n-jobs 1 2 4 8 --scale 20
+
+import argparse  # Command line parsing.
+import os  # Core count.
+import time  # Wall-clock timers.
+import numpy as np  # Numerical operations library.
+import pandas as pd  # Reads the training split.
+from mlproject.components.hyperparameter_search import ElasticNetSearch
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaling of the ElasticNet grid search with worker count.")
+    parser.add_argument("--data", default="artifacts/data_transformation/train.csv")
+    parser.add_argument("--target", default="quality")
+    parser.add_argument("--scale", type=int, default=20, help="Times the training rows are replicated.")
+    parser.add_argument("--n-jobs", type=int, nargs="+", default=[1, 2, 4, os.cpu_count()])
+    parser.add_argument("--alphas", type=int, default=30, help="Number of alphas on the regularization path.")
+    parser.add_argument("--l1-ratios", type=float, nargs="+", default=[0.1, 0.3, 0.5, 0.7, 0.9, 0.95, 0.99, 1.0])
+    parser.add_argument("--cv", type=int, default=5)
+    args = parser.parse_args()
+
+    data = pd.read_csv(args.data)
+    X = np.tile(data.drop(columns=[args.target]).to_numpy(dtype=np.float64), (args.scale, 1))
+    y = np.tile(data[args.target].to_numpy(dtype=np.float64), args.scale)
+    alphas = np.geomspace(1e-3, 1.0, args.alphas)
+    print(f"{len(y)} rows, {len(alphas) * len(args.l1_ratios)} candidates, {args.cv}-fold CV")
+
+    baseline = None
+    print(f"{'n_jobs':>6} {'seconds':>9} {'speedup':>8} {'efficiency':>10}")
+    for n_jobs in sorted(set(args.n_jobs)):
+        search = ElasticNetSearch(alphas, args.l1_ratios, cv=args.cv, n_jobs=n_jobs)
+        start = time.perf_counter()
+        search.fit(X, y)
+        seconds = time.perf_counter() - start
+        baseline = baseline or seconds
+        speedup = baseline / seconds
+        print(f"{n_jobs:>6} {seconds:9.2f} {speedup:7.2f}x {speedup / n_jobs:9.0%}")
+
+
+if __name__ == "__main__":
+    main()
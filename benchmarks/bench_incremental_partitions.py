@@ -0,0 +1,82 @@
+# File: bench_incremental_partitions.py
+# Purpose: Shows that a run after appending a data partition costs time in proportion to the new rows:
+# validation, transformation and streaming training of the appended partition versus a rebuild from scratch.
+#
+# Usage (from the project root):
+#     python benchmarks/bench_incremental_partitions.py --history 20 --rows 50000
+
+import argparse  # Command line parsing.
+import dataclasses  # Points the stage configurations at a scratch directory.
+import os  # Paths.
+import tempfile  # Scratch directory for the partitions and artifacts.
+import time  # Wall-clock timers.
+import numpy as np  # Numerical operations library.
+import pandas as pd  # Generates the partitions.
+from mlproject.config.configuration import ConfigurationManager
+from mlproject.components.data_validation import DataValidation
+from mlproject.components.data_transformation import DataTransformation
+from mlproject.components.model_trainer import ModelTrainer
+from mlproject.utils.partitions import append_partition
+
+
+def make_partition(data: pd.DataFrame, rows: int, rng) -> bytes:
+    """Samples rows of the dataset with a little noise on the float columns, as CSV lines without a header."""
+    sample = data.sample(rows, replace=True, random_state=int(rng.integers(1 << 31))).reset_index(drop=True)
+    floats = sample.columns[sample.dtypes == np.float64]
+    sample[floats] = (sample[floats] * rng.normal(1.0, 0.01, (rows, len(floats)))).round(5)
+    return sample.to_csv(index=False, header=False).encode("utf-8")
+
+
+def run_stages(validation, transformation, trainer) -> float:
+    """Runs validation, transformation and streaming training, returning the wall time."""
+    start = time.perf_counter()
+    validation.validate_all_columns()
+    transformation.train_test_splitting()
+    trainer.train_streaming()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cost of an incremental run versus a rebuild.")
+    parser.add_argument("--data", default="data/winequality-red.csv")
+    parser.add_argument("--history", type=int, default=20, help="Number of partitions already ingested.")
+    parser.add_argument("--rows", type=int, default=50000, help="Rows per partition.")
+    args = parser.parse_args()
+
+    data = pd.read_csv(args.data)
+    header = (",".join(f'"{col}"' if " " in col else col for col in data.columns) + "\n").encode("utf-8")
+    rng = np.random.default_rng(0)
+    manager = ConfigurationManager()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        partitions_dir = os.path.join(tmp, "ingested")
+        output_dir = os.path.join(tmp, "transformed")
+        os.makedirs(output_dir)
+        for _ in range(args.history):
+            append_partition(partitions_dir, header, make_partition(data, args.rows, rng), source="history")
+
+        validation = DataValidation(dataclasses.replace(
+            manager.get_data_validation_config(), partitions_dir=partitions_dir,
+            partition_cache_file=os.path.join(tmp, "validation_cache.json"),
+            REPORT_FILE=os.path.join(tmp, "report.json"), STATUS_FILE=os.path.join(tmp, "status.txt")))
+        transformation = DataTransformation(dataclasses.replace(
+            manager.get_data_transformation_config(), root_dir=output_dir, partitions_dir=partitions_dir,
+            partition_cache_file=os.path.join(tmp, "transformation_cache.json")))
+        # The transformation stage lists the split partitions under root_dir/partitions.
+        trainer = ModelTrainer(dataclasses.replace(
+            manager.get_model_trainer_config(), root_dir=tmp, partitions_dir=os.path.join(output_dir, "partitions"),
+            moments_cache_dir=tmp, leaderboard_file=os.path.join(tmp, "leaderboard.json")))
+
+        rebuild = run_stages(validation, transformation, trainer)
+        append_partition(partitions_dir, header, make_partition(data, args.rows, rng), source="daily")
+        incremental = run_stages(validation, transformation, trainer)
+
+    total = (args.history + 1) * args.rows
+    print(f"history: {args.history} partitions x {args.rows} rows; appended: 1 partition ({total} rows in total)")
+    print(f"{'run':>12} {'seconds':>9}")
+    print(f"{'rebuild':>12} {rebuild:9.2f}")
+    print(f"{'incremental':>12} {incremental:9.2f}  ({rebuild / incremental:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
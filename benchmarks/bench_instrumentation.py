@@ -0,0 +1,52 @@
+# File: bench_instrumentation.py
+# Purpose: Measures the overhead of the instrumentation timers on PredictionPipeline.predict, with metrics on and off.
+#
+# Usage (from the project root, after training):
+#     python benchmarks/bench_instrumentation.py --calls 100000
+
+import argparse  # Command line parsing.
+import time  # High resolution timers.
+import numpy as np  # Numerical operations library.
+import pandas as pd  # Reads the test split used as benchmark input.
+from mlproject.pipeline.prediction import PredictionPipeline
+from mlproject.utils.instrumentation import metrics
+
+
+def per_call(fn, calls, repeat):
+    """Returns the best seconds per call of fn() over the given number of repeats."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Overhead of the instrumentation timers.")
+    parser.add_argument("--data", default="artifacts/data_transformation/test.csv")
+    parser.add_argument("--calls", type=int, default=100_000, help="Calls per measurement.")
+    parser.add_argument("--repeat", type=int, default=5, help="Measurements per setting; the best one is kept.")
+    args = parser.parse_args()
+
+    pipeline = PredictionPipeline()
+    row = np.ascontiguousarray(pd.read_csv(args.data).drop(columns=["quality"]).to_numpy(dtype=np.float64)[:1])
+
+    series = metrics.histogram("bench_seconds")
+    results = {}
+    for enabled in (False, True):
+        metrics.configure(enabled=enabled)
+        results[enabled] = {
+            "observe": per_call(lambda: series.observe(0.001), args.calls, args.repeat),
+            "predict": per_call(lambda: pipeline.predict(row), args.calls, args.repeat),
+        }
+
+    print(f"{'':>22} {'off us':>8} {'on us':>8} {'overhead us':>12}")
+    for name in ("observe", "predict"):
+        off, on = results[False][name] * 1e6, results[True][name] * 1e6
+        print(f"{name:>22} {off:8.2f} {on:8.2f} {on - off:12.2f}")
+
+
+if __name__ == "__main__":
+    main()
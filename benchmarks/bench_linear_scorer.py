@@ -0,0 +1,65 @@
+# File: bench_linear_scorer.py
+# Purpose: Compares per-row and per-batch prediction latency of the sklearn model and the NumPy-only LinearScorer.
+#
+# Usage (from the project root, after training):
+#     python benchmarks/bench_linear_scorer.py --rows 1000 --batch-sizes 1 64 1024 100000
+
+import argparse  # Command line parsing.
+import time  # High resolution timers.
+import joblib  # Loads the sklearn model.
+import numpy as np  # Numerical operations library.
+import pandas as pd  # Reads the test split used as benchmark input.
+from mlproject.pipeline.linear_scorer import LinearScorer
+
+
+def time_per_call(fn, data, repeat):
+    """Returns the median seconds per call of fn(data) over the given number of repeats."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(data)
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-row and per-batch latency of the sklearn model and the LinearScorer.")
+    parser.add_argument("--model", default="artifacts/model_trainer/model.joblib")
+    parser.add_argument("--linear-model", default="artifacts/model_trainer/linear_model.npz")
+    parser.add_argument("--data", default="artifacts/data_transformation/test.csv")
+    parser.add_argument("--rows", type=int, default=1000, help="Single-row calls timed for the per-row benchmark.")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 64, 1024, 100000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    model = joblib.load(args.model)
+    try:
+        scorer = LinearScorer.load(args.linear_model)
+    except FileNotFoundError:
+        # Older artifacts have no export yet: derive it from the sklearn model.
+        scorer = LinearScorer.from_estimator(model, model.feature_names_in_)
+
+    features = pd.read_csv(args.data)[list(scorer.feature_columns)].to_numpy(dtype=np.float64)
+    max_diff = np.max(np.abs(model.predict(features) - scorer.predict(features)))
+    print(f"max |sklearn - scorer| on {len(features)} rows: {max_diff:.3e}")
+
+    # Per-row latency: one call per row, as /predict does.
+    rows = features[np.arange(args.rows) % len(features)]
+    for name, fn in (("sklearn", model.predict), ("scorer", scorer.predict)):
+        start = time.perf_counter()
+        for i in range(len(rows)):
+            fn(rows[i:i + 1])
+        per_row = (time.perf_counter() - start) / len(rows)
+        print(f"{name:>8} per-row: {per_row * 1e6:10.1f} us/call")
+
+    # Per-batch latency: one call per batch, as /predict/batch does.
+    print(f"{'batch':>8} {'sklearn us':>12} {'scorer us':>12} {'speedup':>8}")
+    for size in args.batch_sizes:
+        batch = np.ascontiguousarray(features[np.arange(size) % len(features)])
+        sk = time_per_call(model.predict, batch, args.repeat)
+        np_ = time_per_call(scorer.predict, batch, args.repeat)
+        print(f"{size:>8} {sk * 1e6:12.1f} {np_ * 1e6:12.1f} {sk / np_:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
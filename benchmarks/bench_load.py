@@ -0,0 +1,335 @@
+# File: bench_load.py
+# Purpose: Load test of the prediction service: starts the app locally, drives /predict and /predict/batch with a
+# configurable concurrency and request mix, and reports throughput, latency percentiles and server CPU/RSS.
+#
+# Usage (from the project root, after training):
+#     python benchmarks/bench_load.py --concurrency 1 8 32 --duration 10 --mix predict=0.9 batch=0.1
+#     python benchmarks/bench_load.py --save-baseline benchmarks/load_baseline.json    # record a baseline
+#     python benchmarks/bench_load.py --baseline benchmarks/load_baseline.json         # fail on regressions
+# Results are written to --output as JSON, tagged with the git commit, so runs can be compared between commits.
+# Exits with status 1 when a phase is slower than the baseline by more than --tolerance.
+
+import os  # Process ids and environment.
+import sys  # Path of the running interpreter.
+import json  # Request bodies and machine-readable results.
+import time  # Phase timing and request latencies.
+import random  # Request mix.
+import socket  # Free port lookup.
+import argparse  # Command line parsing.
+import resource  # CPU time of this process and of the server once it exited.
+import threading  # Concurrent clients.
+import subprocess  # Runs the server and reads the git commit.
+import http.client  # Keep-alive HTTP connections.
+from urllib.parse import urlencode, urlsplit  # Form bodies and --url parsing.
+import numpy as np  # Percentiles.
+import pandas as pd  # Reads the test split used as request input.
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Commands serving the app on 127.0.0.1:{port}, by --server name.
+SERVERS = {
+    "flask": [sys.executable, "-c",
+              "from application import app; app.run(host='127.0.0.1', port={port}, threaded=True, debug=False)"],
+    "asgi": [sys.executable, "-m", "uvicorn", "asgi:app", "--host", "127.0.0.1", "--port", "{port}",
+             "--no-access-log", "--backlog", "4096"],
+}
+
+
+def free_port() -> int:
+    """Returns a TCP port that is free on the loopback interface."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(name: str, port: int, timeout: float = 60.0):
+    """
+    Starts the app in a child process and waits until it answers GET /.
+
+    Args:
+        name (str): Key of SERVERS.
+        port (int): Port to serve on.
+        timeout (float, optional): Seconds to wait for the server. Defaults to 60.
+
+    Returns:
+        subprocess.Popen: The server process.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [os.path.join(PROJECT_ROOT, "src"),
+                                                                       os.environ.get("PYTHONPATH")])))
+    command = [part.format(port=port) for part in SERVERS[name]]
+    server = subprocess.Popen(command, cwd=PROJECT_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"{name} server exited with status {server.returncode}")
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            connection.request("GET", "/")
+            if connection.getresponse().status == 200:
+                return server
+        except OSError:
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError(f"{name} server did not answer within {timeout:.0f}s")
+
+
+def process_usage(pid):
+    """
+    Reads the CPU seconds and current/peak RSS of a process from /proc (Linux).
+
+    Returns:
+        tuple: (cpu_seconds, rss_mb, peak_rss_mb), or Nones where /proc is unavailable.
+    """
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")  # utime + stime.
+        memory = {}
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith(("VmRSS:", "VmHWM:")):
+                    key, value = line.split(":")
+                    memory[key] = int(value.split()[0]) / 1024
+        return cpu, memory.get("VmRSS"), memory.get("VmHWM")
+    except (OSError, ValueError, IndexError):
+        return None, None, None
+
+
+def build_requests(data_path: str, batch_rows: int, seed: int) -> dict:
+    """
+    Builds the request bodies of each endpoint from the test split.
+
+    Args:
+        data_path (str): CSV of rows to send; every column but 'quality' is sent.
+        batch_rows (int): Rows per /predict/batch request.
+        seed (int): Seed of the batch row sampling.
+
+    Returns:
+        dict: Endpoint name -> (path, content type, list of bodies, rows per request).
+    """
+    features = pd.read_csv(data_path).drop(columns=["quality"], errors="ignore")
+    form_fields = [column.replace(" ", "_") for column in features.columns]
+    rows = features.to_numpy(dtype=np.float64)
+
+    rng = np.random.default_rng(seed)
+    predict = [urlencode(dict(zip(form_fields, row))).encode() for row in rows]
+    batch = [json.dumps(rows[rng.integers(0, len(rows), batch_rows)].tolist()).encode() for _ in range(64)]
+    return {
+        "predict": ("/predict", "application/x-www-form-urlencoded", predict, 1),
+        "batch": ("/predict/batch", "application/json", batch, batch_rows),
+    }
+
+
+def client(host, port, requests, mix, seed, stop, warmup_end, results):
+    """
+    Sends requests over one keep-alive connection until stop is set, recording those sent after warmup_end.
+
+    Each record is (endpoint, seconds, ok).
+    """
+    rng = random.Random(seed)
+    names, weights = zip(*mix.items())
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    while not stop.is_set():
+        name = rng.choices(names, weights)[0]
+        path, content_type, bodies, _ = requests[name]
+        body = bodies[rng.randrange(len(bodies))]
+        start = time.perf_counter()
+        try:
+            connection.request("POST", path, body=body, headers={"Content-Type": content_type})
+            response = connection.getresponse()
+            response.read()
+            ok = response.status < 400
+        except (OSError, http.client.HTTPException):
+            ok = False
+            connection.close()
+            connection = http.client.HTTPConnection(host, port, timeout=30)
+        if start >= warmup_end:
+            results.append((name, time.perf_counter() - start, ok))
+    connection.close()
+
+
+def summarize(records, seconds: float, rows_per_request: int) -> dict:
+    """Throughput, error count and latency percentiles of a list of (endpoint, seconds, ok) records."""
+    latencies = np.array([record[1] for record in records]) * 1000.0
+    errors = sum(not record[2] for record in records)
+    summary = {"requests": len(records), "errors": errors, "rps": len(records) / seconds,
+               "rows_per_second": len(records) * rows_per_request / seconds if rows_per_request else None}
+    if len(latencies):
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        summary.update(mean_ms=float(latencies.mean()), p50_ms=float(p50), p95_ms=float(p95), p99_ms=float(p99),
+                       max_ms=float(latencies.max()))
+    return summary
+
+
+def run_phase(host, port, pid, requests, mix, concurrency, warmup, duration, seed) -> dict:
+    """
+    Runs one load phase at a fixed concurrency.
+
+    Returns:
+        dict: Overall and per-endpoint summaries, and the server's CPU use and RSS during the phase.
+    """
+    stop, results = threading.Event(), []
+    warmup_end = time.perf_counter() + warmup
+    threads = [threading.Thread(target=client, args=(host, port, requests, mix, seed + i, stop, warmup_end, results))
+               for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+
+    time.sleep(warmup)
+    server_cpu_start, _, _ = process_usage(pid) if pid else (None, None, None)
+    client_cpu_start = resource.getrusage(resource.RUSAGE_SELF)
+    time.sleep(duration)
+    server_cpu_end, rss, peak_rss = process_usage(pid) if pid else (None, None, None)
+    client_cpu_end = resource.getrusage(resource.RUSAGE_SELF)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    seconds = duration
+    records = list(results)
+    rows = {name: spec[3] for name, spec in requests.items()}
+    phase = {
+        "concurrency": concurrency,
+        "seconds": seconds,
+        **summarize(records, seconds, None),
+        "endpoints": {name: summarize([r for r in records if r[0] == name], seconds, rows[name])
+                      for name in mix if mix[name] > 0},
+        "client_cpu_percent": 100.0 * ((client_cpu_end.ru_utime + client_cpu_end.ru_stime)
+                                       - (client_cpu_start.ru_utime + client_cpu_start.ru_stime)) / seconds,
+    }
+    if server_cpu_start is not None and server_cpu_end is not None:
+        phase.update(server_cpu_percent=100.0 * (server_cpu_end - server_cpu_start) / seconds,
+                     server_rss_mb=rss, server_peak_rss_mb=peak_rss)
+    return phase
+
+
+def check_regressions(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Compares every phase and endpoint with the baseline run.
+
+    Throughput may drop and p95 latency may grow by at most `tolerance` (a fraction) before a regression is
+    reported. Phases missing from the baseline are skipped.
+
+    Returns:
+        list: Messages describing each regression.
+    """
+    previous = {phase["concurrency"]: phase for phase in baseline["phases"]}
+    regressions = []
+    for phase in results["phases"]:
+        base = previous.get(phase["concurrency"])
+        if base is None:
+            continue
+        for name, current in phase["endpoints"].items():
+            reference = base["endpoints"].get(name)
+            if not reference or not current.get("requests"):
+                continue
+            label = f"concurrency {phase['concurrency']} {name}"
+            if current["rps"] < reference["rps"] * (1 - tolerance):
+                regressions.append(f"{label}: {current['rps']:.1f} rps vs baseline {reference['rps']:.1f}")
+            if current["p95_ms"] > reference["p95_ms"] * (1 + tolerance):
+                regressions.append(f"{label}: p95 {current['p95_ms']:.2f} ms vs baseline {reference['p95_ms']:.2f}")
+    return regressions
+
+
+def git_commit():
+    """Returns the current git commit, or None outside a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=PROJECT_ROOT, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_mix(items) -> dict:
+    """Parses ['predict=0.9', 'batch=0.1'] into {'predict': 0.9, 'batch': 0.1}."""
+    mix = {}
+    for item in items:
+        name, _, weight = item.partition("=")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test of the prediction service.")
+    parser.add_argument("--server", choices=sorted(SERVERS), default="flask", help="How the app is started.")
+    parser.add_argument("--url", help="Benchmark an already running server instead of starting one.")
+    parser.add_argument("--data", default="artifacts/data_transformation/test.csv")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32], help="Clients per phase.")
+    parser.add_argument("--duration", type=float, default=10.0, help="Measured seconds per phase.")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Unmeasured seconds before each phase.")
+    parser.add_argument("--mix", nargs="+", default=["predict=0.9", "batch=0.1"],
+                        help="Endpoint weights, from predict and batch.")
+    parser.add_argument("--batch-rows", type=int, default=64, help="Rows per /predict/batch request.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="artifacts/benchmarks/bench_load.json", help="JSON results file.")
+    parser.add_argument("--baseline", help="Results file of an earlier run to check for regressions.")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed fractional regression.")
+    parser.add_argument("--save-baseline", help="Also write the results to this baseline file.")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    requests = build_requests(args.data, args.batch_rows, args.seed)
+    unknown = set(mix) - set(requests)
+    if unknown:
+        parser.error(f"unknown endpoints in --mix: {sorted(unknown)}")
+
+    server = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port, pid = parts.hostname, parts.port or 80, None
+    else:
+        host, port = "127.0.0.1", free_port()
+        server = start_server(args.server, port)
+        pid = server.pid
+
+    phases = []
+    try:
+        print(f"{'clients':>7} {'endpoint':>8} {'rps':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>6} "
+              f"{'srv CPU%':>8} {'RSS MB':>7}")
+        for concurrency in args.concurrency:
+            phase = run_phase(host, port, pid, requests, mix, concurrency, args.warmup, args.duration, args.seed)
+            phases.append(phase)
+            for name, summary in [("all", phase)] + list(phase["endpoints"].items()):
+                if not summary["requests"]:
+                    continue
+                cpu, rss = phase.get("server_cpu_percent"), phase.get("server_rss_mb")
+                print(f"{concurrency:>7} {name:>8} {summary['rps']:9.1f} {summary['p50_ms']:8.2f} "
+                      f"{summary['p95_ms']:8.2f} {summary['p99_ms']:8.2f} {summary['errors']:>6} "
+                      f"{cpu if cpu is not None else float('nan'):8.1f} {rss if rss is not None else float('nan'):7.1f}")
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    results = {
+        "commit": git_commit(),
+        "created_at": time.time(),
+        "server": "external" if args.url else args.server,
+        "settings": {"duration": args.duration, "warmup": args.warmup, "mix": mix, "batch_rows": args.batch_rows,
+                     "data": args.data},
+        "phases": phases,
+    }
+    if server is not None:
+        # Totals of the exited server, also available where /proc is not.
+        usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+        results["server_total_cpu_seconds"] = usage.ru_utime + usage.ru_stime
+        results["server_peak_rss_mb"] = usage.ru_maxrss / 1024
+
+    for path in filter(None, [args.output, args.save_baseline]):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(results, f, indent=4)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = check_regressions(results, json.load(f), args.tolerance)
+        for message in regressions:
+            print(f"FAIL: {message}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regression beyond {args.tolerance:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# File: bench_logging.py
+# Purpose: Measures the time a log call costs the calling thread with synchronous handlers and with the
+# queue-based handler configured by setup_logging.
+#
+# Usage (from the project root):
+#     python benchmarks/bench_logging.py --calls 20000
+#     python benchmarks/bench_logging.py --slow-ms 2   # Simulates a slow disk or console.
+
+import os  # Working directory of the benchmark.
+import sys  # Console redirection.
+import time  # High resolution timers.
+import logging  # Logging framework being measured.
+import argparse  # Command line parsing.
+import tempfile  # Scratch directory for the log files.
+import statistics  # Percentiles.
+import yaml  # Writes the logging section read by setup_logging.
+import mlproject
+from mlproject import logger, setup_logging, stop_logging
+
+
+class SlowHandler(logging.Handler):
+    """Handler sleeping on every record, standing in for a slow disk, console or log shipper."""
+
+    def __init__(self, seconds: float):
+        super().__init__()
+        self.seconds = seconds
+
+    def emit(self, record):
+        time.sleep(self.seconds)
+
+
+def configure(queue: bool, log_format: str, slow_seconds: float):
+    """Resets logging and sets it up again with setup_logging, as the entry points do."""
+    stop_logging()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    with open("config.yaml", "w") as f:
+        yaml.safe_dump({"logging": {"queue": queue, "format": log_format}}, f)
+    setup_logging("config.yaml")
+    if slow_seconds:
+        # The slow handler goes where the file and console handlers are: behind the queue or on the caller.
+        slow = SlowHandler(slow_seconds)
+        if mlproject._listener is not None:
+            mlproject._listener.handlers += (slow,)
+        else:
+            root.addHandler(slow)
+
+
+def measure(calls: int) -> dict:
+    """Times every logger.info call and then waits for the queue to drain."""
+    latencies = []
+    start = time.perf_counter()
+    for i in range(calls):
+        call_start = time.perf_counter()
+        logger.info("Scored %d rows in %.3f ms", i, 0.123)
+        latencies.append(time.perf_counter() - call_start)
+    caller = time.perf_counter() - start
+    stop_logging()  # Flushes what is still queued.
+    latencies.sort()
+    return {
+        "mean_us": statistics.fmean(latencies) * 1e6,
+        "p50_us": latencies[len(latencies) // 2] * 1e6,
+        "p99_us": latencies[int(len(latencies) * 0.99)] * 1e6,
+        "max_us": latencies[-1] * 1e6,
+        "caller_s": caller,
+        "total_s": time.perf_counter() - start,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Caller-side latency of synchronous and queued logging.")
+    parser.add_argument("--calls", type=int, default=20_000, help="Log calls per setting.")
+    parser.add_argument("--format", default="text", choices=["text", "json"], help="logging.format.")
+    parser.add_argument("--slow-ms", type=float, default=0.0, help="Extra milliseconds every record takes to write.")
+    parser.add_argument("--records-per-request", type=float, default=1.0,
+                        help="Log records emitted per request (the werkzeug access line is one).")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory, open(os.devnull, "w") as devnull:
+        cwd, stdout = os.getcwd(), sys.stdout
+        os.chdir(directory)
+        sys.stdout = devnull  # The console handler writes to /dev/null rather than the terminal.
+        try:
+            for queue in (False, True):
+                configure(queue, args.format, args.slow_ms / 1000.0)
+                results["queue" if queue else "sync"] = measure(args.calls)
+        finally:
+            sys.stdout = stdout
+            os.chdir(cwd)
+
+    print(f"{'':>6} {'mean us':>9} {'p50 us':>9} {'p99 us':>9} {'max us':>10} {'caller s':>9} {'total s':>9}")
+    for name, stats in results.items():
+        print(f"{name:>6} {stats['mean_us']:9.2f} {stats['p50_us']:9.2f} {stats['p99_us']:9.2f} "
+              f"{stats['max_us']:10.1f} {stats['caller_s']:9.3f} {stats['total_s']:9.3f}")
+    saved = (results["sync"]["mean_us"] - results["queue"]["mean_us"]) * args.records_per_request
+    print(f"Latency saved per request ({args.records_per_request:g} records): {saved:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
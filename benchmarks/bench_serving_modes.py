@@ -0,0 +1,63 @@
+# File: bench_serving_modes.py
+# Purpose: Side-by-side load test of the WSGI app (application.py on Flask's threaded server) and the ASGI app
+# (asgi.py on uvicorn), reusing the phases of bench_load.py at increasing numbers of concurrent connections.
+#
+# Usage (from the project root, after training, with uvicorn installed):
+#     python benchmarks/bench_serving_modes.py --concurrency 8 64 512 --duration 10
+
+import os  # Output directory.
+import json  # Machine-readable results.
+import time  # Result timestamps.
+import argparse  # Command line parsing.
+import bench_load  # Server commands, request bodies and load phases.
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Side-by-side load test of the WSGI and ASGI entry points.")
+    parser.add_argument("--servers", nargs="+", default=["flask", "asgi"], choices=sorted(bench_load.SERVERS))
+    parser.add_argument("--data", default="artifacts/data_transformation/test.csv")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8, 64, 512], help="Clients per phase.")
+    parser.add_argument("--duration", type=float, default=10.0, help="Measured seconds per phase.")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Unmeasured seconds before each phase.")
+    parser.add_argument("--mix", nargs="+", default=["predict=0.9", "batch=0.1"],
+                        help="Endpoint weights, from predict and batch.")
+    parser.add_argument("--batch-rows", type=int, default=64, help="Rows per /predict/batch request.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="artifacts/benchmarks/bench_serving_modes.json", help="JSON results file.")
+    args = parser.parse_args()
+
+    mix = bench_load.parse_mix(args.mix)
+    requests = bench_load.build_requests(args.data, args.batch_rows, args.seed)
+
+    results = {}
+    for name in args.servers:
+        port = bench_load.free_port()
+        server = bench_load.start_server(name, port)
+        try:
+            results[name] = [
+                bench_load.run_phase("127.0.0.1", port, server.pid, requests, mix, concurrency, args.warmup,
+                                     args.duration, args.seed)
+                for concurrency in args.concurrency
+            ]
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f"{'clients':>7} {'server':>6} {'rps':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>6} "
+          f"{'srv CPU%':>8} {'RSS MB':>7}")
+    for index, concurrency in enumerate(args.concurrency):
+        for name in args.servers:
+            phase = results[name][index]
+            cpu, rss = phase.get("server_cpu_percent"), phase.get("server_rss_mb")
+            print(f"{concurrency:>7} {name:>6} {phase['rps']:9.1f} {phase['p50_ms']:8.2f} {phase['p95_ms']:8.2f} "
+                  f"{phase['p99_ms']:8.2f} {phase['errors']:>6} "
+                  f"{cpu if cpu is not None else float('nan'):8.1f} {rss if rss is not None else float('nan'):7.1f}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump({"commit": bench_load.git_commit(), "created_at": time.time(), "mix": mix,
+                   "duration": args.duration, "servers": results}, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
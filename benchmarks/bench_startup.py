@@ -0,0 +1,88 @@
+# File: bench_startup.py
+# Purpose: Measures the import time of the Flask app with `python -X importtime` and checks it against a budget.
+#
+# Usage (from the project root):
+#     python benchmarks/bench_startup.py --budget-ms 300
+# Exits with status 1 when the median import time exceeds the budget or a heavy module is imported at startup.
+
+import argparse  # Command line parsing.
+import json  # Machine-readable results.
+import statistics  # Median of repeated runs.
+import subprocess  # Runs each measurement in a fresh interpreter.
+import sys  # Path of the running interpreter.
+
+# Modules that the serving path must only import on first use.
+HEAVY_MODULES = ("numpy", "pandas", "sklearn", "joblib", "scipy")
+
+
+def measure(module):
+    """
+    Imports a module in a fresh interpreter with -X importtime.
+
+    Args:
+        module (str): Module to import.
+
+    Returns:
+        tuple: Total import time in milliseconds and a dict of cumulative milliseconds per top-level package.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True
+    )
+
+    total_us, packages = 0, {}
+    for line in result.stderr.splitlines():
+        # Lines look like: "import time:       123 |       4567 |   package.module"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # Header line.
+        depth = len(name) - len(name.lstrip())
+        name = name.strip()
+        if depth == 1:
+            # Top-level imports; nested ones are already included in their parent's cumulative time.
+            total_us += int(cumulative)
+        root = name.split(".")[0]
+        packages[root] = max(packages.get(root, 0), int(cumulative) / 1000)
+    return total_us / 1000, packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup-time budget check for the Flask app.")
+    parser.add_argument("--module", default="application", help="Module whose import time is measured.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of fresh interpreters to measure.")
+    parser.add_argument("--budget-ms", type=float, default=300.0, help="Largest allowed median import time.")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest packages to print.")
+    parser.add_argument("--output", help="Optional JSON file to write the results to.")
+    args = parser.parse_args()
+
+    totals, packages = [], {}
+    for _ in range(args.repeat):
+        total, packages = measure(args.module)
+        totals.append(total)
+    median = statistics.median(totals)
+
+    print(f"import {args.module}: median {median:.1f} ms over {args.repeat} runs (budget {args.budget_ms:.0f} ms)")
+    for name, ms in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:<30} {ms:8.1f} ms")
+
+    heavy = [name for name in HEAVY_MODULES if name in packages]
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"module": args.module, "median_ms": median, "runs_ms": totals,
+                       "budget_ms": args.budget_ms, "heavy_modules": heavy}, f, indent=4)
+
+    failed = False
+    if heavy:
+        print(f"FAIL: heavy modules imported at startup: {heavy}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"FAIL: median import time {median:.1f} ms exceeds the {args.budget_ms:.0f} ms budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# File: bench_streaming_training.py
+# Purpose: Compares the streaming (sufficient-statistics) ElasticNet fit with the in-memory sklearn fit:
+# wall time, peak RSS and accuracy on the test split.
+#
+# Usage (from the project root, after the transformation stage):
+#     python benchmarks/bench_streaming_training.py --scales 1 100 1000 --format npy
+# Each fit runs in a fresh interpreter so that its peak RSS is measured in isolation.
+
+import argparse  # Command line parsing.
+import json  # Results passed back from the child processes.
+import os  # Paths.
+import resource  # Peak RSS of the child process.
+import subprocess  # Fresh interpreter per fit.
+import sys  # Path of the running interpreter.
+import tempfile  # Scratch directory for the generated training sets.
+import time  # Wall-clock timers.
+
+TARGET = "quality"
+
+
+def fit_in_child(path, fmt, mode, alpha, l1_ratio, chunk_size):
+    """Fits one model, then prints wall time, peak RSS and the fitted parameters as JSON."""
+    import numpy as np
+    from mlproject.utils.artifacts import load_dataset, iter_dataset_chunks
+    from mlproject.components.sufficient_statistics import RunningMoments
+    from sklearn.linear_model import ElasticNet  # Imported before timing so both modes pay the same.
+
+    start = time.perf_counter()
+    if mode == "in_memory":
+        data = load_dataset(path, fmt)
+        model = ElasticNet(alpha=alpha, l1_ratio=l1_ratio).fit(data.drop(columns=[TARGET]), data[TARGET])
+        coef, intercept = model.coef_, float(model.intercept_)
+    else:
+        moments = None
+        for chunk in iter_dataset_chunks(path, fmt, chunk_size):
+            columns = [col for col in chunk.columns if col != TARGET] + [TARGET]
+            moments = moments or RunningMoments(len(columns))
+            moments.update(chunk[columns].to_numpy(dtype=np.float64))
+        coef, intercept, _ = moments.fit_elastic_net(alpha, l1_ratio)
+
+    print(json.dumps({
+        "seconds": time.perf_counter() - start,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "coef": [float(c) for c in coef],
+        "intercept": intercept,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming versus in-memory ElasticNet training.")
+    parser.add_argument("--train", default="artifacts/data_transformation/train.csv")
+    parser.add_argument("--test", default="artifacts/data_transformation/test.csv")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--format", default="npy", choices=["csv", "parquet", "feather", "npy"])
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    parser.add_argument("--alpha", type=float, default=0.2)
+    parser.add_argument("--l1-ratio", type=float, default=0.1)
+    parser.add_argument("--child", nargs=3, metavar=("PATH", "FORMAT", "MODE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        fit_in_child(*args.child, args.alpha, args.l1_ratio, args.chunk_size)
+        return
+
+    import numpy as np
+    import pandas as pd
+    from mlproject.utils.artifacts import save_dataset
+
+    train, test = pd.read_csv(args.train), pd.read_csv(args.test)
+    test_x = test.drop(columns=[TARGET]).to_numpy(dtype=np.float64)
+    test_y = test[TARGET].to_numpy(dtype=np.float64)
+
+    print(f"{'scale':>6} {'rows':>9} {'mode':>10} {'seconds':>8} {'peak MB':>8} {'test RMSE':>10} {'max |dcoef|':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scales:
+            path = save_dataset(pd.concat([train] * scale, ignore_index=True), os.path.join(tmp, f"train_{scale}"), args.format)
+            results = {}
+            for mode in ("in_memory", "streaming"):
+                child = subprocess.run([sys.executable, __file__, "--child", str(path), args.format, mode,
+                                        "--alpha", str(args.alpha), "--l1-ratio", str(args.l1_ratio),
+                                        "--chunk-size", str(args.chunk_size)],
+                                       capture_output=True, text=True, check=True)
+                results[mode] = json.loads(child.stdout.strip().splitlines()[-1])
+
+            for mode, result in results.items():
+                rmse = np.sqrt(np.mean((test_x @ np.array(result["coef"]) + result["intercept"] - test_y) ** 2))
+                diff = np.max(np.abs(np.array(result["coef"]) - np.array(results["in_memory"]["coef"])))
+                print(f"{scale:>6} {len(train) * scale:>9} {mode:>10} {result['seconds']:8.2f} "
+                      f"{result['peak_rss_mb']:8.1f} {rmse:10.5f} {diff:12.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,62 +1,19 @@
-from mlproject import logger
-from mlproject.pipeline.stage_01_data_ingestion import DataIngestionTrainingPipeline
-from mlproject.pipeline.stage_02_data_validation import DataValidationTrainingPipeline
-from mlproject.pipeline.stage_03_data_transformation import DataTransformationTrainingPipeline
-from mlproject.pipeline.stage_04_model_trainer import ModelTrainerTrainingPipeline
-from mlproject.pipeline.stage_05_model_evaluation import ModelEvaluationTrainingPipeline
+import sys
+from mlproject import logger, setup_logging
+from mlproject.pipeline.dag import PipelineRunner
 
+# Runs the training stages (ingestion -> validation -> transformation -> trainer -> cross-validation -> evaluation -> registration) as a DAG.
+# Stages whose inputs, parameters and outputs are unchanged since the last run are skipped;
+# pass --force to rerun every stage.
 
 
-STAGE_NAME = "Data Ingestion stage"
-try:
-    logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
-    obj = DataIngestionTrainingPipeline()
-    obj.main()
-    logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
-except Exception as e:
-        logger.exception(e)
-        raise e
-
-
-STAGE_NAME = "Data Validation stage"
-try:
-    logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
-    obj = DataValidationTrainingPipeline()
-    obj.main()
-    logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
-except Exception as e:
-    logger.exception(e)
-    raise e
-
-
-STAGE_NAME = "Data Transformation stage"
-try:
-    logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
-    obj = DataTransformationTrainingPipeline()
-    obj.main()
-    logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
-except Exception as e:
-    logger.exception(e)
-    raise e
-
+setup_logging()
 
-STAGE_NAME = "Model Trainer stage"
 try:
-    logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
-    obj = ModelTrainerTrainingPipeline()
-    obj.main()
-    logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+    runner = PipelineRunner(force="--force" in sys.argv[1:])
+    report = runner.run()
+    for entry in report:
+        logger.info(f"{entry['stage']}: {entry['status']} in {entry['seconds']:.2f}s")
 except Exception as e:
     logger.exception(e)
     raise e
-
-
-STAGE_NAME = "Model Evaluation stage"
-try:
-    logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
-    obj = ModelEvaluationTrainingPipeline()
-    obj.main()
-    logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
-except Exception as e:
-    logger.exception(e)
-    raise e
\ No newline at end of file
@@ -1,27 +1,181 @@
 # File: __init__.py
-# Purpose: Initialization file for the mlProject package, configuring logging settings.
+# Purpose: Initialization file for the mlProject package, providing the package logger and its setup.
 
 import os  # Operating system interface.
 import sys  # System-specific parameters and functions.
+import copy  # Records prepared for the queue.
+import json  # Structured log records.
+import queue  # Queue between the loggers and the background writer.
+import atexit  # Flushes the log queue at exit.
 import logging  # Logging framework for tracking events in the package.
+import logging.handlers  # Queue and rotating handlers.
+from datetime import datetime, timezone  # Timestamps of structured log records.
 
 logging_str = "[%(asctime)s: %(levelname)s: %(module)s: %(message)s]"
 # Logging format string to define the structure of log messages.
 
 log_dir = "logs"  # Directory to store log files.
 log_filepath = os.path.join(log_dir, "running_logs.log")  # Full path for the log file.
-os.makedirs(log_dir, exist_ok=True)  # Creates the log directory if it doesn't exist.
-
-logging.basicConfig(
-    level=logging.INFO,  # Sets the logging level to INFO.
-    format=logging_str,  # Specifies the format of log messages.
-
-    handlers=[
-        logging.FileHandler(log_filepath),  # Writes log messages to a file.
-        logging.StreamHandler(sys.stdout)  # Outputs log messages to the console.
-    ]
-)
-# Configures the logging system with the specified settings.
 
 logger = logging.getLogger("mlprojectlogger")
 # Creates a logger object named "mlprojectlogger" for use in the mlProject package.
+
+# Settings used when config.yaml has no logging section.
+DEFAULT_LOGGING = {
+    "level": "INFO",
+    "format": "text",
+    "queue": True,
+    "rotation": {"when": "size", "max_bytes": 10 * 2 ** 20, "backup_count": 5, "interval": "midnight"},
+    "levels": {},
+    "module_levels": {},
+}
+
+_listener = None  # Background writer of the queued log records, once logging is set up.
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats every record as one JSON object per line."""
+
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "line": record.lineno,
+            "process": record.process,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Queue handler keeping the traceback apart from the message, so the JSON format can report it separately."""
+    _exception_formatter = logging.Formatter()
+
+    def prepare(self, record):
+        # Rendering the message and the traceback on the caller; the record then crosses the queue without them.
+        record = copy.copy(record)
+        record.msg, record.args = record.getMessage(), None
+        if record.exc_info:
+            record.exc_text = record.exc_text or self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class ModuleLevelFilter(logging.Filter):
+    def __init__(self, module_levels: dict, default: int):
+        """
+        Drops package records below the level configured for the module that logged them.
+
+        Args:
+            module_levels (dict): Module name (e.g. 'model_trainer') -> lowest level kept.
+            default (int): Lowest level kept for the other modules.
+        """
+        super().__init__()
+        self.module_levels = {module: logging.getLevelName(str(level).upper()) for module, level in module_levels.items()}
+        self.default = default
+
+    def filter(self, record):
+        return record.levelno >= self.module_levels.get(record.module, self.default)
+
+
+def _load_logging_config(config_filepath) -> dict:
+    """Reads the logging section of config.yaml, falling back to the defaults."""
+    settings = {key: (dict(value) if isinstance(value, dict) else value) for key, value in DEFAULT_LOGGING.items()}
+    if config_filepath is None or not os.path.exists(config_filepath):
+        return settings
+    import yaml  # Imported on use, like the rest of the configuration.
+    with open(config_filepath) as f:
+        section = (yaml.safe_load(f) or {}).get("logging") or {}
+    for key, value in section.items():
+        if key == "rotation":
+            settings["rotation"].update(value or {})
+        else:
+            settings[key] = value
+    return settings
+
+
+def _file_handler(rotation: dict) -> logging.Handler:
+    """Creates the handler of the log file: rotated by size, by time, or never."""
+    when = str(rotation.get("when", "size")).lower()
+    if when == "size":
+        return logging.handlers.RotatingFileHandler(
+            log_filepath, maxBytes=int(rotation.get("max_bytes", 0)), backupCount=int(rotation.get("backup_count", 0))
+        )
+    if when in ("none", "never"):
+        return logging.FileHandler(log_filepath)
+    # Any other value is a TimedRotatingFileHandler interval, e.g. 'midnight' or 'h'.
+    return logging.handlers.TimedRotatingFileHandler(
+        log_filepath, when=rotation.get("interval", "midnight") if when == "time" else when,
+        backupCount=int(rotation.get("backup_count", 0))
+    )
+
+
+def setup_logging(config_filepath=None):
+    """
+    Configures the logging system to write to the log file and to the console.
+
+    Entry points (main.py, application.py, the stage scripts) call this explicitly so that importing the
+    package has no side effects. Calling it more than once is harmless.
+
+    With logging.queue set in config.yaml (the default), loggers only put records on an in-memory queue and a
+    background thread formats and writes them, so requests and training stages never wait on the file or the
+    console. The queue is flushed when the process exits.
+
+    Args:
+        config_filepath (Path, optional): Configuration file with the logging section. Defaults to config/config.yaml.
+    """
+    global _listener
+    root = logging.getLogger()
+    if root.handlers:
+        return  # Already configured in this process.
+
+    if config_filepath is None:
+        from mlproject.constants import CONFIG_FILE_PATH
+        config_filepath = CONFIG_FILE_PATH
+    settings = _load_logging_config(config_filepath)
+
+    os.makedirs(log_dir, exist_ok=True)  # Creates the log directory if it doesn't exist.
+
+    # Writes log messages to the (rotated) file and to the console.
+    formatter = JsonFormatter() if settings["format"] == "json" else logging.Formatter(logging_str)
+    handlers = [_file_handler(settings["rotation"]), logging.StreamHandler(sys.stdout)]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Levels: the root level, per logger name (e.g. werkzeug) and per package module.
+    level = logging.getLevelName(str(settings["level"]).upper())
+    root.setLevel(level)
+    for name, logger_level in (settings["levels"] or {}).items():
+        logging.getLogger(name).setLevel(str(logger_level).upper())
+    module_levels = settings["module_levels"] or {}
+    if module_levels:
+        module_filter = ModuleLevelFilter(module_levels, default=level)
+        logger.setLevel(min([level] + list(module_filter.module_levels.values())))
+        logger.addFilter(module_filter)
+
+    if not settings["queue"]:
+        for handler in handlers:
+            root.addHandler(handler)
+        return
+
+    # Loggers only enqueue; the listener thread does the formatting and the I/O.
+    log_queue = queue.SimpleQueue()
+    root.addHandler(_QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging():
+    """Writes the records still queued and stops the background writer."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,149 @@
+import os
+import time
+import joblib
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from sklearn.base import clone
+from mlproject import logger
+from mlproject.entity.config_entity import CrossValidationConfig
+from mlproject.utils.common import save_json
+from mlproject.utils.artifacts import load_dataset
+from pathlib import Path
+
+# Purpose: Definition of the CrossValidation class for parallel k-fold cross-validation of the trained model.
+
+# Fold data attached by each worker process once, set by _init_worker.
+_worker_data = {}
+
+
+def _init_worker(shm_name, shape, estimator, n_splits, random_state):
+    """
+    Attaches the worker process to the shared [X | y] matrix so tasks only carry their fold indices.
+
+    The matrix is wrapped without copying, so every worker reads the single copy written by the parent.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_data["shm"] = shm  # Kept referenced so the mapping outlives the initializer.
+    _worker_data["Z"] = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    _worker_data["estimator"] = estimator
+    _worker_data["n_splits"] = n_splits
+    _worker_data["random_state"] = random_state
+
+
+def fold_assignment(n_rows: int, n_splits: int, seed: int):
+    """
+    Assigns every row to one of n_splits folds of (almost) equal size, in a random order fixed by the seed.
+
+    Args:
+        n_rows (int): Number of rows.
+        n_splits (int): Number of folds.
+        seed (int): Seed of the shuffle.
+
+    Returns:
+        np.ndarray: Fold index of every row.
+    """
+    return np.random.default_rng(seed).permutation(np.arange(n_rows) % n_splits)
+
+
+def _score_fold(repeat, fold):
+    """
+    Fits a fresh copy of the estimator on every fold but one and scores it on the held-out fold.
+
+    Args:
+        repeat (int): Index of the repetition; the fold assignment is seeded with random_state + repeat.
+        fold (int): Index of the held-out fold.
+
+    Returns:
+        dict: Fold metrics and the time it took to fit and score the fold.
+    """
+    start = time.perf_counter()
+    Z = _worker_data["Z"]
+    folds = fold_assignment(len(Z), _worker_data["n_splits"], _worker_data["random_state"] + repeat)
+    val = folds == fold
+
+    model = clone(_worker_data["estimator"])
+    model.fit(Z[~val, :-1], Z[~val, -1])
+
+    actual = Z[val, -1]
+    errors = model.predict(Z[val, :-1]) - actual
+    return {
+        "repeat": repeat,
+        "fold": fold,
+        "n_train": int((~val).sum()),
+        "n_test": int(val.sum()),
+        "rmse": float(np.sqrt(np.mean(errors ** 2))),
+        "mae": float(np.mean(np.abs(errors))),
+        "r2": float(1.0 - np.sum(errors ** 2) / np.sum((actual - actual.mean()) ** 2)),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+class CrossValidation:
+    def __init__(self, config: CrossValidationConfig):
+        """
+        Initializes the CrossValidation object with the provided configuration.
+
+        Args:
+            config (CrossValidationConfig): CrossValidationConfig object containing cross-validation settings.
+        """
+        self.config = config
+
+    def load_matrix(self):
+        """
+        Loads the training data as one contiguous float64 matrix, features in schema order and the target last.
+
+        Returns:
+            np.ndarray: Matrix of shape (n_rows, n_features + 1).
+        """
+        data = load_dataset(self.config.train_data_path, self.config.artifact_format)
+        columns = list(self.config.feature_columns) + [self.config.target_column]
+        return np.ascontiguousarray(data[columns].to_numpy(dtype=np.float64))
+
+    def run(self) -> dict:
+        """
+        Cross-validates the trained model's hyperparameters with repeated k-fold CV and saves the metrics.
+
+        The training matrix is copied once into a shared memory block that every worker attaches to, so the
+        data is never pickled per task; each task only carries its (repeat, fold) pair and recomputes the
+        fold assignment from the seed. Repeat r shuffles the rows with seed random_state + r, so the metrics
+        are the same from run to run.
+
+        Returns:
+            dict: Report with the per-fold metrics, their mean and std, and the wall time.
+        """
+        start = time.perf_counter()
+        estimator = clone(joblib.load(self.config.model_path))
+        Z = self.load_matrix()
+
+        tasks = [(repeat, fold) for repeat in range(self.config.n_repeats) for fold in range(self.config.n_splits)]
+        n_workers = os.cpu_count() if self.config.n_workers in (None, -1) else self.config.n_workers
+        workers = max(1, min(n_workers, len(tasks)))
+
+        shm = shared_memory.SharedMemory(create=True, size=max(Z.nbytes, 1))
+        try:
+            np.ndarray(Z.shape, dtype=np.float64, buffer=shm.buf)[:] = Z
+            initargs = (shm.name, Z.shape, estimator, self.config.n_splits, self.config.random_state)
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as executor:
+                folds = list(executor.map(_score_fold, *zip(*tasks)))
+        finally:
+            shm.close()
+            shm.unlink()
+
+        seconds = time.perf_counter() - start
+        report = {
+            "n_splits": self.config.n_splits,
+            "n_repeats": self.config.n_repeats,
+            "n_rows": len(Z),
+            "n_workers": workers,
+            "seconds": seconds,
+        }
+        for metric in ("rmse", "mae", "r2"):
+            values = np.array([result[metric] for result in folds])
+            report[metric] = {"mean": float(values.mean()), "std": float(values.std())}
+        report["folds"] = folds
+
+        save_json(path=Path(self.config.metric_file_name), data=report)
+        logger.info(f"Cross-validated {len(tasks)} folds on {workers} workers in {seconds:.2f}s: "
+                    f"rmse {report['rmse']['mean']:.4f} +/- {report['rmse']['std']:.4f}")
+        return report
@@ -1,41 +1,380 @@
 import os  # Operating system interface.
-import urllib.request as request  # URL handling module.
+import hashlib  # Detects data files rewritten in place.
+import json  # Ingestion manifest.
+import time  # Transfer timings.
+import shutil  # Copies local sources.
 import zipfile  # ZIP file processing module.
+import urllib.error  # Network errors.
+import urllib.request as request  # URL handling module.
+from urllib.parse import urlparse  # Recognizes file:// sources.
+from urllib.request import url2pathname  # Converts file:// URLs to local paths.
 from mlproject import logger  # Logger specific to the mlProject package.
-from mlproject.utils.common import get_size  # Common utility function for file size.
+from mlproject.utils.common import get_size, file_sha256  # Common utility functions for file size and checksums.
+from mlproject.utils.partitions import append_partition  # Append-only data partitions.
 from mlproject.entity.config_entity import DataIngestionConfig
 from pathlib import Path
 
 # Purpose: Definition of the DataIngestion class for handling data download and extraction.
 
+# Number of bytes read or written per block while downloading or partitioning.
+BLOCK_SIZE = 1 << 20
+
+# Number of bytes before the last partitioned offset checked to detect a data file rewritten in place.
+TAIL_SIZE = 1 << 16
+
+
+def _read_blocks(f, start: int, end: int, terminate: bool):
+    """Yields bytes start to end of an open file in BLOCK_SIZE blocks, then a newline if `terminate` is set."""
+    f.seek(start)
+    while start < end:
+        block = f.read(min(BLOCK_SIZE, end - start))
+        if not block:
+            break
+        start += len(block)
+        yield block
+    if terminate:
+        yield b"\n"
+
+
 class DataIngestion:
     def __init__(self, config: DataIngestionConfig):
         """
         Initializes the DataIngestion object with the provided configuration.
 
+        The source's ETag, size and SHA-256 and the CRC of every extracted member are recorded in
+        config.manifest_file, so later runs only transfer and extract what changed.
+
         Args:
             config (DataIngestionConfig): DataIngestionConfig object containing data ingestion settings.
         """
         self.config = config
+        self.manifest = self._load_manifest()
+        self.manifest["last_run"] = {}
+
+    def _load_manifest(self) -> dict:
+        """Reads the manifest written by the last run; empty when there is none."""
+        if os.path.exists(self.config.manifest_file):
+            with open(self.config.manifest_file) as f:
+                return json.load(f)
+        return {"source": {}, "members": {}, "throughput": {}}
+
+    def _save_manifest(self):
+        """Writes the manifest atomically, so an interrupted run never leaves it half written."""
+        tmp_path = Path(str(self.config.manifest_file) + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.manifest, f, indent=4)
+        os.replace(tmp_path, self.config.manifest_file)
+
+    def _local_source(self):
+        """Returns the source as a local Path for file:// URLs and plain paths, or None for remote URLs."""
+        url = urlparse(str(self.config.source_URL))
+        if url.scheme == "file":
+            return Path(url2pathname(url.path))
+        if not url.scheme or len(url.scheme) == 1:  # A single letter is a Windows drive, not a scheme.
+            return Path(self.config.source_URL)
+        return None
+
+    def _seconds_saved(self, kind: str, skipped_bytes: int):
+        """Estimates the time a skipped transfer or extraction would have taken from the last measured throughput."""
+        rate = self.manifest["throughput"].get(kind)
+        return skipped_bytes / rate if rate else None
+
+    def _record(self, kind: str, transferred: int, skipped: int, seconds: float):
+        """Records one step's bytes, time and estimated time saved in the manifest and logs them."""
+        if transferred and seconds > 0:
+            self.manifest["throughput"][kind] = transferred / seconds
+        saved = self._seconds_saved(kind, skipped)
+        self.manifest["last_run"][kind] = {
+            "bytes_transferred": transferred,
+            "bytes_skipped": skipped,
+            "seconds": seconds,
+            "estimated_seconds_saved": saved,
+        }
+        saved_text = f", ~{saved:.2f}s saved" if saved is not None else ""
+        logger.info(f"{kind}: {transferred} bytes transferred, {skipped} bytes skipped in {seconds:.2f}s{saved_text}")
+
+    def _is_intact(self, path) -> bool:
+        """Checks that a local copy exists and still matches the size and SHA-256 recorded in the manifest."""
+        source = self.manifest["source"]
+        return (os.path.exists(path) and source.get("size") == os.path.getsize(path)
+                and source.get("sha256") == file_sha256(path))
+
+    def _verify(self, path, remove: bool = True):
+        """
+        Checks a downloaded file against the expected SHA-256 (when configured) and that it is a readable ZIP archive.
+
+        A file that fails the check is deleted, so the next run downloads it again instead of resuming it.
+
+        Args:
+            path: File to check.
+            remove (bool, optional): Delete the file when it fails the check. Defaults to True; False keeps a
+                local copy that cannot be downloaded again.
+
+        Raises:
+            IOError: If the checksum does not match or the archive is truncated or corrupt.
+
+        Returns:
+            str: SHA-256 hex digest of the file.
+        """
+        sha256 = file_sha256(path)
+        error = None
+        if self.config.source_sha256 and sha256 != self.config.source_sha256:
+            error = f"Checksum mismatch for {path}: expected {self.config.source_sha256}, got {sha256}"
+        elif not zipfile.is_zipfile(path):
+            error = f"{path} is not a valid ZIP archive (truncated download?)"
+        if error:
+            if remove:
+                os.remove(path)
+            raise IOError(error)
+        return sha256
+
+    def _probe(self) -> dict:
+        """Reads the remote source's ETag, size and Last-Modified with a HEAD request."""
+        with request.urlopen(request.Request(self.config.source_URL, method="HEAD")) as response:
+            size = response.headers.get("Content-Length")
+            return {
+                "etag": response.headers.get("ETag"),
+                "size": int(size) if size is not None else None,
+                "last_modified": response.headers.get("Last-Modified"),
+            }
 
     def download_file(self):
         """
-        Downloads the data file from the specified source URL and logs the download information.
+        Downloads the data file from the source and records its ETag, size and SHA-256 in the manifest.
+
+        The download is skipped when the local copy still matches the manifest and the source reports the same
+        ETag and size. An interrupted download is kept as '<file>.part' and resumed with an HTTP Range request
+        on the next run, provided the source's ETag has not changed. file:// URLs and local paths are copied
+        only when their checksum changed; a directory source needs no download at all.
         """
-        if not os.path.exists(self.config.local_data_file):
-            filename, headers = request.urlretrieve(
-                url=self.config.source_URL,
-                filename=self.config.local_data_file
-            )
-            logger.info(f"{filename} downloaded! with the following info:\n{headers}")
-        else:
-            logger.info(f"File already exists of size: {get_size(Path(self.config.local_data_file))}")
+        start = time.perf_counter()
+        local_data_file = self.config.local_data_file
+        source_path = self._local_source()
+
+        if source_path is not None and source_path.is_dir():
+            logger.info(f"Source {source_path} is a directory, nothing to download")
+            self.manifest["source"] = {"url": str(self.config.source_URL), "type": "directory"}
+            self._save_manifest()
+            return
+
+        if source_path is not None:
+            sha256 = file_sha256(source_path)
+            if sha256 == self.manifest["source"].get("sha256") and self._is_intact(local_data_file):
+                logger.info(f"File already exists of size: {get_size(Path(local_data_file))}, unchanged")
+                self._record("download", 0, os.path.getsize(local_data_file), time.perf_counter() - start)
+            else:
+                part_path = Path(str(local_data_file) + ".part")
+                shutil.copyfile(source_path, part_path)
+                self._verify(part_path)
+                os.replace(part_path, local_data_file)
+                logger.info(f"{local_data_file} copied from {source_path}")
+                self._record("download", os.path.getsize(local_data_file), 0, time.perf_counter() - start)
+            self.manifest["source"] = {"url": str(self.config.source_URL), "type": "file",
+                                       "size": os.path.getsize(local_data_file), "sha256": sha256}
+            self._save_manifest()
+            return
+
+        try:
+            remote = self._probe()
+        except urllib.error.URLError as e:
+            # Offline: keep using the local copy as long as it is intact. A copy that predates the manifest is
+            # adopted when it is a valid archive (and matches source_sha256 when set); one that is not is kept,
+            # as it is the only copy until the source is reachable again.
+            if not self.manifest["source"].get("sha256") and os.path.exists(local_data_file):
+                self.manifest["source"] = {"url": self.config.source_URL, "type": "http",
+                                           "size": os.path.getsize(local_data_file),
+                                           "sha256": self._verify(local_data_file, remove=False)}
+            if self._is_intact(local_data_file):
+                logger.info(f"Source unreachable ({e}), using the verified local copy {local_data_file}")
+                self._record("download", 0, os.path.getsize(local_data_file), time.perf_counter() - start)
+                self._save_manifest()
+                return
+            raise
+
+        cached = self.manifest["source"]
+        unchanged = (cached.get("url") == self.config.source_URL
+                     and cached.get("etag") == remote["etag"]
+                     and (remote["size"] is None or cached.get("size") == remote["size"]))
+        if unchanged and self._is_intact(local_data_file):
+            logger.info(f"File already exists of size: {get_size(Path(local_data_file))}, source unchanged")
+            self._record("download", 0, os.path.getsize(local_data_file), time.perf_counter() - start)
+            self._save_manifest()
+            return
+
+        transferred = self._fetch(remote)
+        sha256 = self._verify(Path(str(local_data_file) + ".part"))
+        os.replace(Path(str(local_data_file) + ".part"), local_data_file)
+        logger.info(f"{local_data_file} downloaded! ETag {remote['etag']}, {get_size(Path(local_data_file))}")
+
+        resumed = os.path.getsize(local_data_file) - transferred
+        self.manifest["source"] = {"url": self.config.source_URL, "type": "http", "etag": remote["etag"],
+                                   "last_modified": remote["last_modified"],
+                                   "size": os.path.getsize(local_data_file), "sha256": sha256}
+        self.manifest.pop("partial", None)
+        self._record("download", transferred, resumed, time.perf_counter() - start)
+        self._save_manifest()
+
+    def _fetch(self, remote: dict) -> int:
+        """
+        Streams the remote source into '<file>.part', resuming from the bytes already there when possible.
+
+        Args:
+            remote (dict): ETag and size reported by the source.
+
+        Raises:
+            IOError: If the connection ends before the advertised size was received; the partial file is kept.
+
+        Returns:
+            int: Number of bytes transferred by this call.
+        """
+        part_path = Path(str(self.config.local_data_file) + ".part")
+        partial = self.manifest.get("partial", {})
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        if offset and (remote["etag"] is None or partial.get("etag") != remote["etag"]):
+            offset = 0  # The partial file belongs to another version of the source.
+
+        self.manifest["partial"] = {"etag": remote["etag"]}
+        self._save_manifest()
+
+        req = request.Request(self.config.source_URL)
+        if offset:
+            req.add_header("Range", f"bytes={offset}-")
+            req.add_header("If-Range", remote["etag"])
+
+        transferred = 0
+        with request.urlopen(req) as response:
+            if response.status != 206:
+                offset = 0  # The server ignored the range and sends the whole file.
+            elif offset:
+                logger.info(f"Resuming download of {self.config.source_URL} at byte {offset}")
+            with open(part_path, "ab" if offset else "wb") as f:
+                for block in iter(lambda: response.read(BLOCK_SIZE), b""):
+                    f.write(block)
+                    transferred += len(block)
+
+        if remote["size"] is not None and offset + transferred != remote["size"]:
+            raise IOError(f"Download of {self.config.source_URL} stopped at {offset + transferred} of "
+                          f"{remote['size']} bytes; rerun to resume")
+        return transferred
 
     def extract_zip_file(self):
         """
-        Extracts the contents of the ZIP file into the specified directory.
+        Extracts the archive members whose CRC or size changed since the last run into the specified directory.
+
+        Members already extracted with the CRC recorded in the manifest, and still present with the same size,
+        are left in place. A directory source is mirrored the same way, comparing SHA-256 instead of CRC.
         """
+        start = time.perf_counter()
         unzip_path = self.config.unzip_dir
         os.makedirs(unzip_path, exist_ok=True)
-        with zipfile.ZipFile(self.config.local_data_file, 'r') as zip_ref:
-            zip_ref.extractall(unzip_path)
+        members = self.manifest.setdefault("members", {})
+        transferred, skipped = 0, 0
+
+        source_path = self._local_source()
+        if source_path is not None and source_path.is_dir():
+            for path in sorted(p for p in source_path.rglob("*") if p.is_file()):
+                name = path.relative_to(source_path).as_posix()
+                target = Path(unzip_path) / name
+                entry = {"sha256": file_sha256(path), "size": path.stat().st_size}
+                if members.get(name) == entry and target.exists() and target.stat().st_size == entry["size"]:
+                    skipped += entry["size"]
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(path, target)
+                members[name] = entry
+                transferred += entry["size"]
+        else:
+            with zipfile.ZipFile(self.config.local_data_file, 'r') as zip_ref:
+                for info in zip_ref.infolist():
+                    if info.is_dir():
+                        continue
+                    target = Path(unzip_path) / info.filename
+                    entry = {"crc": info.CRC, "size": info.file_size}
+                    if members.get(info.filename) == entry and target.exists() and target.stat().st_size == info.file_size:
+                        skipped += info.file_size
+                        continue
+                    zip_ref.extract(info, unzip_path)
+                    members[info.filename] = entry
+                    transferred += info.file_size
+
+        self._record("extract", transferred, skipped, time.perf_counter() - start)
+        self._save_manifest()
+
+    def append_partitions(self):
+        """
+        Appends the rows added to each extracted CSV file since the last run as a new partition.
+
+        Data files are treated as append-only: the manifest records how many bytes of each file were already
+        partitioned, and only the lines after that offset are copied to the next partition, block by block, so
+        the cost is proportional to the new rows and memory stays flat. The file has been extracted completely,
+        so a last line without a trailing newline is partitioned too; rows appended later must then start with
+        a newline. A file whose header or last partitioned bytes changed was rewritten rather than appended to,
+        which would silently change existing rows, so it is rejected.
+
+        Raises:
+            ValueError: If a data file was modified before its last partitioned offset.
+
+        Returns:
+            list: Index entries of the partitions appended by this run.
+        """
+        partitioned = self.manifest.setdefault("partitioned", {})
+        appended = []
+
+        for name in sorted(self.manifest["members"]):
+            if not name.endswith(".csv"):
+                continue
+            path = Path(self.config.unzip_dir) / name
+            state = partitioned.get(name)
+
+            with open(path, "rb") as f:
+                header = f.readline()
+                offset = state["offset"] if state else len(header)
+
+                if state:
+                    f.seek(max(len(header), offset - TAIL_SIZE))
+                    tail = f.read(offset - f.tell())
+                    if (state["header"] != header.decode("utf-8")
+                            or hashlib.sha256(tail).hexdigest() != state["tail_sha256"]):
+                        raise ValueError(f"{path} was modified before byte {offset}; data files are append-only. "
+                                         f"Delete {self.config.partitions_dir} and {self.config.manifest_file} "
+                                         f"to rebuild the partitions from scratch.")
+
+                end = os.fstat(f.fileno()).st_size
+                pending = bool(state and state.get("unterminated"))  # Last line taken without its newline.
+                if pending and end > offset:
+                    # The last run took a final line without a newline; new rows must start on a new line.
+                    f.seek(offset)
+                    start = f.read(2)
+                    line_end = b"\r\n" if start == b"\r\n" else b"\n" if start.startswith(b"\n") else None
+                    if line_end is None:
+                        raise ValueError(f"{path} extended its last partitioned line at byte {offset}; data files "
+                                         f"are append-only. Delete {self.config.partitions_dir} and "
+                                         f"{self.config.manifest_file} to rebuild the partitions from scratch.")
+                    offset += len(line_end)
+                    pending = False
+
+                # The file was extracted completely, so its end also ends the last line, newline or not.
+                unterminated = False
+                if end > offset:
+                    f.seek(end - 1)
+                    unterminated = f.read(1) != b"\n"
+                    if unterminated:
+                        logger.info(f"Last line of {name} has no trailing newline; treating the end of the file as its end")
+                    entry = append_partition(self.config.partitions_dir, header,
+                                             _read_blocks(f, offset, end, unterminated), source=name)
+                    appended.append(entry)
+                    logger.info(f"Appended {entry['rows']} new rows of {name} as partition {entry['name']}")
+                else:
+                    logger.info(f"No new rows in {name}")
+                offset = max(offset, end)
+
+                f.seek(max(len(header), offset - TAIL_SIZE))
+                tail = f.read(offset - f.tell())
+
+            partitioned[name] = {"offset": offset, "header": header.decode("utf-8"),
+                                 "tail_sha256": hashlib.sha256(tail).hexdigest(),
+                                 "unterminated": unterminated or pending}
+
+        self._save_manifest()
+        return appended
+
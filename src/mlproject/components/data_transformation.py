@@ -1,8 +1,12 @@
 import os
+import shutil
 from mlproject import logger
-from sklearn.model_selection import train_test_split
+import numpy as np
 import pandas as pd
 from mlproject.entity.config_entity import DataTransformationConfig
+from mlproject.utils.artifacts import concat_datasets, dataset_path, save_dataset
+from mlproject.utils.partitions import HASH_BUCKETS, PartitionCache, read_index, row_hashes, settings_key, write_index
+from pathlib import Path
 
 
 
@@ -18,30 +22,156 @@ class DataTransformation:
         """
         self.config = config
 
-    ## Note: You can add different data transformation techniques such as Scaler, PCA, and all
+    ## Note: Feature transformations such as scaling, log transforms and PCA are fitted by the trainer
+    # (see components/preprocessing.py) so they can be folded into the exported model.
     # You can perform all kinds of EDA in ML cycle here before passing this data to the model
 
     # I am only adding train_test_splitting because this data is already cleaned up
 
     def train_test_splitting(self):
         """
-        Performs train-test splitting on the data and saves the resulting sets to CSV files.
+        Splits every new data partition into training and test sets and merges them with the earlier partitions.
+
+        The rows are assigned with the configured split strategy (see split_mask). Each partition is split once
+        and its sets are kept under root_dir/partitions/<partition>, together with a split manifest mapping the
+        hash of every row to its split; later runs only split the partitions added since, so existing rows never
+        move between splits.
         """
-        # Reading the data file into a pandas DataFrame.
-        data = pd.read_csv(self.config.data_path)
+        schema = dict(self.config.all_schema)
+        fmt = self.config.artifact_format
+        settings = settings_key(self.config.split_strategy, self.config.test_size, self.config.random_state,
+                                self.config.stratify_column, fmt, schema)
+        cache = PartitionCache(self.config.partition_cache_file, settings)
+        partitions = read_index(self.config.partitions_dir)
+
+        for partition in partitions:
+            output_dir = self.partition_dir(partition)
+            if cache.get(partition) is not None and (output_dir / "split.csv").exists():
+                continue
+
+            # Reading the partition into a pandas DataFrame, with the dtypes declared in schema.yaml.
+            data = pd.read_csv(partition["file"], dtype=schema)
+            hashes = row_hashes(data, schema)
+            test_mask = self.split_mask(data, hashes, partition)
+            train, test = data[~test_mask], data[test_mask]
+
+            # Saving the partition's training and test sets next to those of the earlier partitions.
+            os.makedirs(output_dir, exist_ok=True)
+            save_dataset(train, output_dir / "train", fmt, schema)
+            save_dataset(test, output_dir / "test", fmt, schema)
 
-        # Splitting the data into training and test sets using a default split ratio of (0.75, 0.25).
-        train, test = train_test_split(data)
+            # Recording the split of every row, written last so that it marks the partition as complete.
+            manifest = pd.DataFrame({"row_hash": [f"{h:016x}" for h in hashes],
+                                     "split": np.where(test_mask, "test", "train")})
+            manifest.to_csv(output_dir / "split.csv", index=False)
 
-        # Saving the training and test sets to CSV files in the root directory for data transformation artifacts.
-        train.to_csv(os.path.join(self.config.root_dir, "train.csv"), index=False)
-        test.to_csv(os.path.join(self.config.root_dir, "test.csv"), index=False)
+            cache.put(partition, {"train_rows": len(train), "test_rows": len(test)})
+            logger.info(f"Split partition {partition['name']} into {len(train)} training and {len(test)} test rows "
+                        f"({self.config.split_strategy} split)")
+
+        self.merge_partitions(partitions, cache)
+        cache.save()
+
+        # Listing the split partitions for the stages that read them one by one.
+        write_index(Path(self.config.root_dir) / "partitions",
+                    [dict(partition, **cache.get(partition)) for partition in partitions])
 
         # Logging information about the split.
+        train_rows = sum(cache.get(partition)["train_rows"] for partition in partitions)
+        test_rows = sum(cache.get(partition)["test_rows"] for partition in partitions)
         logger.info("Split data into training and test sets")
-        logger.info(train.shape)
-        logger.info(test.shape)
+        logger.info((train_rows, len(schema)))
+        logger.info((test_rows, len(schema)))
 
         # Printing the shapes of the resulting sets.
-        print(train.shape)
-        print(test.shape)
+        print((train_rows, len(schema)))
+        print((test_rows, len(schema)))
+
+    def partition_dir(self, partition: dict) -> Path:
+        """Directory holding the training and test sets of one partition."""
+        return Path(self.config.root_dir) / "partitions" / partition["name"]
+
+    def split_mask(self, data: pd.DataFrame, hashes, partition: dict):
+        """
+        Assigns the rows of a partition to the test set with the configured strategy.
+
+        - "hash": a row is in the test set when its hash falls in the first test_size of the hash buckets. The
+          assignment depends on nothing but the row, so it also works one row at a time on streaming input.
+        - "random": a seeded shuffle puts round(test_size * rows) rows in the test set.
+        - "stratified": like "random", but within each value of stratify_column, so every class keeps its share.
+        The seed of "random" and "stratified" combines random_state with the partition checksum, so a partition
+        is always split the same way.
+
+        Args:
+            data (pd.DataFrame): Rows of the partition.
+            hashes (np.ndarray): Row hashes, from row_hashes.
+            partition (dict): Index entry of the partition.
+
+        Raises:
+            ValueError: If the split strategy is unknown.
+
+        Returns:
+            np.ndarray: True for the rows of the test set.
+        """
+        strategy = self.config.split_strategy
+        if strategy == "hash":
+            return hashes % HASH_BUCKETS < round(self.config.test_size * HASH_BUCKETS)
+        if strategy not in ("random", "stratified"):
+            raise ValueError(f"Unknown split strategy '{strategy}', expected 'hash', 'random' or 'stratified'")
+
+        rng = np.random.default_rng([self.config.random_state, int(partition["sha256"][:16], 16)])
+        if strategy == "random":
+            groups = [np.arange(len(data))]
+        else:
+            labels = data[self.config.stratify_column].to_numpy()
+            groups = [np.flatnonzero(labels == label) for label in np.unique(labels)]
+
+        test_mask = np.zeros(len(data), dtype=bool)
+        for rows in groups:
+            test_mask[rng.permutation(rows)[:round(self.config.test_size * len(rows))]] = True
+        return test_mask
+
+    def merge_partitions(self, partitions: list, cache: PartitionCache):
+        """
+        Writes the training and test sets and split manifests of all partitions to the train and test artifacts
+        read by later stages and to the split manifest.
+
+        CSV files are appended to in place when the partitions merged by the last run are a prefix of the
+        current ones, so only the new partitions' rows are written. The size of every file after the last merge
+        is recorded with it, and the file is truncated back to that size before appending: a run interrupted
+        between the append and the cache save therefore never duplicates rows. Otherwise, and for formats that
+        cannot be appended to, the artifact is rebuilt from the per-partition sets one partition at a time.
+
+        Args:
+            partitions (list): Index entries of all partitions, in append order.
+            cache (PartitionCache): Cache of the transformation stage, recording the partitions already merged.
+        """
+        fmt = self.config.artifact_format
+        names = [partition["name"] for partition in partitions]
+        merged = cache.state.get("merged", [])
+        sizes = cache.state.get("merged_sizes", {})
+        outputs = [
+            ("train", dataset_path(os.path.join(self.config.root_dir, "train"), fmt), fmt),
+            ("test", dataset_path(os.path.join(self.config.root_dir, "test"), fmt), fmt),
+            ("split", Path(self.config.split_manifest_file), "csv"),
+        ]
+
+        new_sizes = {}
+        for name, path, path_fmt in outputs:
+            parts = [dataset_path(self.partition_dir(partition) / name, path_fmt) for partition in partitions]
+            if (path_fmt == "csv" and merged and merged == names[:len(merged)] and name in sizes
+                    and path.exists() and path.stat().st_size >= sizes[name]):
+                # Dropping what an interrupted run appended, then appending the new partitions without headers.
+                with open(path, "r+b") as out:
+                    out.truncate(sizes[name])
+                    out.seek(0, os.SEEK_END)
+                    for part in parts[len(merged):]:
+                        with open(part, "rb") as f:
+                            f.readline()
+                            shutil.copyfileobj(f, out)
+            else:
+                concat_datasets(parts, path, path_fmt)
+            new_sizes[name] = path.stat().st_size
+
+        cache.state["merged"] = names
+        cache.state["merged_sizes"] = new_sizes
@@ -1,7 +1,12 @@
 import os
+import time
 from mlproject import logger
+import numpy as np
 import pandas as pd
 from mlproject.entity.config_entity import DataValidationConfig
+from mlproject.utils.common import save_json
+from mlproject.utils.partitions import PartitionCache, read_index, settings_key
+from pathlib import Path
 
 
 # Purpose: Definition of the DataValidation class for handling data validation.
@@ -18,36 +23,159 @@ class DataValidation:
 
     def validate_all_columns(self) -> bool:
         """
-        Validates all columns in the data file against the specified schema.
+        Validates every data partition against the schema, reading each partition in a single streaming pass.
+
+        The header of a partition is checked first: missing or unexpected columns are fatal and stop its
+        validation before any data is read. The rows are then read in chunks of config.chunk_size, so memory
+        stays bounded, and every column is checked for values that do not parse as its schema dtype, nulls and
+        values outside its configured bounds. Partitions validated by an earlier run with the same schema and
+        bounds are not read again: their cached statistics are merged with those of the new partitions. The
+        status file and a JSON report with per-column statistics and violation counts are written once at the end.
+
+        Returns:
+            bool: True if every partition matches the schema and no violations were found, False otherwise.
+        """
+        start = time.perf_counter()
+        schema = dict(self.config.all_schema)
+        cache = PartitionCache(self.config.partition_cache_file,
+                               settings_key(schema, dict(self.config.bounds)))
+
+        fatal = []
+        stats = {col: self._empty_stats(schema[col]) for col in schema}
+        partitions = read_index(self.config.partitions_dir)
+        rows, chunks, cached = 0, 0, 0
+
+        for partition in partitions:
+            result = cache.get(partition)
+            if result is None:
+                result = self._validate_partition(partition["file"], schema)
+                cache.put(partition, result)
+            else:
+                cached += 1
+
+            fatal.extend(f"{partition['name']}: {message}" for message in result["fatal"])
+            rows += result["rows"]
+            chunks += result["chunks"]
+            for col in schema:
+                self._merge_stats(stats[col], result["columns"][col])
+
+        cache.save()
+        if rows == 0 and not fatal:
+            fatal.append(f"No data partitions in {self.config.partitions_dir}")
+
+        for col_stats in stats.values():
+            col_stats["mean"] = col_stats.pop("sum") / col_stats["count"] if col_stats["count"] else None
+            col_stats["violations"] = (col_stats["nulls"] + col_stats["dtype_errors"]
+                                       + col_stats["below_min"] + col_stats["above_max"])
+
+        validation_status = not fatal and all(col_stats["violations"] == 0 for col_stats in stats.values())
+
+        report = {
+            "status": validation_status,
+            "fatal": fatal,
+            "rows": rows,
+            "chunks": chunks,
+            "partitions": len(partitions),
+            "cached_partitions": cached,
+            "seconds": time.perf_counter() - start,
+            "columns": stats,
+        }
+        save_json(path=Path(self.config.REPORT_FILE), data=report)
+
+        with open(self.config.STATUS_FILE, 'w') as f:
+            f.write(f"Validation status: {validation_status}")
+
+        if not validation_status:
+            logger.info(f"Data validation failed: {fatal or 'see ' + str(self.config.REPORT_FILE)}")
+
+        return validation_status
+
+    def _validate_partition(self, path, schema: dict) -> dict:
+        """
+        Computes the header check and the running statistics of one partition.
+
+        Args:
+            path (Path): CSV file of the partition.
+            schema (dict): Column name -> dtype, as declared in schema.yaml.
 
         Returns:
-            bool: True if all columns are present in the schema, False otherwise.
-        """
-        try:
-            validation_status = None
-
-            # Reading the data file into a pandas DataFrame.
-            data = pd.read_csv(self.config.unzip_data_dir)
-            
-            # Extracting the column names from the data.
-            all_cols = list(data.columns)
-
-            # Extracting the expected columns from the schema.
-            all_schema = self.config.all_schema.keys()
-
-            # Validating each column against the schema.
-            for col in all_cols:
-                if col not in all_schema:
-                    validation_status = False
-                    with open(self.config.STATUS_FILE, 'w') as f:
-                        f.write(f"Validation status: {validation_status}")
-                else:
-                    validation_status = True
-                    with open(self.config.STATUS_FILE, 'w') as f:
-                        f.write(f"Validation status: {validation_status}")
-
-            return validation_status
-
-        except Exception as e:
-            # Handling and re-raising any exceptions that occur during the validation process.
-            raise e
+            dict: Fatal header errors, rows and chunks read, and unfinalized statistics of every column.
+        """
+        # Checking the header against the schema before reading any data.
+        all_cols = list(pd.read_csv(path, nrows=0).columns)
+        missing = [col for col in schema if col not in all_cols]
+        unexpected = [col for col in all_cols if col not in schema]
+
+        fatal = []
+        if missing:
+            fatal.append(f"Missing columns: {missing}")
+        if unexpected:
+            fatal.append(f"Unexpected columns: {unexpected}")
+
+        stats = {col: self._empty_stats(schema[col]) for col in schema}
+        rows, chunks = 0, 0
+
+        if not fatal:
+            # Reading every column as text so that values which do not parse as the schema dtype can be counted.
+            for chunk in pd.read_csv(path, chunksize=self.config.chunk_size, dtype=str):
+                rows += len(chunk)
+                chunks += 1
+                for col, dtype in schema.items():
+                    self._update_stats(stats[col], chunk[col], dtype, self.config.bounds.get(col) or {})
+
+        return {"fatal": fatal, "rows": rows, "chunks": chunks, "columns": stats}
+
+    @staticmethod
+    def _merge_stats(stats: dict, other: dict):
+        """Adds the unfinalized statistics of a column in another partition to stats."""
+        for key in ("count", "nulls", "dtype_errors", "below_min", "above_max", "sum"):
+            stats[key] += other[key]
+        if other["min"] is not None:
+            stats["min"] = other["min"] if stats["min"] is None else min(stats["min"], other["min"])
+        if other["max"] is not None:
+            stats["max"] = other["max"] if stats["max"] is None else max(stats["max"], other["max"])
+
+    @staticmethod
+    def _empty_stats(dtype: str) -> dict:
+        """Returns the running statistics of a column before any row is read."""
+        return {"dtype": dtype, "count": 0, "nulls": 0, "dtype_errors": 0, "below_min": 0, "above_max": 0,
+                "min": None, "max": None, "sum": 0.0}
+
+    @staticmethod
+    def _update_stats(stats: dict, values: pd.Series, dtype: str, bounds: dict):
+        """
+        Updates a column's running statistics with one chunk of raw (text) values.
+
+        Args:
+            stats (dict): Running statistics of the column.
+            values (pd.Series): Raw values of the chunk.
+            dtype (str): Dtype declared in schema.yaml.
+            bounds (dict): Optional min and max allowed values.
+        """
+        nulls = values.isna()
+        stats["nulls"] += int(nulls.sum())
+
+        if not np.issubdtype(np.dtype(dtype), np.number):
+            stats["count"] += int((~nulls).sum())
+            return
+
+        numbers = pd.to_numeric(values, errors="coerce")
+        invalid = numbers.isna() & ~nulls
+        if np.issubdtype(np.dtype(dtype), np.integer):
+            invalid |= numbers.notna() & (numbers % 1 != 0)
+        stats["dtype_errors"] += int(invalid.sum())
+
+        numbers = numbers[~invalid].dropna()
+        if numbers.empty:
+            return
+
+        stats["count"] += len(numbers)
+        stats["sum"] += float(numbers.sum())
+        chunk_min, chunk_max = float(numbers.min()), float(numbers.max())
+        stats["min"] = chunk_min if stats["min"] is None else min(stats["min"], chunk_min)
+        stats["max"] = chunk_max if stats["max"] is None else max(stats["max"], chunk_max)
+
+        if bounds.get("min") is not None:
+            stats["below_min"] += int((numbers < bounds["min"]).sum())
+        if bounds.get("max") is not None:
+            stats["above_max"] += int((numbers > bounds["max"]).sum())
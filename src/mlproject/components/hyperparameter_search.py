@@ -0,0 +1,140 @@
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from sklearn.linear_model import enet_path
+from mlproject import logger
+
+# Purpose: Definition of the ElasticNetSearch class for cross-validated, parallel ElasticNet hyperparameter search.
+
+# Training data shared with the worker processes, set once per worker by _init_worker.
+_worker_data = {}
+
+
+def _init_worker(X, y, folds):
+    """Stores the training data in the worker process so tasks only carry their parameters."""
+    _worker_data["X"] = X
+    _worker_data["y"] = y
+    _worker_data["folds"] = folds
+
+
+def _fold_path_rmse(l1_ratio, alphas, fold):
+    """
+    Fits the whole regularization path for one l1_ratio on one CV fold and scores it on the held-out rows.
+
+    enet_path solves the alphas from largest to smallest, warm-starting each fit from the previous solution.
+    It fits no intercept, so the training rows are centered first, which gives the same solution as
+    ElasticNet(fit_intercept=True).
+
+    Args:
+        l1_ratio (float): Mixing parameter of the elastic net penalty.
+        alphas (np.ndarray): Regularization strengths in decreasing order.
+        fold (int): Index of the held-out fold.
+
+    Returns:
+        tuple: (l1_ratio, fold, RMSE on the held-out fold for each alpha).
+    """
+    X, y, folds = _worker_data["X"], _worker_data["y"], _worker_data["folds"]
+    val = folds == fold
+    X_train, y_train = X[~val], y[~val]
+
+    X_mean, y_mean = X_train.mean(axis=0), y_train.mean()
+    _, coefs, _ = enet_path(X_train - X_mean, y_train - y_mean, l1_ratio=l1_ratio, alphas=alphas)
+    intercepts = y_mean - X_mean @ coefs
+
+    predictions = X[val] @ coefs + intercepts
+    rmse = np.sqrt(np.mean((predictions - y[val][:, None]) ** 2, axis=0))
+    return l1_ratio, fold, rmse
+
+
+def unique_grid(values, name: str) -> list:
+    """
+    Sorts the candidate values of one hyperparameter and drops duplicates, which would otherwise be scored twice
+    or overwrite each other's results.
+
+    Args:
+        values: Candidate values, e.g. from expand_grid.
+        name (str): Name of the hyperparameter, for the log.
+
+    Returns:
+        list: Distinct values as floats, in increasing order.
+    """
+    values = [float(value) for value in values]
+    unique = sorted(set(values))
+    if len(unique) < len(values):
+        logger.warning(f"Dropped {len(values) - len(unique)} duplicate {name} candidates from the search grid")
+    return unique
+
+
+class ElasticNetSearch:
+    def __init__(self, alphas, l1_ratios, cv: int = 5, n_jobs: int = -1, random_state: int = 42):
+        """
+        Initializes the search over a grid of ElasticNet hyperparameters; duplicate candidates are dropped.
+
+        Args:
+            alphas: Candidate regularization strengths.
+            l1_ratios: Candidate mixing parameters.
+            cv (int, optional): Number of cross-validation folds. Defaults to 5.
+            n_jobs (int, optional): Worker processes; -1 uses every core. Defaults to -1.
+            random_state (int, optional): Seed of the fold assignment. Defaults to 42.
+        """
+        self.alphas = np.asarray(unique_grid(alphas, "alpha"), dtype=np.float64)[::-1]  # Decreasing, for enet_path.
+        self.l1_ratios = unique_grid(l1_ratios, "l1_ratio")
+        self.cv = cv
+        self.n_jobs = os.cpu_count() if n_jobs in (None, -1) else n_jobs
+        self.random_state = random_state
+
+    def fit(self, X, y) -> dict:
+        """
+        Scores every (alpha, l1_ratio) candidate by cross-validated RMSE.
+
+        One task per (l1_ratio, fold) pair is run in a process pool; each task fits the full alpha path.
+
+        Args:
+            X: Training features.
+            y: Training target.
+
+        Returns:
+            dict: Leaderboard with the best candidate and every candidate ranked by mean CV RMSE.
+        """
+        start = time.perf_counter()
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64).ravel()
+
+        rng = np.random.default_rng(self.random_state)
+        folds = rng.permutation(np.arange(len(y)) % self.cv)
+
+        tasks = [(l1_ratio, fold) for l1_ratio in self.l1_ratios for fold in range(self.cv)]
+        scores = {l1_ratio: np.empty((self.cv, len(self.alphas))) for l1_ratio in self.l1_ratios}
+
+        workers = max(1, min(self.n_jobs, len(tasks)))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(X, y, folds)) as executor:
+            futures = [executor.submit(_fold_path_rmse, l1_ratio, self.alphas, fold) for l1_ratio, fold in tasks]
+            for future in futures:
+                l1_ratio, fold, rmse = future.result()
+                scores[l1_ratio][fold] = rmse
+
+        candidates = [
+            {
+                "alpha": float(alpha),
+                "l1_ratio": l1_ratio,
+                "cv_rmse_mean": float(scores[l1_ratio][:, i].mean()),
+                "cv_rmse_std": float(scores[l1_ratio][:, i].std()),
+            }
+            for l1_ratio in self.l1_ratios
+            for i, alpha in enumerate(self.alphas)
+        ]
+        candidates.sort(key=lambda candidate: candidate["cv_rmse_mean"])
+        for rank, candidate in enumerate(candidates, start=1):
+            candidate["rank"] = rank
+
+        seconds = time.perf_counter() - start
+        logger.info(f"Searched {len(candidates)} candidates with {self.cv}-fold CV on {workers} workers in {seconds:.2f}s")
+
+        return {
+            "best": {"alpha": candidates[0]["alpha"], "l1_ratio": candidates[0]["l1_ratio"]},
+            "cv": self.cv,
+            "n_jobs": workers,
+            "seconds": seconds,
+            "candidates": candidates,
+        }
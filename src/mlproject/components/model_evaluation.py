@@ -5,8 +5,8 @@ from sklearn.linear_model import ElasticNet
 import joblib
 from mlproject.entity.config_entity import ModelEvaluationConfig
 import numpy as np
-from sklearn.metrics import mean_absolute_error,mean_squared_error,r2_score
 from mlproject.utils.common import save_json
+from mlproject.utils.artifacts import iter_dataset_chunks
 from pathlib import Path
 
 class ModelEvaluation:
@@ -19,43 +19,118 @@ class ModelEvaluation:
         """
         self.config = config
 
-    def eval_metrics(self, actual, pred):
+    def save_results(self):
         """
-        Calculates evaluation metrics including RMSE, MAE, and R2.
+        Scores the test data chunk by chunk with the trained model and saves the metrics.
 
-        Args:
-            actual: Ground truth values.
-            pred: Predicted values.
+        Each chunk only updates running sums, so memory stays flat however large the test set is:
+            - RMSE, MAE and R2 come from sums of squared and absolute errors and the running moments of the target.
+            - Confidence intervals use the Poisson bootstrap: every row gets an independent Poisson(1) weight per
+              replicate, drawn as one (replicates x rows) matrix per block, and each replicate's weighted sums are
+              matrix-vector products. This is the streaming equivalent of resampling rows with replacement.
+              Blocks cover fixed ranges of row indices and each is drawn from its own generator seeded with
+              (random_state, block number), so the intervals depend on the seed but not on chunk_size.
+            - Errors are also broken down by quality class.
+        The top-level "rmse", "mae" and "r2" keys of metrics.json are unchanged.
 
-        Returns:
-            Tuple: Tuple containing RMSE, MAE, and R2.
-        """
-        rmse = np.sqrt(mean_squared_error(actual, pred))
-        mae = mean_absolute_error(actual, pred)
-        r2 = r2_score(actual, pred)
-        return rmse, mae, r2
-
-    def save_results(self):
-        """
-        Loads the test data and the trained model, predicts on the test data, calculates metrics, and saves them.
+        Raises:
+            ValueError: If the test split has no rows.
 
         Returns:
             None
         """
-        # Reading test data and trained model.
-        test_data = pd.read_csv(self.config.test_data_path)
         model = joblib.load(self.config.model_path)
+        n_bootstrap = self.config.n_bootstrap
+
+        # Rows per bootstrap block, keeping the weight matrix at about two million entries.
+        block_size = max(1, 2_000_000 // max(n_bootstrap, 1))
+        block_weights = {}  # Block number -> its weight matrix, kept while a chunk boundary splits the block.
+
+        n, sse, sae, y_mean, y_m2 = 0, 0.0, 0.0, 0.0, 0.0
+        boot = np.zeros((5, n_bootstrap))  # Per replicate: weight, squared error, absolute error, y, y^2.
+        classes = {}
 
-        # Extracting features and target variable from the test data.
-        test_x = test_data.drop([self.config.target_column], axis=1)
-        test_y = test_data[[self.config.target_column]]
+        for chunk in iter_dataset_chunks(self.config.test_data_path, self.config.artifact_format, self.config.chunk_size):
+            if len(chunk) == 0:
+                continue
 
-        # Predicting target variable on the test data.
-        predicted_qualities = model.predict(test_x)
+            # Extracting features and target variable from the chunk and predicting it.
+            test_y = chunk[self.config.target_column].to_numpy(dtype=np.float64)
+            test_x = chunk.drop([self.config.target_column], axis=1)
+            predicted_qualities = np.asarray(model.predict(test_x), dtype=np.float64).ravel()
 
-        # Calculating evaluation metrics.
-        (rmse, mae, r2) = self.eval_metrics(test_y, predicted_qualities)
+            errors = predicted_qualities - test_y
+            squared, absolute = errors ** 2, np.abs(errors)
+
+            # Point estimates: error sums and Welford/Chan update of the target's mean and sum of squares.
+            m = len(test_y)
+            chunk_mean = test_y.mean()
+            delta = chunk_mean - y_mean
+            y_m2 += ((test_y - chunk_mean) ** 2).sum() + delta ** 2 * n * m / (n + m)
+            y_mean += delta * m / (n + m)
+            n += m
+            sse += squared.sum()
+            sae += absolute.sum()
+
+            # Poisson bootstrap: one weight matrix per block of row indices, all replicates updated with matrix
+            # products. The chunk covers rows [n - m, n) of the test set.
+            if n_bootstrap:
+                stats = np.vstack([np.ones(m), squared, absolute, test_y, test_y ** 2])
+                row = n - m
+                while row < n:
+                    block, offset = divmod(row, block_size)
+                    if block not in block_weights:
+                        rng = np.random.default_rng([self.config.random_state, block])
+                        block_weights = {block: rng.poisson(1.0, size=(n_bootstrap, block_size)).astype(np.float64)}
+                    stop = min(n, (block + 1) * block_size)
+                    weights = block_weights[block][:, offset:offset + stop - row]
+                    boot += stats[:, row - (n - m):stop - (n - m)] @ weights.T
+                    row = stop
+
+            # Per-class breakdown, keyed by the true quality.
+            labels = np.rint(test_y).astype(np.int64)
+            for label in np.unique(labels):
+                mask = labels == label
+                entry = classes.setdefault(int(label), {"n": 0, "sse": 0.0, "sae": 0.0, "sum_error": 0.0})
+                entry["n"] += int(mask.sum())
+                entry["sse"] += float(squared[mask].sum())
+                entry["sae"] += float(absolute[mask].sum())
+                entry["sum_error"] += float(errors[mask].sum())
+
+        if n == 0:
+            raise ValueError(f"Test split {self.config.test_data_path} is empty; there is nothing to evaluate")
+
+        rmse, mae = np.sqrt(sse / n), sae / n
+        r2 = 1.0 - sse / y_m2 if y_m2 > 0 else float("nan")
 
         # Saving metrics as a JSON file locally.
-        scores = {"rmse": rmse, "mae": mae, "r2": r2}
+        scores = {"rmse": rmse, "mae": mae, "r2": r2, "n": n}
+
+        if n_bootstrap:
+            weight, b_sse, b_sae, b_y, b_y2 = boot
+            weight = np.maximum(weight, 1.0)
+            replicates = {
+                "rmse": np.sqrt(b_sse / weight),
+                "mae": b_sae / weight,
+                "r2": 1.0 - b_sse / np.maximum(b_y2 - b_y ** 2 / weight, np.finfo(float).tiny),
+            }
+            tail = (1.0 - self.config.confidence_level) / 2 * 100
+            scores["confidence_intervals"] = {
+                "level": self.config.confidence_level,
+                "n_bootstrap": n_bootstrap,
+                "method": "poisson bootstrap, percentile",
+                **{name: [float(np.percentile(values, tail)), float(np.percentile(values, 100 - tail))]
+                   for name, values in replicates.items()},
+            }
+
+        scores["per_class"] = {
+            str(label): {
+                "n": entry["n"],
+                "rmse": float(np.sqrt(entry["sse"] / entry["n"])),
+                "mae": entry["sae"] / entry["n"],
+                "mean_error": entry["sum_error"] / entry["n"],
+            }
+            for label, entry in sorted(classes.items())
+        }
+
         save_json(path=Path(self.config.metric_file_name), data=scores)
@@ -0,0 +1,150 @@
+import os
+import math
+import time
+from mlproject import logger
+from mlproject.entity.config_entity import ModelRegistryConfig
+from mlproject.pipeline.model_registry import ModelRegistry, MODEL_ARTIFACT, LINEAR_MODEL_ARTIFACT
+from mlproject.utils.common import save_json, load_json, file_sha256
+from pathlib import Path
+
+# Purpose: Definition of the ModelRegistration class, which registers the trained model as an immutable version
+# and promotes it when its evaluation metrics pass the promotion gate.
+
+
+class ModelRegistration:
+    def __init__(self, config: ModelRegistryConfig):
+        """
+        Initializes the ModelRegistration object with the provided configuration.
+
+        Args:
+            config (ModelRegistryConfig): ModelRegistryConfig object containing model registry settings.
+        """
+        self.config = config
+        self.registry = ModelRegistry(config.root_dir)
+
+    def data_fingerprint(self) -> dict:
+        """
+        Fingerprints the data the model was trained and evaluated on.
+
+        Returns:
+            dict: Path -> SHA-256 of every data file, None for missing files.
+        """
+        return {str(path): file_sha256(path) if os.path.exists(path) else None for path in self.config.data_files}
+
+    def build_metadata(self, sha256: str) -> dict:
+        """
+        Collects the metadata stored with a new version.
+
+        Args:
+            sha256 (str): SHA-256 of the model artifact.
+
+        Returns:
+            dict: Model hash, parameters, evaluation and cross-validation metrics, and data fingerprint.
+        """
+        metrics = dict(load_json(Path(self.config.metric_file_name)))
+        metadata = {
+            "sha256": sha256,
+            "created_at": time.time(),
+            "params": self.config.all_params,
+            "metrics": metrics,
+            "data": self.data_fingerprint(),
+        }
+        if os.path.exists(self.config.cv_metric_file_name):
+            cv_metrics = dict(load_json(Path(self.config.cv_metric_file_name)))
+            cv_metrics.pop("folds", None)  # The summary is enough to compare versions.
+            metadata["cv_metrics"] = cv_metrics
+        return metadata
+
+    def gate(self, candidate: dict, baseline: dict) -> dict:
+        """
+        Decides whether a candidate version may replace the current one.
+
+        The candidate passes when its gate metric is at least min_improvement better than the baseline's (lower
+        is better in 'min' mode, higher in 'max' mode) and, when a threshold is set, no worse than the threshold.
+        Without a baseline only the threshold applies.
+
+        Args:
+            candidate (dict): Metadata of the candidate version.
+            baseline (dict): Metadata of the current version, or None.
+
+        Returns:
+            dict: Metric name, candidate and baseline values, whether the gate passed and why.
+        """
+        metric, sign = self.config.gate_metric, 1.0 if self.config.gate_mode == "min" else -1.0
+        value = candidate["metrics"].get(metric)
+        previous = baseline["metrics"].get(metric) if baseline is not None else None
+        result = {"metric": metric, "mode": self.config.gate_mode, "value": value, "baseline": previous}
+
+        if value is None or math.isnan(value):
+            return dict(result, passed=False, reason=f"{metric} missing from the evaluation metrics")
+        if self.config.threshold is not None and sign * (value - self.config.threshold) > 0:
+            return dict(result, passed=False, reason=f"{metric} {value:.6f} is worse than the threshold {self.config.threshold}")
+        if previous is not None and sign * (previous - value) < self.config.min_improvement:
+            return dict(result, passed=False,
+                        reason=f"{metric} {value:.6f} does not improve on {previous:.6f} by {self.config.min_improvement}")
+        return dict(result, passed=True, reason="no current version" if previous is None else f"{metric} improved")
+
+    def promote(self, version: str, force: bool = False, auto: bool = True) -> dict:
+        """
+        Gates a registered version against the current one and promotes it when it passes.
+
+        Args:
+            version (str): Version to promote.
+            force (bool, optional): Promote even when the gate fails, e.g. for a manual rollback. Defaults to False.
+            auto (bool, optional): Promote when the gate passes; False only reports the decision. Defaults to True.
+
+        Raises:
+            KeyError: If the version is not registered.
+
+        Returns:
+            dict: Gate decision, with 'promoted' telling whether the current pointer was swapped.
+        """
+        current = self.registry.current()
+        if version == current:
+            return {"passed": True, "reason": "already current", "promoted": False}
+
+        baseline = self.registry.metadata(current) if current is not None else None
+        decision = self.gate(self.registry.metadata(version), baseline)
+        promoted = (decision["passed"] and auto) or force
+        if promoted:
+            reason = decision["reason"] if decision["passed"] else f"forced: {decision['reason']}"
+            self.registry.promote(version, reason=reason)
+            logger.info(f"Promoted model version {version}: {reason}")
+        else:
+            logger.info(f"Model version {version} not promoted: "
+                        f"{decision['reason'] if not decision['passed'] else 'auto_promote is off'}")
+        return dict(decision, promoted=promoted)
+
+    def run(self) -> dict:
+        """
+        Registers the trained model and promotes it when it passes the gate.
+
+        A model whose artifact hash is already registered is not copied again; the existing version is gated
+        instead. Promotion only swaps the registry's current pointer, which serving processes following the
+        current version pick up on their next request.
+
+        Returns:
+            dict: Report with the version, the gate decision and the current version.
+        """
+        sha256 = file_sha256(self.config.model_path)
+        version = self.registry.find(sha256)
+        registered = version is None
+
+        if registered:
+            artifacts = {MODEL_ARTIFACT: self.config.model_path}
+            if os.path.exists(self.config.linear_model_path):
+                artifacts[LINEAR_MODEL_ARTIFACT] = self.config.linear_model_path
+            version = self.registry.register(artifacts, self.build_metadata(sha256))
+            logger.info(f"Registered model version {version}")
+        else:
+            logger.info(f"Model already registered as {version}")
+
+        decision = self.promote(version, force=False, auto=self.config.auto_promote)
+        report = {
+            "version": version,
+            "registered": registered,
+            "gate": decision,
+            "current": self.registry.current(),
+        }
+        save_json(path=Path(self.config.report_file), data=report)
+        return report
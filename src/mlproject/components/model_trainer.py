@@ -4,6 +4,16 @@ from mlproject import logger
 from sklearn.linear_model import ElasticNet
 import joblib
 from mlproject.entity.config_entity import ModelTrainerConfig
+from mlproject.components.hyperparameter_search import ElasticNetSearch, unique_grid
+from mlproject.utils.common import save_json
+from mlproject.utils.artifacts import dataset_path, load_dataset, iter_dataset_chunks
+from mlproject.utils.partitions import HASH_BUCKETS, read_index, row_hashes, settings_key
+from mlproject.components.sufficient_statistics import RunningMoments
+from mlproject.components.preprocessing import FeaturePreprocessor
+from sklearn.pipeline import Pipeline
+import numpy as np
+from pathlib import Path
+from mlproject.pipeline.linear_scorer import LinearScorer
 
 # Purpose: Definition of the ModelTrainer class for training a machine learning model.
 
@@ -19,23 +29,291 @@ class ModelTrainer:
 
     def train(self):
         """
-        Trains a machine learning model using ElasticNet regression.
+        Trains a machine learning model using ElasticNet regression, in memory or streaming as configured.
         """
-        # Reading training and test data from CSV files.
-        train_data = pd.read_csv(self.config.train_data_path)
-        test_data = pd.read_csv(self.config.test_data_path)
+        if self.config.training_mode == "streaming":
+            self.train_streaming()
+        elif self.config.training_mode == "in_memory":
+            self.train_in_memory()
+        else:
+            raise ValueError(f"Unknown training mode: {self.config.training_mode}")
 
-        # Extracting features and target variables from the data.
-        train_x = train_data.drop([self.config.target_column], axis=1)
-        test_x = test_data.drop([self.config.target_column], axis=1)
+    def train_in_memory(self):
+        """
+        Trains the ElasticNet model on the whole training split loaded into memory.
+        """
+        # Reading training data in the configured artifact format; the test split is only read by evaluation.
+        train_data = load_dataset(self.config.train_data_path, self.config.artifact_format)
+
+        # Extracting features (in schema.yaml order) and target variable from the data.
+        feature_columns = list(self.config.feature_columns)
+        train_x = train_data[feature_columns]
         train_y = train_data[[self.config.target_column]]
-        test_y = test_data[[self.config.target_column]]
 
-        # Creating an ElasticNet regression model with specified alpha and l1_ratio.
-        lr = ElasticNet(alpha=self.config.alpha, l1_ratio=self.config.l1_ratio, random_state=42)
+        # Fitting the configured preprocessing, if any, and transforming the training features with it.
+        preprocessor = self.build_preprocessor()
+        if preprocessor is not None:
+            train_x = preprocessor.fit(train_x).transform(train_x)
+
+        # Picking alpha and l1_ratio: the configured values, or the best candidate of the grid search.
+        alpha, l1_ratio = self.select_hyperparameters(train_x, train_y)
+
+        # Creating an ElasticNet regression model with the selected alpha and l1_ratio.
+        lr = ElasticNet(alpha=alpha, l1_ratio=l1_ratio, random_state=42)
 
         # Training the model on the training data.
         lr.fit(train_x, train_y)
 
-        # Saving the trained model using joblib in the specified root directory.
-        joblib.dump(lr, os.path.join(self.config.root_dir, self.config.model_name))
+        self.save_model(self.with_preprocessor(preprocessor, lr))
+
+    def train_streaming(self):
+        """
+        Trains the ElasticNet model out of core.
+
+        The training split of every data partition is read in chunks of config.chunk_size rows and reduced to
+        running means and co-moments of [features | target], which determine the ElasticNet solution exactly;
+        coordinate descent then runs on the feature covariance matrix. Peak memory is bounded by the chunk size.
+        With several hyperparameter candidates, the moments are also accumulated per cross-validation fold so
+        the search needs no second pass over the data. Rows are assigned to folds by a hash of their values, so
+        the moments of a partition never change and are cached: a run only reads the partitions added since
+        the last one and merges their moments with the cached ones.
+        """
+        feature_columns = list(self.config.feature_columns)
+        columns = feature_columns + [self.config.target_column]
+        search = len(self.config.alpha) > 1 or len(self.config.l1_ratio) > 1
+        n_folds = self.config.search_cv if search else 1
+
+        folds = [RunningMoments(len(columns)) for _ in range(n_folds)]
+        cached = 0
+        partitions = read_index(self.config.partitions_dir)
+        for partition in partitions:
+            partition_folds = self.load_partition_moments(partition, columns, n_folds)
+            if partition_folds is None:
+                partition_folds = self.partition_moments(partition, columns, n_folds)
+            else:
+                cached += 1
+            folds = [moments.merge(other) for moments, other in zip(folds, partition_folds)]
+
+        total = folds[0]
+        for moments in folds[1:]:
+            total = total.merge(moments)
+        logger.info(f"Accumulated moments of {total.n} training rows from {len(partitions)} partitions "
+                    f"({cached} cached) in chunks of {self.config.chunk_size}")
+
+        # The standardization and PCA are affine, so they are fitted from the moments and applied to them.
+        preprocessor = self.build_preprocessor()
+        if preprocessor is not None:
+            preprocessor.fit_moments(total)
+            folds = [preprocessor.transform_moments(moments) for moments in folds]
+            total = preprocessor.transform_moments(total)
+
+        if search:
+            leaderboard = self.search_from_moments(folds)
+            alpha, l1_ratio = leaderboard["best"]["alpha"], leaderboard["best"]["l1_ratio"]
+            logger.info(f"Best hyperparameters: alpha={alpha}, l1_ratio={l1_ratio}")
+        else:
+            alpha, l1_ratio = self.config.alpha[0], self.config.l1_ratio[0]
+            leaderboard = {"best": {"alpha": alpha, "l1_ratio": l1_ratio}, "cv": None, "candidates": []}
+        save_json(path=Path(self.config.leaderboard_file), data=leaderboard)
+
+        coef, intercept, n_iter = total.fit_elastic_net(alpha, l1_ratio)
+
+        # Wrapping the solution in a fitted ElasticNet so model.joblib is the same kind of artifact as in memory.
+        lr = ElasticNet(alpha=alpha, l1_ratio=l1_ratio, random_state=42)
+        lr.coef_ = coef
+        lr.intercept_ = intercept
+        lr.n_iter_ = n_iter
+        lr.dual_gap_ = 0.0
+        lr.n_features_in_ = len(coef)
+        if preprocessor is None:
+            lr.feature_names_in_ = np.array(feature_columns, dtype=object)
+
+        self.save_model(self.with_preprocessor(preprocessor, lr))
+
+    def _partition_train_path(self, partition: dict) -> Path:
+        """Training split of one data partition, as written by the transformation stage."""
+        return dataset_path(Path(self.config.partitions_dir) / partition["name"] / "train", self.config.artifact_format)
+
+    def _moments_key(self, partition: dict, columns: list, n_folds: int) -> str:
+        """Fingerprints a partition's training split (by size and mtime) and the settings its moments depend on."""
+        stat = os.stat(self._partition_train_path(partition))
+        return settings_key(partition["sha256"], stat.st_size, stat.st_mtime_ns, columns, n_folds,
+                            self.config.log_columns)
+
+    def partition_moments(self, partition: dict, columns: list, n_folds: int) -> list:
+        """
+        Accumulates the per-fold moments of one partition's training split and caches them.
+
+        Args:
+            partition (dict): Index entry of the partition.
+            columns (list): Feature columns followed by the target column.
+            n_folds (int): Number of cross-validation folds.
+
+        Returns:
+            list: RunningMoments of each fold.
+        """
+        folds = [RunningMoments(len(columns)) for _ in range(n_folds)]
+        path = self._partition_train_path(partition)
+        log_mask = np.isin(columns, self.config.log_columns)
+        for chunk in iter_dataset_chunks(path, self.config.artifact_format, self.config.chunk_size):
+            # A writable copy: npy chunks are read-only memmap views.
+            Z = np.array(chunk[columns], dtype=np.float64)
+            if log_mask.any():
+                Z[:, log_mask] = np.log1p(Z[:, log_mask])  # Moments of the log-transformed features.
+            # Dividing out the buckets used by the train/test split keeps the folds independent of it.
+            assignment = (row_hashes(chunk, columns) // HASH_BUCKETS) % n_folds
+            for fold, moments in enumerate(folds):
+                moments.update(Z[assignment == fold])
+
+        np.savez(os.path.join(self.config.moments_cache_dir, f"{partition['name']}.npz"),
+                 key=self._moments_key(partition, columns, n_folds),
+                 n=np.array([moments.n for moments in folds]),
+                 mean=np.array([moments.mean for moments in folds]),
+                 comoment=np.array([moments.comoment for moments in folds]))
+        return folds
+
+    def load_partition_moments(self, partition: dict, columns: list, n_folds: int):
+        """
+        Loads the cached per-fold moments of one partition's training split.
+
+        Returns:
+            list: RunningMoments of each fold, or None when they are not cached or are stale.
+        """
+        path = os.path.join(self.config.moments_cache_dir, f"{partition['name']}.npz")
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as cached:
+            if str(cached["key"]) != self._moments_key(partition, columns, n_folds):
+                return None
+            folds = []
+            for n, mean, comoment in zip(cached["n"], cached["mean"], cached["comoment"]):
+                moments = RunningMoments(len(columns))
+                moments.n, moments.mean, moments.comoment = int(n), mean, comoment
+                folds.append(moments)
+        return folds
+
+    def build_preprocessor(self):
+        """
+        Builds the configured feature preprocessing.
+
+        Returns:
+            FeaturePreprocessor: Unfitted preprocessor, or None when params.yaml configures no preprocessing.
+        """
+        if not (self.config.log_columns or self.config.standardize or self.config.pca_components):
+            return None
+        unknown = set(self.config.log_columns) - set(self.config.feature_columns)
+        if unknown:
+            raise ValueError(f"Unknown log_columns: {sorted(unknown)}")
+        return FeaturePreprocessor(feature_columns=tuple(self.config.feature_columns),
+                                   log_columns=tuple(self.config.log_columns),
+                                   standardize=self.config.standardize,
+                                   pca_components=self.config.pca_components)
+
+    @staticmethod
+    def with_preprocessor(preprocessor, model):
+        """
+        Chains a fitted preprocessor and the model fitted on its output into one estimator.
+
+        Args:
+            preprocessor (FeaturePreprocessor): Fitted preprocessor, or None.
+            model: Fitted ElasticNet model.
+
+        Returns:
+            ElasticNet or Pipeline: The model itself without preprocessing, otherwise a Pipeline predicting from
+                the raw features.
+        """
+        if preprocessor is None:
+            return model
+        return Pipeline([("preprocess", preprocessor), ("model", model)])
+
+    def search_from_moments(self, folds: list) -> dict:
+        """
+        Ranks every (alpha, l1_ratio) candidate by cross-validated RMSE computed from per-fold moments.
+
+        Args:
+            folds (list): RunningMoments of each cross-validation fold.
+
+        Returns:
+            dict: Leaderboard in the same layout as ElasticNetSearch.fit.
+        """
+        # Moments of the training rows of each fold, i.e. every other fold merged.
+        training = []
+        for fold in range(len(folds)):
+            merged = RunningMoments(len(folds[fold].mean))
+            for other, moments in enumerate(folds):
+                if other != fold:
+                    merged = merged.merge(moments)
+            training.append(merged)
+
+        candidates = []
+        for l1_ratio in unique_grid(self.config.l1_ratio, "l1_ratio"):
+            for alpha in unique_grid(self.config.alpha, "alpha"):
+                rmse = []
+                for fold, moments in enumerate(folds):
+                    coef, intercept, _ = training[fold].fit_elastic_net(alpha, l1_ratio)
+                    rmse.append(np.sqrt(moments.mse(coef, intercept)))
+                candidates.append({"alpha": float(alpha), "l1_ratio": float(l1_ratio),
+                                   "cv_rmse_mean": float(np.mean(rmse)), "cv_rmse_std": float(np.std(rmse))})
+
+        candidates.sort(key=lambda candidate: candidate["cv_rmse_mean"])
+        for rank, candidate in enumerate(candidates, start=1):
+            candidate["rank"] = rank
+        return {"best": {"alpha": candidates[0]["alpha"], "l1_ratio": candidates[0]["l1_ratio"]},
+                "cv": len(folds), "candidates": candidates}
+
+    def save_model(self, model):
+        """
+        Saves the trained model with joblib and exports the NumPy-only scorer used for serving.
+
+        Args:
+            model: Fitted ElasticNet model, or a Pipeline of a FeaturePreprocessor and an ElasticNet model.
+        """
+        # Saving the trained model using joblib in the specified root directory, replacing it atomically so the
+        # registry and the server never read a half-written artifact.
+        path = os.path.join(self.config.root_dir, self.config.model_name)
+        joblib.dump(model, path + ".tmp")
+        os.replace(path + ".tmp", path)
+
+        # Exporting the NumPy-only scorer used for serving.
+        self.export_linear_model(model)
+
+    def select_hyperparameters(self, train_x, train_y):
+        """
+        Selects alpha and l1_ratio, running a cross-validated search when params.yaml lists several candidates,
+        and writes the leaderboard next to the evaluation metrics.
+
+        Args:
+            train_x: Training features.
+            train_y: Training target.
+
+        Returns:
+            tuple: Selected (alpha, l1_ratio).
+        """
+        if len(self.config.alpha) == 1 and len(self.config.l1_ratio) == 1:
+            alpha, l1_ratio = self.config.alpha[0], self.config.l1_ratio[0]
+            leaderboard = {"best": {"alpha": alpha, "l1_ratio": l1_ratio}, "cv": None, "candidates": []}
+        else:
+            search = ElasticNetSearch(
+                alphas=self.config.alpha,
+                l1_ratios=self.config.l1_ratio,
+                cv=self.config.search_cv,
+                n_jobs=self.config.search_n_jobs,
+                random_state=self.config.search_random_state
+            )
+            leaderboard = search.fit(train_x, train_y)
+            alpha, l1_ratio = leaderboard["best"]["alpha"], leaderboard["best"]["l1_ratio"]
+            logger.info(f"Best hyperparameters: alpha={alpha}, l1_ratio={l1_ratio}")
+
+        save_json(path=Path(self.config.leaderboard_file), data=leaderboard)
+        return alpha, l1_ratio
+
+    def export_linear_model(self, model):
+        """
+        Writes the coefficients, intercept and feature order of a fitted linear model to a NumPy-only artifact.
+
+        Args:
+            model: Fitted linear model exposing coef_ and intercept_.
+        """
+        path = os.path.join(self.config.root_dir, self.config.linear_model_name)
+        LinearScorer.from_estimator(model, self.config.feature_columns).save(path)
+        logger.info(f"Linear model exported to: {path}")
@@ -0,0 +1,146 @@
+import numpy as np
+from sklearn.base import BaseEstimator, TransformerMixin
+from mlproject.components.sufficient_statistics import RunningMoments
+
+# Purpose: Definition of the FeaturePreprocessor class: log transforms, standardization and PCA fitted from
+# moments, so they can be folded into the coefficients of a linear model.
+
+
+class FeaturePreprocessor(BaseEstimator, TransformerMixin):
+    def __init__(self, feature_columns=(), log_columns=(), standardize=False, pca_components=None):
+        """
+        Initializes the preprocessing of the model features.
+
+        Features are transformed in three steps: log1p of the log_columns, standardization to zero mean and
+        unit variance, and projection on the first pca_components principal components. Everything after the
+        log transform is affine, z = log1p(x) @ A + c, so a linear model fitted on z is the linear model
+        (A @ coef, c @ coef + intercept) on log1p(x); see fold.
+
+        Args:
+            feature_columns: Feature names in the order of the model input.
+            log_columns: Features replaced by log1p(x), for right-skewed columns.
+            standardize (bool, optional): Scale the features to zero mean and unit variance. Defaults to False.
+            pca_components (int, optional): Number of principal components kept; None keeps the features.
+        """
+        self.feature_columns = feature_columns
+        self.log_columns = log_columns
+        self.standardize = standardize
+        self.pca_components = pca_components
+
+    def log_transform(self, X):
+        """
+        Applies log1p to the log columns.
+
+        Args:
+            X: Feature matrix, or a DataFrame holding the feature columns.
+
+        Returns:
+            np.ndarray: float64 feature matrix with the log columns transformed.
+        """
+        if hasattr(X, "columns"):
+            X = X[list(self.feature_columns)]
+        X = np.array(X, dtype=np.float64)
+        mask = np.isin(np.asarray(self.feature_columns, dtype=object), list(self.log_columns))
+        if mask.any():
+            X[:, mask] = np.log1p(X[:, mask])
+        return X
+
+    def fit(self, X, y=None):
+        """
+        Fits the standardization and PCA on a feature matrix.
+
+        Args:
+            X: Feature matrix, or a DataFrame holding the feature columns.
+            y: Ignored.
+
+        Returns:
+            FeaturePreprocessor: self.
+        """
+        return self.fit_moments(RunningMoments(len(self.feature_columns)).update(self.log_transform(X)))
+
+    def fit_moments(self, moments: RunningMoments):
+        """
+        Fits the standardization and PCA from the running moments of the log-transformed features.
+
+        Args:
+            moments (RunningMoments): Moments whose first columns are the log-transformed features; further
+                columns (e.g. the target) are ignored.
+
+        Returns:
+            FeaturePreprocessor: self.
+        """
+        n_features = len(self.feature_columns)
+        mean = moments.mean[:n_features]
+        covariance = moments.comoment[:n_features, :n_features] / moments.n
+
+        self.log_mask_ = np.isin(np.asarray(self.feature_columns, dtype=object), list(self.log_columns))
+        self.mean_ = mean.copy()
+        if self.standardize:
+            scale = np.sqrt(np.diag(covariance))
+            self.scale_ = np.where(scale > 0, scale, 1.0)
+        else:
+            self.scale_ = np.ones(n_features)
+
+        if self.pca_components:
+            # Principal axes of the (standardized) features, by decreasing explained variance.
+            variances, axes = np.linalg.eigh(covariance / np.outer(self.scale_, self.scale_))
+            order = np.argsort(variances)[::-1][:self.pca_components]
+            self.explained_variance_ = variances[order]
+            projection = axes[:, order]
+        else:
+            projection = np.eye(n_features)
+
+        # z = ((x - mean) / scale) @ projection = x @ A + c
+        self.A_ = projection / self.scale_[:, None]
+        self.c_ = -mean @ self.A_
+        self.n_features_in_ = n_features
+        return self
+
+    def transform(self, X):
+        """
+        Transforms a feature matrix.
+
+        Args:
+            X: Feature matrix, or a DataFrame holding the feature columns.
+
+        Returns:
+            np.ndarray: Transformed features.
+        """
+        return self.log_transform(X) @ self.A_ + self.c_
+
+    def transform_moments(self, moments: RunningMoments) -> RunningMoments:
+        """
+        Maps the moments of [log-transformed features | target] to the moments of [transformed features | target].
+
+        Args:
+            moments (RunningMoments): Moments of the log-transformed features followed by the target.
+
+        Returns:
+            RunningMoments: Moments of the transformed features followed by the target.
+        """
+        n_features, n_outputs = self.A_.shape
+        # The affine map of the whole row: the target is kept as is.
+        T = np.zeros((n_features + 1, n_outputs + 1))
+        T[:n_features, :n_outputs] = self.A_
+        T[n_features, n_outputs] = 1.0
+        shift = np.append(self.c_, 0.0)
+
+        transformed = RunningMoments(n_outputs + 1)
+        transformed.n = moments.n
+        transformed.mean = moments.mean @ T + shift
+        transformed.comoment = T.T @ moments.comoment @ T
+        return transformed
+
+    def fold(self, coef, intercept: float):
+        """
+        Folds the affine part of the preprocessing into the parameters of a linear model fitted on its output.
+
+        Args:
+            coef: Coefficients of the model on the transformed features.
+            intercept (float): Intercept of the model.
+
+        Returns:
+            tuple: (coefficients, intercept) of the same model on the log-transformed features.
+        """
+        coef = np.ravel(coef)
+        return self.A_ @ coef, float(self.c_ @ coef + np.ravel(intercept)[0])
@@ -0,0 +1,118 @@
+import numpy as np
+
+# Purpose: Definition of the RunningMoments class, which accumulates the sufficient statistics of a linear
+# model chunk by chunk and fits an ElasticNet from them without holding the data in memory.
+
+
+class RunningMoments:
+    def __init__(self, n_columns: int):
+        """
+        Initializes empty running moments of a matrix Z = [X | y] with n_columns columns.
+
+        Chunks are combined with the pairwise update of Chan et al., which stays numerically stable where
+        accumulating raw sums of squares would not.
+
+        Args:
+            n_columns (int): Number of features plus one for the target.
+        """
+        self.n = 0
+        self.mean = np.zeros(n_columns)
+        self.comoment = np.zeros((n_columns, n_columns))  # Sum of outer products of the centered rows.
+
+    def update(self, Z):
+        """
+        Adds a chunk of rows.
+
+        Args:
+            Z: Chunk of shape (n_rows, n_columns), features first and the target last.
+
+        Returns:
+            RunningMoments: self, for chaining.
+        """
+        Z = np.asarray(Z, dtype=np.float64)
+        if len(Z) == 0:
+            return self
+
+        chunk = RunningMoments(Z.shape[1])
+        chunk.n = len(Z)
+        chunk.mean = Z.mean(axis=0)
+        centered = Z - chunk.mean
+        chunk.comoment = centered.T @ centered
+        return self._absorb(chunk)
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        """
+        Returns the moments of the union of this data and other's, leaving both unchanged.
+
+        Args:
+            other (RunningMoments): Moments of another set of rows.
+
+        Returns:
+            RunningMoments: Combined moments.
+        """
+        merged = RunningMoments(len(self.mean))
+        merged.n, merged.mean, merged.comoment = self.n, self.mean.copy(), self.comoment.copy()
+        return merged._absorb(other)
+
+    def _absorb(self, other: "RunningMoments") -> "RunningMoments":
+        """Adds other's moments to this object in place."""
+        if other.n == 0:
+            return self
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.comoment = self.comoment + other.comoment + np.outer(delta, delta) * (self.n * other.n / n)
+        self.mean = self.mean + delta * (other.n / n)
+        self.n = n
+        return self
+
+    def fit_elastic_net(self, alpha: float, l1_ratio: float, tol: float = 1e-10, max_iter: int = 10000):
+        """
+        Fits an ElasticNet (same objective as sklearn.linear_model.ElasticNet with an intercept) from the moments.
+
+        Coordinate descent runs on the feature covariance matrix, whose size depends only on the number of
+        features, so the cost does not depend on the number of rows.
+
+        Args:
+            alpha (float): Regularization strength.
+            l1_ratio (float): Mixing parameter of the elastic net penalty.
+            tol (float, optional): Stops when no coefficient moves more than tol. Defaults to 1e-10.
+            max_iter (int, optional): Largest number of passes over the coefficients. Defaults to 10000.
+
+        Returns:
+            tuple: (coef, intercept, n_iter).
+        """
+        covariance = self.comoment[:-1, :-1] / self.n
+        target_covariance = self.comoment[:-1, -1] / self.n
+        l1, l2 = alpha * l1_ratio, alpha * (1.0 - l1_ratio)
+
+        coef = np.zeros(len(covariance))
+        n_iter = 0
+        for n_iter in range(1, max_iter + 1):
+            max_step = 0.0
+            for j in range(len(coef)):
+                # Correlation of feature j with the residual that excludes feature j's own contribution.
+                rho = target_covariance[j] - covariance[j] @ coef + covariance[j, j] * coef[j]
+                denominator = covariance[j, j] + l2
+                new = np.sign(rho) * max(abs(rho) - l1, 0.0) / denominator if denominator > 0 else 0.0
+                max_step = max(max_step, abs(new - coef[j]))
+                coef[j] = new
+            if max_step <= tol:
+                break
+
+        intercept = self.mean[-1] - self.mean[:-1] @ coef
+        return coef, float(intercept), n_iter
+
+    def mse(self, coef, intercept: float) -> float:
+        """
+        Mean squared error of a linear model on the rows these moments summarize, computed from the moments alone.
+
+        Args:
+            coef: Model coefficients.
+            intercept (float): Model intercept.
+
+        Returns:
+            float: Mean squared error.
+        """
+        w = np.append(-np.asarray(coef, dtype=np.float64), 1.0)  # Residual = Z @ w - intercept.
+        bias = self.mean @ w - intercept
+        return float(w @ self.comoment @ w / self.n + bias ** 2)
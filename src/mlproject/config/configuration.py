@@ -1,13 +1,18 @@
 # Purpose: Main script or module for the machine learning project.
 
 # Importing constants and utility functions from mlproject package.
+import os
 from mlproject.constants import *
-from mlproject.utils.common import read_yaml,create_directories
+from mlproject.utils.common import read_yaml,create_directories,expand_grid,dataset_path
 from mlproject.entity.config_entity import (DataIngestionConfig,
                                             DataValidationConfig,
                                             DataTransformationConfig,
                                             ModelTrainerConfig,
-                                            ModelEvaluationConfig)
+                                            CrossValidationConfig,
+                                            ModelEvaluationConfig,
+                                            ModelRegistryConfig,
+                                            PredictionConfig,
+                                            ProfilingConfig)
 
 # Purpose: Definition of the ConfigurationManager class for managing project configurations.
 
@@ -33,6 +38,16 @@ class ConfigurationManager:
         # Creating the root directory for project artifacts.
         create_directories([self.config.artifacts_root])
 
+    def get_feature_columns(self) -> tuple:
+        """
+        Retrieves the feature columns, i.e. every schema column except the target, in schema order.
+
+        Returns:
+            tuple: Feature column names.
+        """
+        target_column = self.schema.TARGET_COLUMN.name
+        return tuple(col for col in self.schema.COLUMNS.keys() if col != target_column)
+
     def get_data_ingestion_config(self) -> DataIngestionConfig:
         """
         Gets the configuration for data ingestion.
@@ -51,7 +66,10 @@ class ConfigurationManager:
             root_dir=config.root_dir,
             source_URL=config.source_URL,
             local_data_file=config.local_data_file,
-            unzip_dir=config.unzip_dir
+            unzip_dir=config.unzip_dir,
+            manifest_file=config.manifest_file,
+            source_sha256=config.source_sha256,
+            partitions_dir=config.partitions_dir
         )
 
         return data_ingestion_config
@@ -76,8 +94,12 @@ class ConfigurationManager:
         data_validation_config = DataValidationConfig(
             root_dir=config.root_dir,
             STATUS_FILE=config.STATUS_FILE,
-            unzip_data_dir=config.unzip_data_dir,
             all_schema=schema,
+            REPORT_FILE=config.REPORT_FILE,
+            bounds=self.schema.get("BOUNDS", {}),
+            chunk_size=config.chunk_size,
+            partitions_dir=config.partitions_dir,
+            partition_cache_file=config.partition_cache_file,
         )
 
         return data_validation_config
@@ -98,7 +120,15 @@ class ConfigurationManager:
         # Creating a DataTransformationConfig object with the extracted configuration.
         data_transformation_config = DataTransformationConfig(
             root_dir=config.root_dir,
-            data_path=config.data_path,
+            partitions_dir=config.partitions_dir,
+            partition_cache_file=config.partition_cache_file,
+            split_manifest_file=config.split_manifest_file,
+            split_strategy=config.split.strategy,
+            test_size=config.split.test_size,
+            random_state=config.split.random_state,
+            stratify_column=config.split.stratify_column,
+            artifact_format=self.config.artifact_format,
+            all_schema=self.schema.COLUMNS,
         )
 
         return data_transformation_config
@@ -114,25 +144,73 @@ class ConfigurationManager:
         # Extracting model trainer configuration, ElasticNet parameters, and target column from the overall project configuration.
         config = self.config.model_trainer
         params = self.params.ElasticNet
+        search = self.params.search
+        preprocessing = self.params.preprocessing
         schema = self.schema.TARGET_COLUMN
 
-        # Creating the root directory for model training artifacts.
-        create_directories([config.root_dir])
+        # Creating the root directories for model training artifacts and the leaderboard.
+        create_directories([config.root_dir, os.path.dirname(config.leaderboard_file), config.moments_cache_dir])
 
         # Creating a ModelTrainerConfig object with the extracted configuration.
         model_trainer_config = ModelTrainerConfig(
             root_dir=config.root_dir,
-            train_data_path=config.train_data_path,
-            test_data_path=config.test_data_path,
+            train_data_path=dataset_path(config.train_data_path, self.config.artifact_format),
+            test_data_path=dataset_path(config.test_data_path, self.config.artifact_format),
+            artifact_format=self.config.artifact_format,
             model_name=config.model_name,
-            alpha=params.alpha,
-            l1_ratio=params.l1_ratio,
-            target_column=schema.name
+            linear_model_name=config.linear_model_name,
+            leaderboard_file=config.leaderboard_file,
+            alpha=tuple(expand_grid(params.alpha)),
+            l1_ratio=tuple(expand_grid(params.l1_ratio)),
+            target_column=schema.name,
+            feature_columns=self.get_feature_columns(),
+            search_cv=search.cv,
+            search_n_jobs=search.n_jobs,
+            search_random_state=search.random_state,
+            training_mode=self.params.training.mode,
+            chunk_size=self.params.training.chunk_size,
+            partitions_dir=config.partitions_dir,
+            moments_cache_dir=config.moments_cache_dir,
+            log_columns=tuple(preprocessing.log_columns),
+            standardize=preprocessing.standardize,
+            pca_components=preprocessing.pca_components
         )
 
         return model_trainer_config
 
 
+    def get_cross_validation_config(self) -> CrossValidationConfig:
+        """
+        Retrieves the configuration for cross-validation.
+
+        Returns:
+            CrossValidationConfig: Data class containing cross-validation configuration.
+        """
+        # Extracting cross-validation configuration and target column from the overall project configuration.
+        config = self.config.cross_validation
+        schema = self.schema.TARGET_COLUMN
+
+        # Creating the root directory for cross-validation artifacts.
+        create_directories([config.root_dir])
+
+        # Creating a CrossValidationConfig object with the extracted configuration.
+        cross_validation_config = CrossValidationConfig(
+            root_dir=config.root_dir,
+            train_data_path=dataset_path(config.train_data_path, self.config.artifact_format),
+            artifact_format=self.config.artifact_format,
+            model_path=config.model_path,
+            metric_file_name=config.metric_file_name,
+            target_column=schema.name,
+            feature_columns=self.get_feature_columns(),
+            n_splits=config.n_splits,
+            n_repeats=config.n_repeats,
+            random_state=config.random_state,
+            n_workers=config.n_workers
+        )
+
+        return cross_validation_config
+
+
     def get_model_evaluation_config(self) -> ModelEvaluationConfig:
         """
         Retrieves the configuration for model evaluation.
@@ -151,12 +229,120 @@ class ConfigurationManager:
         # Creating a ModelEvaluationConfig object with the extracted configuration.
         model_evaluation_config = ModelEvaluationConfig(
             root_dir=config.root_dir,
-            test_data_path=config.test_data_path,
+            test_data_path=dataset_path(config.test_data_path, self.config.artifact_format),
+            artifact_format=self.config.artifact_format,
             model_path=config.model_path,
             all_params=params,
             metric_file_name=config.metric_file_name,
-            target_column=schema.name
+            target_column=schema.name,
+            chunk_size=config.chunk_size,
+            n_bootstrap=config.n_bootstrap,
+            confidence_level=config.confidence_level,
+            random_state=config.random_state
         )
 
         return model_evaluation_config
 
+
+    def get_model_registry_config(self) -> ModelRegistryConfig:
+        """
+        Retrieves the configuration for the model registry.
+
+        Returns:
+            ModelRegistryConfig: Data class containing model registry configuration.
+        """
+        # Extracting model registry configuration and the training parameters stored with every version.
+        config = self.config.model_registry
+        promotion = config.promotion
+        artifact_format = self.config.artifact_format
+
+        # Creating the root directory of the registry.
+        create_directories([config.root_dir])
+
+        # Creating a ModelRegistryConfig object with the extracted configuration.
+        model_registry_config = ModelRegistryConfig(
+            root_dir=config.root_dir,
+            model_path=config.model_path,
+            linear_model_path=config.linear_model_path,
+            metric_file_name=config.metric_file_name,
+            cv_metric_file_name=config.cv_metric_file_name,
+            report_file=config.report_file,
+            data_files=(dataset_path(self.config.model_trainer.train_data_path, artifact_format),
+                        dataset_path(self.config.model_trainer.test_data_path, artifact_format),
+                        self.config.data_transformation.split_manifest_file),
+            all_params={key: self.params.get(key) for key in ("ElasticNet", "search", "preprocessing", "training")},
+            auto_promote=promotion.auto_promote,
+            gate_metric=promotion.metric,
+            gate_mode=promotion.mode,
+            min_improvement=promotion.min_improvement,
+            threshold=promotion.threshold
+        )
+
+        return model_registry_config
+
+
+    def get_prediction_config(self) -> PredictionConfig:
+        """
+        Retrieves the configuration for serving predictions.
+
+        Returns:
+            PredictionConfig: Data class containing prediction configuration.
+        """
+        # Extracting prediction, cache, variant and ASGI configuration from the overall project configuration.
+        config = self.config.prediction
+        cache = config.get("cache", {})
+        variants = config.get("variants", {})
+        asgi = config.get("asgi", {})
+
+        # Creating a PredictionConfig object with the extracted configuration.
+        prediction_config = PredictionConfig(
+            model_path=config.model_path,
+            linear_model_path=config.linear_model_path,
+            feature_columns=self.get_feature_columns(),
+            max_batch_rows=config.max_batch_rows,
+            chunk_size=config.chunk_size,
+            micro_batching=config.micro_batching.enabled,
+            micro_batch_wait_ms=config.micro_batching.max_wait_ms,
+            micro_batch_rows=config.micro_batching.max_batch_rows,
+            registry_dir=config.get("registry_dir"),
+            model_version=config.get("model_version", "current"),
+            cache=cache.get("enabled", False),
+            cache_max_entries=cache.get("max_entries", 100000),
+            cache_ttl_seconds=cache.get("ttl_seconds", 3600.0),
+            cache_decimals=cache.get("decimals", 6),
+            variants=variants.get("enabled", False),
+            variant_routes=tuple(dict(route) for route in variants.get("routes", [])),
+            shadow_version=variants.get("shadow"),
+            shadow_queue_size=variants.get("shadow_queue_size", 1000),
+            async_workers=asgi.get("workers", 4),
+            async_max_pending=asgi.get("max_pending", 2048),
+            max_body_bytes=int(config.get("max_body_mb", 64) * 2 ** 20)
+        )
+
+        return prediction_config
+
+
+    def get_profiling_config(self) -> ProfilingConfig:
+        """
+        Retrieves the configuration for profiling stages and requests.
+
+        Returns:
+            ProfilingConfig: Data class containing profiling configuration.
+        """
+        # Extracting profiling configuration; profiling stays off when the section is missing.
+        config = self.config.get("profiling", {})
+
+        # Creating a ProfilingConfig object with the extracted configuration.
+        profiling_config = ProfilingConfig(
+            output_dir=config.get("output_dir", "artifacts/profiles"),
+            mode=config.get("mode", "cprofile"),
+            stages=config.get("stages", False),
+            request_sample_rate=config.get("request_sample_rate", 0.0),
+            allow_query_flag=config.get("allow_query_flag", False),
+            sampling_interval_ms=config.get("sampling_interval_ms", 1),
+            trace_memory=config.get("trace_memory", True),
+            trace_memory_requests=config.get("trace_memory_requests", False),
+            top_allocations=config.get("top_allocations", 25)
+        )
+
+        return profiling_config
@@ -13,6 +13,9 @@ class DataIngestionConfig:
     source_URL: str            # URL from which the data will be downloaded.
     local_data_file: Path      # Local path to store the downloaded data file.
     unzip_dir: Path            # Directory where the downloaded data will be extracted.
+    manifest_file: Path        # Manifest of the source's ETag/size/SHA-256 and the extracted members' CRCs.
+    source_sha256: str         # Expected SHA-256 of the source archive, or None to skip the check.
+    partitions_dir: Path       # Directory of the append-only partitions of new rows.
 
 
 @dataclass(frozen=True)
@@ -23,13 +26,21 @@ class DataValidationConfig:
     Attributes:
         root_dir (Path): Root directory for data validation artifacts.
         STATUS_FILE (str): Path to the status file for recording validation status.
-        unzip_data_dir (Path): Directory path of the data file for validation.
         all_schema (dict): Dictionary containing the schema for validation.
+        REPORT_FILE (str): Path to the JSON validation report.
+        bounds (dict): Column name -> {min, max} allowed value range.
+        chunk_size (int): Number of rows read per chunk.
+        partitions_dir (Path): Directory of the append-only data partitions to validate.
+        partition_cache_file (Path): JSON file caching the statistics of partitions already validated.
     """
     root_dir: Path
     STATUS_FILE: str
-    unzip_data_dir: Path
     all_schema: dict
+    REPORT_FILE: str
+    bounds: dict
+    chunk_size: int
+    partitions_dir: Path
+    partition_cache_file: Path
 
 
 @dataclass(frozen=True)
@@ -39,10 +50,26 @@ class DataTransformationConfig:
 
     Attributes:
         root_dir (Path): Root directory for data transformation artifacts.
-        date_path (Path): Path to the input data file for transformation.
+        partitions_dir (Path): Directory of the append-only data partitions to split.
+        partition_cache_file (Path): JSON file recording the partitions already split.
+        split_manifest_file (Path): CSV file mapping the hash of every row to its split.
+        split_strategy (str): 'hash', 'random' or 'stratified'.
+        test_size (float): Fraction of rows assigned to the test split.
+        random_state (int): Seed of the random and stratified strategies.
+        stratify_column (str): Column whose classes are split proportionally by the stratified strategy.
+        artifact_format (str): Format of the train/test datasets: csv, parquet, feather or npy.
+        all_schema (dict): Column name -> dtype, as declared in schema.yaml.
     """
     root_dir: Path
-    data_path: Path
+    partitions_dir: Path
+    partition_cache_file: Path
+    split_manifest_file: Path
+    split_strategy: str
+    test_size: float
+    random_state: int
+    stratify_column: str
+    artifact_format: str
+    all_schema: dict
 
 
 @dataclass(frozen=True)
@@ -52,20 +79,79 @@ class ModelTrainerConfig:
 
     Attributes:
         root_dir (Path): Root directory for model training artifacts.
-        train_data_path (Path): Path to the training data CSV file.
-        test_data_path (Path): Path to the test data CSV file.
+        train_data_path (Path): Path to the training dataset.
+        test_data_path (Path): Path to the test dataset.
+        artifact_format (str): Format of the train/test datasets: csv, parquet, feather or npy.
         model_name (str): File name for saving the trained machine learning model.
-        alpha (float): Regularization strength for models that support regularization.
-        l1_ratio (float): The mixing parameter for elastic net regularization.
+        linear_model_name (str): File name for the NumPy-only export of the trained linear model.
+        leaderboard_file (Path): Path of the JSON file ranking the hyperparameter candidates.
+        alpha (tuple): Candidate regularization strengths.
+        l1_ratio (tuple): Candidate mixing parameters for elastic net regularization.
         target_column (str): Name of the target column in the dataset.
+        feature_columns (tuple): Feature column names in schema.yaml order.
+        search_cv (int): Number of cross-validation folds used to rank candidates.
+        search_n_jobs (int): Worker processes used by the search; -1 uses every core.
+        search_random_state (int): Seed of the cross-validation fold assignment.
+        training_mode (str): 'in_memory' or 'streaming' (chunked, out-of-core fit).
+        chunk_size (int): Rows per chunk in streaming mode.
+        partitions_dir (Path): Directory of the per-partition training splits.
+        moments_cache_dir (Path): Directory caching the moments of each partition in streaming mode.
+        log_columns (tuple): Features replaced by log1p(x) before the fit.
+        standardize (bool): Scale the features to zero mean and unit variance before the fit.
+        pca_components (int): Number of principal components kept, or None to keep every feature.
     """
     root_dir: Path
     train_data_path: Path
     test_data_path: Path
+    artifact_format: str
     model_name: str
-    alpha: float
-    l1_ratio: float
+    linear_model_name: str
+    leaderboard_file: Path
+    alpha: tuple
+    l1_ratio: tuple
     target_column: str
+    feature_columns: tuple
+    search_cv: int
+    search_n_jobs: int
+    search_random_state: int
+    training_mode: str
+    chunk_size: int
+    partitions_dir: Path
+    moments_cache_dir: Path
+    log_columns: tuple
+    standardize: bool
+    pca_components: int
+
+
+@dataclass(frozen=True)
+class CrossValidationConfig:
+    """
+    Data class for configuration related to cross-validation.
+
+    Attributes:
+        root_dir (Path): Root directory for cross-validation artifacts.
+        train_data_path (Path): Path to the training dataset.
+        artifact_format (str): Format of the training dataset: csv, parquet, feather or npy.
+        model_path (Path): Path to the trained model whose hyperparameters are cross-validated.
+        metric_file_name (Path): File name for saving per-fold metrics and their summary.
+        target_column (str): Name of the target column in the dataset.
+        feature_columns (tuple): Feature column names in schema.yaml order.
+        n_splits (int): Number of folds.
+        n_repeats (int): Number of repetitions of the k-fold split.
+        random_state (int): Seed of the fold assignment.
+        n_workers (int): Worker processes; -1 uses every core.
+    """
+    root_dir: Path
+    train_data_path: Path
+    artifact_format: str
+    model_path: Path
+    metric_file_name: Path
+    target_column: str
+    feature_columns: tuple
+    n_splits: int
+    n_repeats: int
+    random_state: int
+    n_workers: int
 
 
 @dataclass(frozen=True)
@@ -75,15 +161,138 @@ class ModelEvaluationConfig:
 
     Attributes:
         root_dir (Path): Root directory for model evaluation artifacts.
-        test_data_path (Path): Path to the test data CSV file.
+        test_data_path (Path): Path to the test dataset.
+        artifact_format (str): Format of the test dataset: csv, parquet, feather or npy.
         model_path (Path): Path to the trained machine learning model.
         all_params (dict): Dictionary containing all relevant parameters for model evaluation.
         metric_file_name (Path): File name for saving model evaluation metrics.
         target_column (str): Name of the target column in the dataset.
+        chunk_size (int): Number of test rows scored per chunk.
+        n_bootstrap (int): Bootstrap replicates for the metric confidence intervals.
+        confidence_level (float): Coverage of the bootstrap confidence intervals.
+        random_state (int): Seed of the bootstrap resampling.
     """
     root_dir: Path
     test_data_path: Path
+    artifact_format: str
     model_path: Path
     all_params: dict
     metric_file_name: Path
     target_column: str
+    chunk_size: int
+    n_bootstrap: int
+    confidence_level: float
+    random_state: int
+
+
+@dataclass(frozen=True)
+class ModelRegistryConfig:
+    """
+    Data class for configuration related to the model registry.
+
+    Attributes:
+        root_dir (Path): Root directory of the registry.
+        model_path (Path): Path to the trained model registered as a new version.
+        linear_model_path (Path): Path to the NumPy-only scorer registered with it.
+        metric_file_name (Path): Evaluation metrics stored with the version and used by the promotion gate.
+        cv_metric_file_name (Path): Cross-validation metrics stored with the version.
+        report_file (Path): JSON report of the registered version and the promotion decision.
+        data_files (tuple): Data files fingerprinted in the version metadata.
+        all_params (dict): Training parameters stored with the version.
+        auto_promote (bool): Whether a version passing the gate is promoted.
+        gate_metric (str): Evaluation metric compared by the gate.
+        gate_mode (str): 'min' when lower values are better, 'max' otherwise.
+        min_improvement (float): Required improvement over the current version.
+        threshold (float): Worst acceptable value of the gate metric, or None.
+    """
+    root_dir: Path
+    model_path: Path
+    linear_model_path: Path
+    metric_file_name: Path
+    cv_metric_file_name: Path
+    report_file: Path
+    data_files: tuple
+    all_params: dict
+    auto_promote: bool
+    gate_metric: str
+    gate_mode: str
+    min_improvement: float
+    threshold: float
+
+
+@dataclass(frozen=True)
+class PredictionConfig:
+    """
+    Data class for configuration related to serving predictions.
+
+    Attributes:
+        model_path (Path): Path to the trained machine learning model.
+        linear_model_path (Path): Path to the NumPy-only scorer, used instead of model_path when present.
+        feature_columns (tuple): Feature column names in the order the model expects them.
+        max_batch_rows (int): Largest number of rows accepted by a single batch request.
+        chunk_size (int): Number of rows scored per model.predict call.
+        micro_batching (bool): Whether concurrent single-row requests are coalesced into one model call.
+        micro_batch_wait_ms (float): Longest time a queued request waits for other requests to join its batch.
+        micro_batch_rows (int): Largest number of rows scored in one coalesced call.
+        registry_dir (Path): Model registry directory, or None to always serve model_path/linear_model_path.
+        model_version (str): 'current' to follow the promoted version, or a version name to pin it.
+        cache (bool): Whether predictions are cached per row.
+        cache_max_entries (int): Largest number of cached rows.
+        cache_ttl_seconds (float): Lifetime of a cached prediction, or None.
+        cache_decimals (int): Decimal places the features are rounded to in cache keys.
+        variants (bool): Whether /predict traffic is split between the variant routes.
+        variant_routes (tuple): Name, registry version and weight of each routed variant.
+        shadow_version (str): Registry version shadow-scoring every /predict request, or None.
+        shadow_queue_size (int): Largest number of pending shadow requests.
+        async_workers (int): Inference threads of the ASGI entry point.
+        async_max_pending (int): Requests waiting for or running inference in the ASGI entry point.
+        max_body_bytes (int): Largest request body accepted by the web app.
+    """
+    model_path: Path
+    linear_model_path: Path
+    feature_columns: tuple
+    max_batch_rows: int
+    chunk_size: int
+    micro_batching: bool
+    micro_batch_wait_ms: float
+    micro_batch_rows: int
+    registry_dir: Path = None
+    model_version: str = "current"
+    cache: bool = False
+    cache_max_entries: int = 100000
+    cache_ttl_seconds: float = 3600.0
+    cache_decimals: int = 6
+    variants: bool = False
+    variant_routes: tuple = ()
+    shadow_version: str = None
+    shadow_queue_size: int = 1000
+    async_workers: int = 4
+    async_max_pending: int = 2048
+    max_body_bytes: int = 64 * 2 ** 20
+
+
+@dataclass(frozen=True)
+class ProfilingConfig:
+    """
+    Data class for configuration related to profiling.
+
+    Attributes:
+        output_dir (Path): Root directory of the profiles.
+        mode (str): 'cprofile' or 'sampling'.
+        stages (bool): Whether every training stage is profiled.
+        request_sample_rate (float): Share of prediction requests profiled.
+        allow_query_flag (bool): Whether clients may force a request profile with ?profile=1.
+        sampling_interval_ms (float): Interval between stack samples in sampling mode.
+        trace_memory (bool): Whether allocations are recorded with tracemalloc in stage profiles.
+        trace_memory_requests (bool): Whether allocations are recorded with tracemalloc in request profiles.
+        top_allocations (int): Number of allocation sites kept per profile.
+    """
+    output_dir: Path
+    mode: str
+    stages: bool
+    request_sample_rate: float
+    allow_query_flag: bool
+    sampling_interval_ms: float
+    trace_memory: bool
+    trace_memory_requests: bool
+    top_allocations: int
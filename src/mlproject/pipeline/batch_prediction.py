@@ -0,0 +1,189 @@
+# File: batch_prediction.py
+# Purpose: Definition of the BatchPredictionPipeline class for scoring many rows per request.
+
+import io  # In-memory byte streams for CSV bodies.
+import json  # JSON decoder for JSON and NDJSON bodies.
+from mlproject.entity.config_entity import PredictionConfig
+from mlproject.pipeline.prediction import PredictionPipeline
+
+
+class BatchTooLargeError(ValueError):
+    """Raised when a batch request holds more rows than the configured maximum."""
+
+
+class BatchPredictionPipeline:
+    def __init__(self, config: PredictionConfig, cache=None):
+        """
+        Initializes the BatchPredictionPipeline object with the provided configuration.
+
+        Args:
+            config (PredictionConfig): PredictionConfig object containing prediction settings.
+            cache (PredictionCache, optional): Per-row prediction cache consulted before scoring. Defaults to None.
+        """
+        self.config = config
+        self.cache = cache
+        self.columns = list(config.feature_columns)
+
+        # Rows may name their fields either like schema.yaml ('fixed acidity') or like the web form ('fixed_acidity').
+        self._aliases = {}
+        for col in self.columns:
+            self._aliases[col] = col
+            self._aliases[col.replace(" ", "_")] = col
+
+    def parse(self, body: bytes, content_type: str):
+        """
+        Parses a request body into one contiguous float64 feature matrix.
+
+        Supported bodies:
+            - application/json: a list of rows, or an object with an "instances" list.
+            - application/x-ndjson: one row per line.
+            - text/csv: a header row naming the feature columns followed by data rows.
+        A row is either an object keyed by feature name or a list of values in schema.yaml order.
+
+        Args:
+            body (bytes): Raw request body.
+            content_type (str): Content type of the request.
+
+        CSV and NDJSON bodies are read row by row and parsing stops as soon as the row limit is exceeded; a JSON
+        body is parsed whole, its size being bounded by prediction.max_body_mb.
+
+        Raises:
+            ValueError: If the body does not match the schema, or holds a boolean, NaN or infinite value.
+            BatchTooLargeError: If the body holds more rows than allowed.
+
+        Returns:
+            np.ndarray: Feature matrix of shape (n_rows, n_features).
+        """
+        content_type = (content_type or "").split(";")[0].strip().lower()
+
+        if content_type in ("text/csv", "application/csv"):
+            return self._parse_csv(body)
+
+        if content_type in ("application/x-ndjson", "application/ndjson", "application/jsonlines"):
+            rows = self._parse_ndjson(body)
+        elif content_type == "application/json":
+            rows = json.loads(body.decode("utf-8"))
+            if isinstance(rows, dict):
+                rows = rows.get("instances")
+            if not isinstance(rows, list):
+                raise ValueError("JSON body must be a list of rows or an object with an 'instances' list")
+        else:
+            raise ValueError(f"Unsupported content type: {content_type or 'missing'}")
+
+        self._check_size(rows)
+        return self._rows_to_matrix(rows)
+
+    def _check_size(self, rows):
+        """Rejects batches above the configured row limit."""
+        if len(rows) > self.config.max_batch_rows:
+            raise BatchTooLargeError(f"Batch has {len(rows)} rows, the maximum is {self.config.max_batch_rows}")
+        return rows
+
+    def _parse_ndjson(self, body: bytes) -> list:
+        """Parses an NDJSON body line by line, stopping once the row limit is exceeded."""
+        rows = []
+        for line in io.BytesIO(body):
+            if not line.strip():
+                continue
+            if len(rows) == self.config.max_batch_rows:
+                raise BatchTooLargeError(f"Batch has more than {self.config.max_batch_rows} rows, "
+                                         f"the maximum is {self.config.max_batch_rows}")
+            rows.append(json.loads(line))
+        return rows
+
+    def _parse_csv(self, body: bytes):
+        """Parses a CSV body with a header row into a feature matrix, reading at most one row past the limit."""
+        import numpy as np  # Numerical operations library, imported on first request.
+        import pandas as pd  # Only CSV bodies need pandas.
+
+        frame = pd.read_csv(io.BytesIO(body), nrows=self.config.max_batch_rows + 1)
+        if len(frame) > self.config.max_batch_rows:
+            raise BatchTooLargeError(f"Batch has more than {self.config.max_batch_rows} rows, "
+                                     f"the maximum is {self.config.max_batch_rows}")
+        frame.columns = [self._aliases.get(str(col).strip(), str(col).strip()) for col in frame.columns]
+
+        missing = [col for col in self.columns if col not in frame.columns]
+        if missing:
+            raise ValueError(f"Missing columns: {missing}")
+        booleans = [col for col in self.columns if pd.api.types.is_bool_dtype(frame[col])]
+        if booleans:
+            raise ValueError(f"Columns {booleans} hold booleans, expected numbers")
+
+        try:
+            matrix = np.ascontiguousarray(frame[self.columns].to_numpy(dtype=np.float64))
+        except ValueError as e:
+            raise ValueError(f"Non-numeric value in CSV body: {e}")
+        return self._check_finite(matrix)
+
+    def _rows_to_matrix(self, rows: list):
+        """Converts a list of row objects or row lists into a feature matrix."""
+        import numpy as np  # Numerical operations library, imported on first request.
+
+        n_features = len(self.columns)
+        matrix = np.empty((len(rows), n_features), dtype=np.float64)
+
+        for i, row in enumerate(rows):
+            if isinstance(row, dict):
+                values = {}
+                for key, value in row.items():
+                    col = self._aliases.get(key)
+                    if col is None:
+                        raise ValueError(f"Row {i}: unknown column '{key}'")
+                    values[col] = value
+                missing = [col for col in self.columns if col not in values]
+                if missing:
+                    raise ValueError(f"Row {i}: missing columns {missing}")
+                row = [values[col] for col in self.columns]
+            elif not isinstance(row, list) or len(row) != n_features:
+                raise ValueError(f"Row {i}: expected an object or a list of {n_features} values")
+
+            # NumPy would silently turn true/false into 1/0.
+            for col, value in zip(self.columns, row):
+                if isinstance(value, bool):
+                    raise ValueError(f"Row {i}: column '{col}' is a boolean, expected a number")
+            try:
+                matrix[i] = row
+            except (TypeError, ValueError):
+                raise ValueError(f"Row {i}: all values must be numeric")
+
+        return self._check_finite(matrix)
+
+    def _check_finite(self, matrix):
+        """Rejects NaN and infinite values (e.g. JSON NaN/Infinity or empty CSV cells), naming the first one."""
+        import numpy as np  # Numerical operations library, imported on first request.
+
+        finite = np.isfinite(matrix)
+        if not finite.all():
+            i, j = np.argwhere(~finite)[0]
+            raise ValueError(f"Row {i}: column '{self.columns[j]}' is {matrix[i, j]}, values must be finite")
+        return matrix
+
+    def predict(self, data):
+        """
+        Scores a feature matrix, calling the model once per chunk of rows.
+
+        Args:
+            data (np.ndarray): Feature matrix of shape (n_rows, n_features).
+
+        Returns:
+            np.ndarray: Predicted values, one per row.
+        """
+        import numpy as np  # Numerical operations library, imported on first request.
+
+        pipeline = PredictionPipeline(
+            model_path=self.config.model_path,
+            linear_model_path=self.config.linear_model_path,
+            registry_dir=self.config.registry_dir,
+            version=self.config.model_version,
+            cache=self.cache
+        )
+        chunk_size = self.config.chunk_size
+
+        if len(data) <= chunk_size:
+            return np.asarray(pipeline.predict(data)).ravel()
+
+        predictions = np.empty(len(data), dtype=np.float64)
+        for start in range(0, len(data), chunk_size):
+            stop = start + chunk_size
+            predictions[start:stop] = np.asarray(pipeline.predict(data[start:stop])).ravel()
+        return predictions
@@ -0,0 +1,398 @@
+# File: dag.py
+# Purpose: Runs the training stages as a DAG and skips stages whose inputs, parameters and outputs are unchanged.
+
+import os  # Operating system interface.
+import json  # Lock and report files.
+import time  # Stage timings.
+import hashlib  # Parameter fingerprints.
+import importlib  # Imports stage modules on demand.
+from dataclasses import dataclass  # Stage declarations.
+from pathlib import Path  # Object-oriented interface to filesystem paths.
+from mlproject import logger
+from mlproject.config.configuration import ConfigurationManager
+from mlproject.entity.config_entity import ProfilingConfig
+from mlproject.utils.common import file_sha256, dataset_path
+from mlproject.utils.partitions import index_path
+from mlproject.utils.instrumentation import metrics, snapshot_delta
+from mlproject.utils.profiling import Profiler
+
+
+class PipelineLockedError(RuntimeError):
+    """Raised when another process is already running the training pipeline."""
+
+
+class RunLock:
+    def __init__(self, path):
+        """
+        Exclusive OS-level lock on a file, held while a pipeline run is in progress.
+
+        The lock is taken with flock (msvcrt on Windows), so it also excludes runs in other processes, e.g.
+        other gunicorn workers or a main.py started by hand, and the OS releases it if its holder dies.
+
+        Args:
+            path (Path): Lock file; it holds the process id of the current holder.
+        """
+        self.path = Path(path)
+        self._file = None
+
+    @property
+    def held(self) -> bool:
+        """Whether this object holds the lock."""
+        return self._file is not None
+
+    def acquire(self) -> bool:
+        """
+        Takes the lock without waiting.
+
+        Returns:
+            bool: True if the lock was taken, False if another run holds it.
+        """
+        os.makedirs(self.path.parent, exist_ok=True)
+        f = open(self.path, "a+")
+        try:
+            if os.name == "nt":
+                import msvcrt  # Windows only, imported on use.
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl  # POSIX only, imported on use.
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            f.close()
+            return False
+        f.seek(0)
+        f.truncate()
+        f.write(str(os.getpid()))
+        f.flush()
+        self._file = f
+        return True
+
+    def release(self):
+        """Releases the lock if this object holds it."""
+        if self._file is None:
+            return
+        if os.name == "nt":
+            import msvcrt
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        self._file.close()  # Closing the file releases the flock.
+        self._file = None
+
+
+@dataclass(frozen=True)
+class PipelineStage:
+    """
+    Declaration of one training stage in the DAG.
+
+    Attributes:
+        name (str): Stage name, as logged by main.py.
+        module (str): Module defining the stage pipeline.
+        class_name (str): Name of the *TrainingPipeline class.
+        deps (tuple): Files the stage reads.
+        params (tuple): (file, key) pairs of the config.yaml/params.yaml/schema.yaml sections the stage depends on.
+        outs (tuple): Files the stage writes.
+        always_changed (bool): Run the stage on every run, for stages whose inputs cannot be fingerprinted
+            up front (e.g. a remote source); downstream stages still skip when its outs are unchanged.
+    """
+    name: str
+    module: str
+    class_name: str
+    deps: tuple
+    params: tuple
+    outs: tuple
+    always_changed: bool = False
+
+
+def build_stages(config_manager: ConfigurationManager) -> list:
+    """
+    Declares the seven training stages with their inputs and outputs taken from config/config.yaml.
+
+    Args:
+        config_manager (ConfigurationManager): Loaded project configuration.
+
+    Returns:
+        list: PipelineStage objects in execution order.
+    """
+    config = config_manager.config
+    train_data_path = str(dataset_path(config.model_trainer.train_data_path, config.artifact_format))
+    test_data_path = str(dataset_path(config.model_evaluation.test_data_path, config.artifact_format))
+    partition_index = str(index_path(config.data_ingestion.partitions_dir))
+
+    return [
+        PipelineStage(
+            name="Data Ingestion stage",
+            module="mlproject.pipeline.stage_01_data_ingestion",
+            class_name="DataIngestionTrainingPipeline",
+            deps=(),
+            params=(("config", "data_ingestion"),),
+            outs=(config.data_ingestion.manifest_file, partition_index),
+            always_changed=True,
+        ),
+        PipelineStage(
+            name="Data Validation stage",
+            module="mlproject.pipeline.stage_02_data_validation",
+            class_name="DataValidationTrainingPipeline",
+            deps=(partition_index,),
+            params=(("config", "data_validation"), ("schema", "COLUMNS"), ("schema", "BOUNDS")),
+            outs=(config.data_validation.STATUS_FILE, config.data_validation.REPORT_FILE),
+        ),
+        PipelineStage(
+            name="Data Transformation stage",
+            module="mlproject.pipeline.stage_03_data_transformation",
+            class_name="DataTransformationTrainingPipeline",
+            deps=(partition_index, config.data_validation.STATUS_FILE),
+            params=(("config", "data_transformation"), ("config", "artifact_format"), ("schema", "COLUMNS")),
+            outs=(train_data_path, test_data_path, config.data_transformation.split_manifest_file),
+        ),
+        PipelineStage(
+            name="Model Trainer stage",
+            module="mlproject.pipeline.stage_04_model_trainer",
+            class_name="ModelTrainerTrainingPipeline",
+            deps=(train_data_path,),  # The test split is only read by the evaluation stage.
+            params=(("config", "model_trainer"), ("params", "ElasticNet"), ("params", "search"), ("params", "training"),
+                    ("params", "preprocessing"), ("schema", "COLUMNS"), ("schema", "TARGET_COLUMN")),
+            outs=(os.path.join(config.model_trainer.root_dir, config.model_trainer.model_name),
+                  os.path.join(config.model_trainer.root_dir, config.model_trainer.linear_model_name),
+                  config.model_trainer.leaderboard_file),
+        ),
+        PipelineStage(
+            name="Cross Validation stage",
+            module="mlproject.pipeline.stage_05_cross_validation",
+            class_name="CrossValidationTrainingPipeline",
+            deps=(str(dataset_path(config.cross_validation.train_data_path, config.artifact_format)),
+                  config.cross_validation.model_path),
+            params=(("config", "cross_validation"), ("schema", "COLUMNS"), ("schema", "TARGET_COLUMN")),
+            outs=(config.cross_validation.metric_file_name,),
+        ),
+        PipelineStage(
+            name="Model Evaluation stage",
+            module="mlproject.pipeline.stage_06_model_evaluation",
+            class_name="ModelEvaluationTrainingPipeline",
+            deps=(test_data_path, config.model_evaluation.model_path),
+            params=(("config", "model_evaluation"), ("params", "ElasticNet"), ("schema", "TARGET_COLUMN")),
+            outs=(config.model_evaluation.metric_file_name,),
+        ),
+        PipelineStage(
+            name="Model Registration stage",
+            module="mlproject.pipeline.stage_07_model_registration",
+            class_name="ModelRegistrationTrainingPipeline",
+            deps=(config.model_registry.model_path, config.model_registry.linear_model_path,
+                  config.model_registry.metric_file_name, config.model_registry.cv_metric_file_name),
+            params=(("config", "model_registry"),),
+            outs=(config.model_registry.report_file,),
+        ),
+    ]
+
+
+def run_stage(module_name: str, class_name: str, profiling_config: ProfilingConfig = None) -> float:
+    """
+    Runs one training stage's pipeline, under the profiler when profiling.stages or MLPROJECT_PROFILE=1 is set.
+
+    Args:
+        module_name (str): Module defining the stage pipeline.
+        class_name (str): Name of the *TrainingPipeline class.
+        profiling_config (ProfilingConfig, optional): Profiling settings, as read once by the PipelineRunner.
+            Read from config.yaml when omitted.
+
+    Returns:
+        float: Wall time of the stage in seconds.
+    """
+    start = time.perf_counter()
+    pipeline_class = getattr(importlib.import_module(module_name), class_name)
+    profiler = Profiler.from_config(profiling_config or ConfigurationManager().get_profiling_config())
+    if profiler.stages:
+        with profiler.profile("stages", class_name):
+            pipeline_class().main()
+    else:
+        pipeline_class().main()
+    return time.perf_counter() - start
+
+
+class PipelineRunner:
+    def __init__(self, config_manager: ConfigurationManager = None, force: bool = False):
+        """
+        Initializes the runner from the project configuration.
+
+        In the spirit of `dvc repro`, a stage is skipped when the content hashes of its deps, the values of its
+        parameter sections and the content hashes of its outs all match the lock file written by the last run.
+        Since a rerun stage rewrites its outs, stages downstream of it see changed deps and rerun as well.
+        Runs hold run_lock, a file lock next to the lock file, so only one process runs the pipeline at a time.
+
+        Args:
+            config_manager (ConfigurationManager, optional): Loaded project configuration. Read from disk when omitted.
+            force (bool, optional): Rerun every stage regardless of the lock file. Defaults to False.
+        """
+        self.config_manager = config_manager or ConfigurationManager()
+        self.stages = self.topological_order(build_stages(self.config_manager))
+        self.lock_path = Path(self.config_manager.config.pipeline.lock_file)
+        self.run_lock = RunLock(self.lock_path.with_name(self.lock_path.name + ".running"))
+        self.report_path = Path(self.config_manager.config.pipeline.report_file)
+        self.timings_dir = self.config_manager.config.pipeline.get("timings_dir")
+        self.profiling_config = self.config_manager.get_profiling_config()  # Passed to every stage.
+        metrics.configure(enabled=self.config_manager.config.get("instrumentation", {}).get("enabled", True))
+        self.force = force
+
+    @staticmethod
+    def topological_order(stages: list) -> list:
+        """
+        Orders stages so that every stage runs after the stages producing its deps.
+
+        Args:
+            stages (list): PipelineStage objects; ties keep their declared order.
+
+        Raises:
+            ValueError: If the declared deps and outs form a cycle.
+
+        Returns:
+            list: Stages in execution order.
+        """
+        producers = {str(out): stage.name for stage in stages for out in stage.outs}
+        upstream = {stage.name: {producers[str(dep)] for dep in stage.deps
+                                 if str(dep) in producers and producers[str(dep)] != stage.name}
+                    for stage in stages}
+
+        ordered, done = [], set()
+        while len(ordered) < len(stages):
+            ready = [stage for stage in stages if stage.name not in done and upstream[stage.name] <= done]
+            if not ready:
+                raise ValueError("Pipeline stages form a cycle")
+            ordered.append(ready[0])
+            done.add(ready[0].name)
+        return ordered
+
+    def _params_hash(self, stage: PipelineStage) -> str:
+        """Fingerprints the parameter sections a stage depends on."""
+        sources = {"config": self.config_manager.config, "params": self.config_manager.params,
+                   "schema": self.config_manager.schema}
+        values = {f"{source}:{key}": sources[source].get(key) for source, key in stage.params}
+        payload = json.dumps(values, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _hash_files(paths) -> dict:
+        """Content hashes of the given files; missing files map to None."""
+        return {str(path): file_sha256(path) if os.path.exists(path) else None for path in paths}
+
+    def _load_lock(self) -> dict:
+        if self.lock_path.exists():
+            with open(self.lock_path) as f:
+                return json.load(f)
+        return {}
+
+    def _save_lock(self, lock: dict):
+        tmp_path = self.lock_path.with_name(self.lock_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(lock, f, indent=4)
+        os.replace(tmp_path, self.lock_path)
+
+    def is_up_to_date(self, stage: PipelineStage, lock: dict, deps: dict, params: str) -> bool:
+        """
+        Checks whether a stage can be skipped.
+
+        Args:
+            stage (PipelineStage): Stage to check.
+            lock (dict): Contents of the lock file.
+            deps (dict): Current content hashes of the stage's deps.
+            params (str): Current fingerprint of the stage's parameters.
+
+        Returns:
+            bool: True if the stage's deps, params and outs match its last recorded run.
+        """
+        entry = lock.get(stage.name)
+        if self.force or stage.always_changed or entry is None:
+            return False
+        if entry["deps"] != deps or entry["params"] != params:
+            return False
+        outs = self._hash_files(stage.outs)
+        return None not in outs.values() and entry["outs"] == outs
+
+    def run(self, executor=run_stage, on_stage=None) -> list:
+        """
+        Runs the stages in order, skipping the ones that are up to date.
+
+        Args:
+            executor (callable, optional): Called as executor(module, class_name, profiling_config) to run a stage
+                and return its wall time. Defaults to running the stage in this process.
+            on_stage (callable, optional): Called as on_stage(name, status, seconds) when a stage starts
+                ("running") and when it ends ("completed" or "cached").
+
+        Raises:
+            PipelineLockedError: If another process is running the pipeline.
+
+        Returns:
+            list: One report entry per stage with its status ("ran" or "cached") and wall time.
+        """
+        # The caller may already hold run_lock (e.g. the training job runner); then it also releases it.
+        owns_lock = not self.run_lock.held
+        if owns_lock and not self.run_lock.acquire():
+            raise PipelineLockedError(f"Another process is running the training pipeline ({self.run_lock.path})")
+        try:
+            return self._run_stages(executor, on_stage)
+        finally:
+            if owns_lock:
+                self.run_lock.release()
+
+    def _run_stages(self, executor, on_stage) -> list:
+        """Runs the stages in order, skipping the ones that are up to date; see run."""
+        lock = self._load_lock()
+        report = []
+        started_at, before = time.time(), metrics.snapshot()
+
+        for stage in self.stages:
+            start = time.perf_counter()
+            deps = self._hash_files(stage.deps)
+            params = self._params_hash(stage)
+
+            if self.is_up_to_date(stage, lock, deps, params):
+                seconds = time.perf_counter() - start
+                logger.info(f">>>>>> stage {stage.name} up to date, skipped (cache hit) <<<<<<")
+                report.append({"stage": stage.name, "status": "cached", "seconds": seconds})
+                metrics.observe("mlproject_stage_seconds", seconds, stage=stage.name, status="cached")
+                if on_stage is not None:
+                    on_stage(stage.name, "cached", seconds)
+                continue
+
+            logger.info(f">>>>>> stage {stage.name} started (cache miss) <<<<<<")
+            if on_stage is not None:
+                on_stage(stage.name, "running", None)
+
+            try:
+                seconds = executor(stage.module, stage.class_name, self.profiling_config)
+            except BaseException:
+                # A failed stage is never up to date: dropping its entry forces it to run again next time.
+                if lock.pop(stage.name, None) is not None:
+                    self._save_lock(lock)
+                raise
+
+            lock[stage.name] = {"deps": deps, "params": params, "outs": self._hash_files(stage.outs)}
+            self._save_lock(lock)
+
+            logger.info(f">>>>>> stage {stage.name} completed in {seconds:.2f}s <<<<<<\n\nx==========x")
+            report.append({"stage": stage.name, "status": "ran", "seconds": seconds})
+            metrics.observe("mlproject_stage_seconds", seconds, stage=stage.name, status="ran")
+            if on_stage is not None:
+                on_stage(stage.name, "completed", seconds)
+
+        with open(self.report_path, "w") as f:
+            json.dump(report, f, indent=4)
+        if self.timings_dir and metrics.enabled:
+            self.save_timings(started_at, report, snapshot_delta(before, metrics.snapshot()))
+        return report
+
+    def save_timings(self, started_at: float, report: list, recorded: dict):
+        """
+        Writes the timing report of one run to timings_dir/run-<start time>.json.
+
+        Args:
+            started_at (float): Start time of the run.
+            report (list): Per-stage status and wall time.
+            recorded (dict): Timers and counters recorded in this process during the run, e.g. model loads
+                of stages run in-process.
+        """
+        os.makedirs(self.timings_dir, exist_ok=True)
+        name = time.strftime("run-%Y%m%d-%H%M%S", time.localtime(started_at))
+        path = Path(self.timings_dir) / f"{name}.json"
+        with open(path, "w") as f:
+            json.dump({"started_at": started_at, "seconds": time.time() - started_at, "stages": report,
+                       "metrics": recorded}, f, indent=4)
+        logger.info(f"Timing report saved at: {path}")
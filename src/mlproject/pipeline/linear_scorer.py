@@ -0,0 +1,101 @@
+# File: linear_scorer.py
+# Purpose: NumPy-only scorer for trained linear models, used by PredictionPipeline instead of scikit-learn.
+
+import os  # Operating system interface.
+import numpy as np  # Numerical operations library.
+from pathlib import Path  # Object-oriented interface to filesystem paths.
+
+
+class LinearScorer:
+    def __init__(self, coef, intercept, feature_columns, log_columns=()):
+        """
+        Initializes the LinearScorer with the parameters of a fitted linear model.
+
+        Args:
+            coef: Coefficients, one per feature.
+            intercept (float): Intercept of the model.
+            feature_columns: Feature names in the order the coefficients refer to.
+            log_columns (optional): Features the coefficients refer to as log1p(x). Defaults to none.
+        """
+        self.coef = np.ascontiguousarray(coef, dtype=np.float64).ravel()
+        self.intercept = float(np.ravel(intercept)[0])
+        self.feature_columns = tuple(str(col) for col in feature_columns)
+        self.log_columns = tuple(str(col) for col in log_columns)
+        self.log_mask = np.isin(np.array(self.feature_columns, dtype=object), self.log_columns)
+
+    @classmethod
+    def from_estimator(cls, model, feature_columns):
+        """
+        Builds a scorer from a fitted scikit-learn linear estimator such as ElasticNet.
+
+        A Pipeline of a FeaturePreprocessor and a linear estimator is folded into a single linear model on the
+        log-transformed features, so scoring stays one matrix-vector product per batch.
+
+        Args:
+            model: Fitted estimator exposing coef_ and intercept_, or a Pipeline ending in one.
+            feature_columns: Feature names in the order the model was fitted on.
+
+        Returns:
+            LinearScorer: Scorer producing the same predictions as model.predict.
+        """
+        if hasattr(model, "steps"):
+            preprocessor, estimator = model.steps[0][1], model.steps[-1][1]
+            coef, intercept = preprocessor.fold(estimator.coef_, estimator.intercept_)
+            return cls(coef=coef, intercept=intercept, feature_columns=feature_columns,
+                       log_columns=preprocessor.log_columns)
+        return cls(coef=model.coef_, intercept=model.intercept_, feature_columns=feature_columns)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Loads a scorer from a .npz artifact written by save().
+
+        Args:
+            path (Path): Path of the artifact.
+
+        Returns:
+            LinearScorer: The loaded scorer.
+        """
+        with np.load(path, allow_pickle=False) as artifact:
+            return cls(
+                coef=artifact["coef"],
+                intercept=artifact["intercept"],
+                feature_columns=artifact["feature_columns"].tolist(),
+                log_columns=artifact["log_columns"].tolist() if "log_columns" in artifact else ()
+            )
+
+    def save(self, path):
+        """
+        Writes the scorer to a .npz artifact, replacing any existing file atomically.
+
+        Args:
+            path (Path): Path of the artifact.
+        """
+        path = Path(path)
+        tmp_path = path.with_name(path.stem + ".tmp.npz")
+        np.savez(
+            tmp_path,
+            coef=self.coef,
+            intercept=np.array([self.intercept]),
+            feature_columns=np.array(self.feature_columns),
+            log_columns=np.array(self.log_columns, dtype=str)
+        )
+        os.replace(tmp_path, path)
+
+    def predict(self, data):
+        """
+        Scores a feature matrix as data @ coef + intercept, after log1p of the log columns if there are any.
+
+        Args:
+            data: Feature matrix of shape (n_rows, n_features), or a DataFrame holding the feature columns.
+
+        Returns:
+            np.ndarray: Predicted values, one per row.
+        """
+        if hasattr(data, "columns"):
+            data = data[list(self.feature_columns)]
+        data = np.asarray(data, dtype=np.float64)
+        if self.log_mask.any():
+            data = data.copy()
+            data[:, self.log_mask] = np.log1p(data[:, self.log_mask])
+        return data @ self.coef + self.intercept
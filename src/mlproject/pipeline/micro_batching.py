@@ -0,0 +1,181 @@
+# File: micro_batching.py
+# Purpose: Definition of the MicroBatcher class that coalesces concurrent prediction requests into one model call.
+
+import time  # Timing of queue waits.
+import threading  # Background batching thread and synchronization.
+from collections import deque  # FIFO queue of pending requests.
+from concurrent.futures import Future  # Handle through which a waiting request receives its result.
+import numpy as np  # Numerical operations library.
+
+
+class BatcherStoppedError(RuntimeError):
+    """Raised when the batching thread has died and can no longer score queued requests."""
+
+
+class MicroBatcher:
+    # Upper bounds of the batch-size histogram buckets; the last bucket holds everything larger.
+    BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+    def __init__(self, predict_fn, max_wait_ms: float = 2.0, max_batch_rows: int = 64):
+        """
+        Initializes the MicroBatcher and starts its background batching thread.
+
+        A request arriving while no other request is in flight is scored directly on the calling thread.
+        Requests arriving while others are in flight are queued; the batching thread waits at most max_wait_ms
+        after the oldest queued request (or until max_batch_rows rows are queued), stacks them into one
+        matrix, runs a single predict_fn call and hands each request its slice of the result.
+
+        Args:
+            predict_fn (callable): Function mapping a feature matrix to one prediction per row.
+            max_wait_ms (float, optional): Longest time a queued request waits for companions. Defaults to 2.
+            max_batch_rows (int, optional): Largest number of rows scored in one call. Defaults to 64.
+        """
+        self.predict_fn = predict_fn
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_batch_rows = max_batch_rows
+
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._in_flight = 0  # Requests currently being scored or waiting for a result.
+        self._error = None  # Exception that stopped the batching thread, if it died.
+
+        self.direct_calls = 0  # Requests scored directly because the batcher was idle.
+        self.batched_requests = 0  # Requests scored as part of a batch.
+        self.batches = 0  # Number of batched predict_fn calls.
+        self.total_wait_seconds = 0.0  # Queueing delay added to batched requests.
+        self.histogram = [0] * (len(self.BUCKETS) + 1)  # Batch sizes (rows) per bucket.
+        # The counters above are only updated and read while holding self._cond.
+
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def predict(self, data):
+        """
+        Scores a small feature matrix, batching it with concurrent requests when there are any.
+
+        Args:
+            data: Feature matrix of shape (n_rows, n_features).
+
+        Returns:
+            np.ndarray: Predicted values, one per row.
+
+        Raises:
+            BatcherStoppedError: If the batching thread has died.
+        """
+        data = np.asarray(data, dtype=np.float64)
+
+        with self._cond:
+            # Failing at once rather than queueing a request nobody would ever answer.
+            if self._error is not None or not self._thread.is_alive():
+                raise BatcherStoppedError("Micro-batching thread is not running") from self._error
+            direct = self._in_flight == 0 and not self._queue
+            self._in_flight += 1
+            if direct:
+                self.direct_calls += 1
+            else:
+                future = Future()
+                self._queue.append((data, future, time.perf_counter()))
+                self._cond.notify()
+
+        try:
+            if direct:
+                return np.asarray(self.predict_fn(data)).ravel()
+            return future.result()
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+
+    def _run(self):
+        """
+        Background loop that collects queued requests into batches and scores them.
+
+        If the loop dies (e.g. on an error outside predict_fn), every request of the current batch and of the
+        queue gets the error instead of waiting forever, and later predict calls fail fast.
+        """
+        batch = []
+        try:
+            self._loop(batch)
+        except BaseException as e:
+            error = BatcherStoppedError(f"Micro-batching thread stopped: {e!r}")
+            error.__cause__ = e
+            with self._cond:
+                self._error = error
+                pending = batch + list(self._queue)
+                self._queue.clear()
+            for _, future, _ in pending:
+                if not future.done():
+                    future.set_exception(error)
+            raise
+
+    def _loop(self, batch):
+        """Collects and scores batches until the thread dies; `batch` holds the batch being scored."""
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+
+                # Wait for companions until the oldest request's deadline or until the batch is full.
+                deadline = self._queue[0][2] + self.max_wait
+                while sum(len(item[0]) for item in self._queue) < self.max_batch_rows:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                batch.clear()
+                rows = 0
+                while self._queue and (not batch or rows + len(self._queue[0][0]) <= self.max_batch_rows):
+                    item = self._queue.popleft()
+                    batch.append(item)
+                    rows += len(item[0])
+
+            self._score(batch, rows)
+
+    def _score(self, batch, rows):
+        """Scores one batch with a single predict_fn call and resolves every waiting request."""
+        started = time.perf_counter()
+        try:
+            predictions = np.asarray(self.predict_fn(np.vstack([item[0] for item in batch]))).ravel()
+        except Exception as e:
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+
+        with self._cond:
+            self.batches += 1
+            self.batched_requests += len(batch)
+            self.total_wait_seconds += sum(started - enqueued for _, _, enqueued in batch)
+            self.histogram[self._bucket(rows)] += 1
+
+        offset = 0
+        for data, future, _ in batch:
+            future.set_result(predictions[offset:offset + len(data)])
+            offset += len(data)
+
+    def _bucket(self, rows):
+        """Returns the histogram bucket index for a batch of the given size."""
+        for i, upper in enumerate(self.BUCKETS):
+            if rows <= upper:
+                return i
+        return len(self.BUCKETS)
+
+    def stats(self) -> dict:
+        """
+        Returns batching statistics.
+
+        Returns:
+            dict: Whether the batching thread runs, queue depth, call counts, batch-size histogram and added wait time.
+        """
+        labels = [f"<={upper}" for upper in self.BUCKETS] + [f">{self.BUCKETS[-1]}"]
+        with self._cond:
+            return {
+                "running": self._error is None and self._thread.is_alive(),
+                "queue_depth": len(self._queue),
+                "in_flight": self._in_flight,
+                "direct_calls": self.direct_calls,
+                "batched_requests": self.batched_requests,
+                "batches": self.batches,
+                "batch_size_histogram": dict(zip(labels, self.histogram)),
+                "total_wait_seconds": self.total_wait_seconds,
+                "mean_wait_seconds": self.total_wait_seconds / self.batched_requests if self.batched_requests else 0.0,
+            }
@@ -0,0 +1,142 @@
+# File: model_cache.py
+# Purpose: Process-wide, thread-safe cache of loaded model artifacts with hot reload on artifact change.
+
+import os  # Operating system interface.
+import time  # Timing of artifact loads.
+import threading  # Locks guarding the shared cache.
+from pathlib import Path  # Object-oriented interface to filesystem paths.
+from mlproject.utils.common import file_sha256  # Content hashing of model artifacts.
+from mlproject.utils.instrumentation import metrics  # Load timings and cache hit counts.
+
+
+def _load_joblib(path):
+    """Default loader: deserializes a joblib artifact."""
+    import joblib  # Imported here so the hot path never pays for it once the model is cached.
+    return joblib.load(path)
+
+
+_cache_hits = metrics.counter("mlproject_model_cache_hits_total")  # Lookups served from memory.
+_load_seconds = metrics.histogram("mlproject_model_load_seconds")  # Artifact deserialization times.
+
+
+class _CacheEntry:
+    """A loaded model together with the artifact signature it was loaded from."""
+    __slots__ = ("model", "signature", "sha256", "loaded_at")
+
+    def __init__(self, model, signature, sha256, loaded_at):
+        self.model = model
+        self.signature = signature  # (st_mtime_ns, st_size) of the artifact.
+        self.sha256 = sha256  # Content hash of the artifact.
+        self.loaded_at = loaded_at  # Wall-clock time of the load.
+
+
+class ModelCache:
+    def __init__(self):
+        """
+        Initializes an empty model cache.
+
+        Models are keyed by artifact path. Each lookup only stats the artifact; the file is read again only when
+        its mtime or size changed, and the model is deserialized again only when its content hash changed too.
+        A reload builds the new model first and then swaps the cache entry, so callers still holding the old
+        model finish their requests on it.
+        """
+        self._entries = {}
+        self._lock = threading.Lock()  # Held while an artifact is (re)loaded.
+        self._hits_lock = threading.Lock()  # Guards cache_hits without making hits wait for a load.
+        self.load_count = 0  # Number of times an artifact was deserialized from disk.
+        self.cache_hits = 0  # Number of lookups served from memory.
+        self.last_load_duration = None  # Seconds spent in the most recent load.
+
+    def get(self, path, loader=_load_joblib):
+        """
+        Returns the model stored at the given path, loading or reloading it only when the artifact changed.
+
+        Args:
+            path: Path of the model artifact.
+            loader (callable, optional): Function that deserializes the artifact. Defaults to joblib.load.
+
+        Returns:
+            The loaded model.
+        """
+        return self.get_entry(path, loader).model
+
+    def _hit(self, entry) -> _CacheEntry:
+        """Counts a lookup served from memory, in the attribute and the metric together, and returns the entry."""
+        with self._hits_lock:
+            self.cache_hits += 1
+            _cache_hits.inc()
+        return entry
+
+    def get_entry(self, path, loader=_load_joblib) -> _CacheEntry:
+        """
+        Same as get, but returns the cache entry, so callers also learn the content hash of the loaded model.
+
+        Args:
+            path: Path of the model artifact.
+            loader (callable, optional): Function that deserializes the artifact. Defaults to joblib.load.
+
+        Returns:
+            _CacheEntry: The loaded model with the signature and SHA-256 of its artifact.
+        """
+        key = str(path)
+        stat = os.stat(key)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.signature == signature:
+            return self._hit(entry)
+
+        with self._lock:
+            # Another thread may have reloaded the artifact while we waited for the lock.
+            entry = self._entries.get(key)
+            if entry is not None and entry.signature == signature:
+                return self._hit(entry)
+
+            sha256 = file_sha256(key)
+            if entry is not None and entry.sha256 == sha256:
+                # Touched but unchanged (e.g. rewritten with identical bytes): keep the loaded model.
+                entry = self._entries[key] = _CacheEntry(entry.model, signature, sha256, entry.loaded_at)
+                return self._hit(entry)
+
+            start = time.perf_counter()
+            model = loader(Path(key))
+            self.last_load_duration = time.perf_counter() - start
+            self.load_count += 1
+            _load_seconds.observe(self.last_load_duration)
+
+            entry = self._entries[key] = _CacheEntry(model, signature, sha256, time.time())
+            return entry
+
+    def invalidate(self, path=None):
+        """
+        Drops cached models so that the next lookup loads them from disk again.
+
+        Args:
+            path (optional): Artifact path to drop. Drops every entry when omitted.
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(path), None)
+
+    def stats(self) -> dict:
+        """
+        Returns cache statistics.
+
+        Returns:
+            dict: Load count, cache hits, last load duration and the artifacts currently cached.
+        """
+        return {
+            "load_count": self.load_count,
+            "cache_hits": self.cache_hits,
+            "last_load_duration": self.last_load_duration,
+            "models": {
+                key: {"sha256": entry.sha256, "loaded_at": entry.loaded_at}
+                for key, entry in list(self._entries.items())
+            },
+        }
+
+
+# Shared cache used by every PredictionPipeline in the process.
+model_cache = ModelCache()
@@ -0,0 +1,244 @@
+# File: model_registry.py
+# Purpose: Local on-disk registry of immutable, versioned model artifacts with an atomically swapped "current" pointer.
+
+import os  # Operating system interface.
+import json  # Metadata and pointer files.
+import time  # Registration and promotion timestamps.
+import shutil  # Copies artifacts into a version directory.
+import stat  # Read-only permissions of registered artifacts.
+import threading  # Guards the cached pointer.
+import uuid  # Names of staging directories.
+from pathlib import Path  # Object-oriented interface to filesystem paths.
+
+CURRENT_FILE = "current.json"  # Pointer to the version served by default.
+ROLLBACK_REASON = "rollback from"  # Reason prefix of the history entries written by rollback().
+METADATA_FILE = "metadata.json"  # Metadata stored in every version directory.
+MODEL_ARTIFACT = "model.joblib"  # Name of the joblib model in a version directory.
+LINEAR_MODEL_ARTIFACT = "linear_model.npz"  # Name of the NumPy-only scorer in a version directory.
+
+
+class ModelRegistry:
+    def __init__(self, root_dir):
+        """
+        Initializes a registry rooted at root_dir.
+
+        Layout:
+            root_dir/versions/v0001/   one directory per version, holding its artifacts and metadata.json;
+                                       never modified after registration.
+            root_dir/current.json      the promoted version and the promotion history.
+        A version directory is assembled under a temporary name and renamed into place, and the pointer is
+        replaced with os.replace, so readers only ever see complete versions and a complete pointer.
+
+        Args:
+            root_dir (Path): Root directory of the registry.
+        """
+        self.root_dir = Path(root_dir)
+        self.versions_dir = self.root_dir / "versions"
+        self._lock = threading.Lock()
+        self._pointer = None  # (signature, contents) of the last pointer file read.
+        self._known = set()  # Versions already seen to exist; versions are never removed.
+
+    def versions(self) -> list:
+        """
+        Lists the registered versions, oldest first.
+
+        Returns:
+            list: Version names such as 'v0001'.
+        """
+        if not self.versions_dir.exists():
+            return []
+        return sorted(name for name in os.listdir(self.versions_dir) if name.startswith("v"))
+
+    def metadata(self, version: str) -> dict:
+        """
+        Reads the metadata of a version.
+
+        Args:
+            version (str): Version name.
+
+        Raises:
+            KeyError: If the version is not registered.
+
+        Returns:
+            dict: Metadata recorded at registration.
+        """
+        path = self.versions_dir / version / METADATA_FILE
+        if not path.exists():
+            raise KeyError(f"Unknown model version: {version}")
+        with open(path) as f:
+            return json.load(f)
+
+    def path(self, version: str, name: str) -> Path:
+        """Path of an artifact of a version."""
+        return self.versions_dir / version / name
+
+    def find(self, sha256: str):
+        """Returns the version whose model artifact has the given SHA-256, or None."""
+        for version in reversed(self.versions()):
+            if self.metadata(version).get("sha256") == sha256:
+                return version
+        return None
+
+    def register(self, artifacts: dict, metadata: dict) -> str:
+        """
+        Copies artifacts into a new immutable version.
+
+        Args:
+            artifacts (dict): Artifact name in the version (e.g. 'model.joblib') -> path of the file to copy.
+            metadata (dict): Metadata stored with the version (params, metrics, data fingerprint, ...).
+
+        Returns:
+            str: Name of the new version.
+        """
+        os.makedirs(self.versions_dir, exist_ok=True)
+        staging = self.versions_dir / f".staging-{uuid.uuid4().hex}"
+        os.makedirs(staging)
+        try:
+            for name, source in artifacts.items():
+                shutil.copyfile(source, staging / name)
+                os.chmod(staging / name, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+
+            with self._lock:
+                existing = self.versions()
+                version = f"v{int(existing[-1][1:]) + 1 if existing else 1:04d}"
+                metadata = dict(metadata, version=version, registered_at=time.time(), artifacts=sorted(artifacts))
+                with open(staging / METADATA_FILE, "w") as f:
+                    json.dump(metadata, f, indent=4)
+                os.chmod(staging / METADATA_FILE, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+                os.rename(staging, self.versions_dir / version)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        return version
+
+    def _read_pointer(self) -> dict:
+        """Reads the pointer file, re-parsing it only when its mtime or size changed."""
+        path = self.root_dir / CURRENT_FILE
+        try:
+            stat_result = os.stat(path)
+        except FileNotFoundError:
+            return {"version": None, "history": []}
+        signature = (stat_result.st_mtime_ns, stat_result.st_size)
+
+        cached = self._pointer
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        with open(path) as f:
+            contents = json.load(f)
+        self._pointer = (signature, contents)
+        return contents
+
+    def current(self):
+        """
+        Returns the promoted version.
+
+        Returns:
+            str: Version name, or None when nothing has been promoted yet.
+        """
+        return self._read_pointer()["version"]
+
+    def history(self) -> list:
+        """Promotions, oldest first, each with its version, time and reason."""
+        return self._read_pointer()["history"]
+
+    def promote(self, version: str, reason: str = "manual") -> dict:
+        """
+        Makes a version current by atomically replacing the pointer file.
+
+        Serving processes following the current version pick it up on their next request, without a restart.
+
+        Args:
+            version (str): Version to promote.
+            reason (str, optional): Why it was promoted, kept in the history. Defaults to "manual".
+
+        Raises:
+            KeyError: If the version is not registered.
+
+        Returns:
+            dict: The new pointer.
+        """
+        self.metadata(version)  # Raises KeyError for unknown versions.
+        with self._lock:
+            pointer = self._read_pointer()
+            pointer = {
+                "version": version,
+                "history": pointer["history"] + [{"version": version, "promoted_at": time.time(), "reason": reason}],
+            }
+            path = self.root_dir / CURRENT_FILE
+            tmp_path = self.root_dir / f"{CURRENT_FILE}.{uuid.uuid4().hex}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(pointer, f, indent=4)
+            os.replace(tmp_path, path)
+        return pointer
+
+    def rollback(self) -> dict:
+        """
+        Promotes the version that was current before the current one.
+
+        Rollbacks undo promotions in order, like popping a stack: after v1, v2 and v3 were promoted, a first
+        rollback returns to v2 and a second one to v1, never back to the version just rolled back from.
+
+        Raises:
+            ValueError: If there is no earlier promotion to return to.
+
+        Returns:
+            dict: The new pointer.
+        """
+        stack = self._promotion_stack(self.history())
+        if len(stack) < 2:
+            raise ValueError("No earlier promoted version to roll back to")
+        return self.promote(stack[-2], reason=f"{ROLLBACK_REASON} {stack[-1]}")
+
+    @staticmethod
+    def _promotion_stack(history: list) -> list:
+        """Replays the history: promotions push their version, rollbacks pop the version they rolled back from."""
+        stack = []
+        for entry in history:
+            if entry.get("reason", "").startswith(ROLLBACK_REASON):
+                if stack:
+                    stack.pop()
+            elif not stack or stack[-1] != entry["version"]:
+                stack.append(entry["version"])
+        return stack
+
+    def resolve(self, version: str = "current"):
+        """
+        Resolves a version reference.
+
+        Args:
+            version (str, optional): 'current' to follow the promoted version, or a version name to pin it.
+
+        Raises:
+            KeyError: If a pinned version is not registered.
+
+        Returns:
+            str: Version name, or None when following and nothing has been promoted yet.
+        """
+        if version in (None, "current"):
+            return self.current()
+        if version not in self._known:
+            self.metadata(version)
+            self._known.add(version)
+        return version
+
+
+_registries = {}  # Registries shared by the serving code, keyed by root directory.
+_registries_lock = threading.Lock()
+
+
+def get_registry(root_dir) -> ModelRegistry:
+    """
+    Returns the process-wide registry rooted at root_dir, so every request shares its cached pointer.
+
+    Args:
+        root_dir (Path): Root directory of the registry.
+
+    Returns:
+        ModelRegistry: The shared registry.
+    """
+    key = str(root_dir)
+    registry = _registries.get(key)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.setdefault(key, ModelRegistry(root_dir))
+    return registry
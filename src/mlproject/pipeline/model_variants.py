@@ -0,0 +1,233 @@
+# File: model_variants.py
+# Purpose: Definition of the VariantRouter class that splits traffic between model versions (A/B) and
+# shadow-scores a candidate version off the request thread.
+
+import time  # Request latencies.
+import zlib  # Stable hash of routing keys.
+import queue  # Bounded queue of pending shadow requests.
+import random  # Weighted choice of the variant of unkeyed requests.
+import threading  # Shadow thread and locks guarding the metrics.
+from collections import deque  # Recent latencies for percentiles.
+import numpy as np  # Numerical operations library.
+from mlproject.pipeline.prediction import PredictionPipeline
+
+
+class VariantMetrics:
+    # Upper bounds (milliseconds) of the latency histogram buckets; the last bucket holds everything slower.
+    BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+    def __init__(self, window: int = 10_000):
+        """
+        Initializes the latency and error metrics of one variant.
+
+        Args:
+            window (int, optional): Number of recent latencies kept for the percentiles. Defaults to 10000.
+        """
+        self.requests = 0  # Scored requests.
+        self.rows = 0  # Scored rows.
+        self.errors = 0  # Requests whose predict call raised.
+        self.total_seconds = 0.0  # Time spent in predict calls.
+        self.histogram = [0] * (len(self.BUCKETS) + 1)  # Latencies per bucket.
+        self._recent = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, rows: int, error: bool = False):
+        """Records one predict call."""
+        milliseconds = seconds * 1000.0
+        bucket = next((i for i, upper in enumerate(self.BUCKETS) if milliseconds <= upper), len(self.BUCKETS))
+        with self._lock:
+            self.requests += 1
+            self.rows += rows
+            self.errors += error
+            self.total_seconds += seconds
+            self.histogram[bucket] += 1
+            self._recent.append(milliseconds)
+
+    def stats(self) -> dict:
+        """
+        Returns the metrics of the variant.
+
+        Returns:
+            dict: Request, row and error counts, the latency histogram and the p50/p95/p99 of recent latencies.
+        """
+        with self._lock:
+            recent = np.array(self._recent)
+            histogram = list(self.histogram)
+        labels = [f"<={upper}ms" for upper in self.BUCKETS] + [f">{self.BUCKETS[-1]}ms"]
+        percentiles = np.percentile(recent, [50, 95, 99]).tolist() if len(recent) else [None] * 3
+        return {
+            "requests": self.requests,
+            "rows": self.rows,
+            "errors": self.errors,
+            "error_rate": self.errors / self.requests if self.requests else 0.0,
+            "mean_ms": self.total_seconds * 1000.0 / self.requests if self.requests else None,
+            **dict(zip(("p50_ms", "p95_ms", "p99_ms"), percentiles)),
+            "latency_histogram": dict(zip(labels, histogram)),
+        }
+
+
+class DifferenceStats:
+    def __init__(self):
+        """Running statistics of shadow minus primary predictions, updated per batch with Chan's formula."""
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.mean_abs = 0.0
+        self.max_abs = 0.0
+        self._lock = threading.Lock()
+
+    def update(self, differences):
+        """Adds a batch of prediction differences."""
+        differences = np.asarray(differences, dtype=np.float64).ravel()
+        m = len(differences)
+        if m == 0:
+            return
+        chunk_mean = differences.mean()
+        with self._lock:
+            delta = chunk_mean - self.mean
+            total = self.n + m
+            self.m2 += ((differences - chunk_mean) ** 2).sum() + delta ** 2 * self.n * m / total
+            self.mean += delta * m / total
+            self.mean_abs += (np.abs(differences).mean() - self.mean_abs) * m / total
+            self.max_abs = max(self.max_abs, float(np.abs(differences).max()))
+            self.n = total
+
+    def stats(self) -> dict:
+        """Returns the count, mean, std, mean absolute and max absolute difference."""
+        return {
+            "rows": self.n,
+            "mean": self.mean,
+            "std": float(np.sqrt(self.m2 / self.n)) if self.n else None,
+            "mean_abs": self.mean_abs,
+            "max_abs": self.max_abs,
+        }
+
+
+class VariantRouter:
+    def __init__(self, routes, shadow=None, registry_dir=None, model_path=None, linear_model_path=None,
+                 shadow_queue_size: int = 1000, cache=None):
+        """
+        Initializes the router and, when a shadow version is set, starts its background scoring thread.
+
+        Every request is answered by one routed variant, picked with probability proportional to its weight,
+        or by hashing a routing key so the same key always gets the same variant. Each variant is a model
+        registry version ('current' follows promotions) and is loaded once through the shared model cache.
+
+        The shadow version scores a copy of every request on a background thread. The request only enqueues
+        its rows and the primary predictions; when the queue is full the shadow copy is dropped rather than
+        slowing the request down.
+
+        Args:
+            routes: Dicts with the name, registry version and weight of each routed variant; names must be unique.
+            shadow (str, optional): Registry version scored in the shadow of every request. Defaults to None.
+            registry_dir (Path, optional): Model registry directory. Defaults to None.
+            model_path (Path, optional): Model served while a variant resolves to no registry version.
+            linear_model_path (Path, optional): NumPy-only scorer served while a variant resolves to no version.
+            shadow_queue_size (int, optional): Largest number of pending shadow requests. Defaults to 1000.
+            cache (PredictionCache, optional): Prediction cache shared by the variants; entries are keyed on each
+                variant's model, so variants never see each other's predictions. Defaults to None.
+        """
+        self.routes = [(route["name"], route["version"], float(route["weight"])) for route in routes]
+        if not self.routes or sum(weight for _, _, weight in self.routes) <= 0:
+            raise ValueError("Variant routes need at least one variant with a positive weight")
+        names = [name for name, _, _ in self.routes]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            # They would share one VariantMetrics entry and their metrics could not be told apart.
+            raise ValueError(f"Variant route names must be unique, repeated: {duplicates}")
+        total = sum(weight for _, _, weight in self.routes)
+        self._cumulative = np.cumsum([weight / total for _, _, weight in self.routes])
+
+        self.shadow = shadow
+        self.paths = {"model_path": model_path, "linear_model_path": linear_model_path, "registry_dir": registry_dir}
+        self.cache = cache
+        self.metrics = {name: VariantMetrics() for name, _, _ in self.routes}
+
+        self.shadow_metrics = VariantMetrics()
+        self.differences = DifferenceStats()
+        self.shadow_dropped = 0  # Shadow requests dropped because the queue was full; guarded by _lock.
+        self._lock = threading.Lock()
+        self._shadow_queue = queue.Queue(maxsize=shadow_queue_size)
+        if shadow is not None:
+            self._thread = threading.Thread(target=self._run_shadow, name="shadow-scorer", daemon=True)
+            self._thread.start()
+
+    def pipeline(self, version) -> PredictionPipeline:
+        """Returns the prediction pipeline of a registry version."""
+        return PredictionPipeline(version=version, cache=self.cache,
+                                  **{key: value for key, value in self.paths.items() if value is not None})
+
+    def choose(self, key=None) -> int:
+        """
+        Picks the routed variant of a request.
+
+        Args:
+            key (str, optional): Routing key, e.g. a user id; the same key always maps to the same variant.
+
+        Returns:
+            int: Index of the variant in routes.
+        """
+        point = zlib.crc32(str(key).encode("utf-8")) / 2 ** 32 if key is not None else random.random()
+        return min(int(np.searchsorted(self._cumulative, point, side="right")), len(self.routes) - 1)
+
+    def predict(self, data, key=None):
+        """
+        Scores a request with its routed variant and queues its shadow copy.
+
+        Args:
+            data: Feature matrix of shape (n_rows, n_features).
+            key (str, optional): Routing key. Defaults to None (random routing).
+
+        Returns:
+            tuple: Name of the variant that answered and its predictions.
+        """
+        name, version, _ = self.routes[self.choose(key)]
+        start = time.perf_counter()
+        try:
+            predictions = np.asarray(self.pipeline(version).predict(data)).ravel()
+        except Exception:
+            self.metrics[name].record(time.perf_counter() - start, len(data), error=True)
+            raise
+        self.metrics[name].record(time.perf_counter() - start, len(data))
+
+        if self.shadow is not None:
+            try:
+                self._shadow_queue.put_nowait((data, predictions))
+            except queue.Full:
+                with self._lock:
+                    self.shadow_dropped += 1
+        return name, predictions
+
+    def _run_shadow(self):
+        """Background loop scoring queued requests with the shadow version."""
+        while True:
+            data, primary = self._shadow_queue.get()
+            start = time.perf_counter()
+            try:
+                predictions = np.asarray(self.pipeline(self.shadow).predict(data)).ravel()
+            except Exception:
+                self.shadow_metrics.record(time.perf_counter() - start, len(data), error=True)
+                continue
+            self.shadow_metrics.record(time.perf_counter() - start, len(data))
+            self.differences.update(predictions - primary)
+
+    def stats(self) -> dict:
+        """
+        Returns the metrics of every variant and of the shadow.
+
+        Returns:
+            dict: Per-variant weights, versions and metrics, and the shadow metrics with the prediction differences.
+        """
+        stats = {
+            "variants": {name: {"version": version, "weight": weight, **self.metrics[name].stats()}
+                         for name, version, weight in self.routes},
+        }
+        if self.shadow is not None:
+            stats["shadow"] = {
+                "version": self.shadow,
+                "queue_depth": self._shadow_queue.qsize(),
+                "dropped": self.shadow_dropped,
+                **self.shadow_metrics.stats(),
+                "difference": self.differences.stats(),
+            }
+        return stats
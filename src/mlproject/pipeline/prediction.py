@@ -1,20 +1,67 @@
 # File: prediction_pipeline.py
 # Purpose: Definition of the PredictionPipeline class for making predictions using a trained model.
 
-import joblib  # Library for saving and loading scikit-learn models.
-import numpy as np  # Numerical operations library.
-import pandas as pd  # Data manipulation library.
+import os  # Operating system interface.
+import time  # Prediction timings.
 from pathlib import Path  # Object-oriented interface to filesystem paths.
+from mlproject.pipeline.model_cache import model_cache  # Process-wide cache of loaded models.
+from mlproject.pipeline.model_registry import get_registry, MODEL_ARTIFACT, LINEAR_MODEL_ARTIFACT
+from mlproject.utils.instrumentation import metrics  # Prediction timings.
+
+MODEL_PATH = Path('artifacts/model_trainer/model.joblib')  # Path of the trained model artifact.
+LINEAR_MODEL_PATH = Path('artifacts/model_trainer/linear_model.npz')  # Path of the NumPy-only export of the model.
+
+# (histogram, counter) metric series of each served model label.
+_series = {}
 
 class PredictionPipeline:
-    def __init__(self):
+    def __init__(self, model_path=MODEL_PATH, linear_model_path=LINEAR_MODEL_PATH, registry_dir=None,
+                 version="current", cache=None):
         """
-        Initializes the PredictionPipeline object by loading a pre-trained machine learning model.
+        Initializes the PredictionPipeline object with the pre-trained machine learning model.
+
+        When the NumPy-only export of the model exists it is used instead of the joblib model, so serving
+        does not need scikit-learn. Either way the model is loaded once per process through the shared model
+        cache and reloaded only when the artifact changes on disk (e.g. after retraining).
+
+        With a registry, the artifacts of the resolved registry version are served instead: 'current' follows
+        the promoted version, re-reading the pointer only when it changed, so a promotion or rollback takes
+        effect on the next request; a version name pins it. Until a version is promoted the fixed paths are used.
 
-        Model path: 'artifacts/model_trainer/model.joblib'
+        Args:
+            model_path (Path, optional): Path of the model artifact. Defaults to 'artifacts/model_trainer/model.joblib'.
+            linear_model_path (Path, optional): Path of the NumPy-only export. Defaults to 'artifacts/model_trainer/linear_model.npz'.
+            registry_dir (Path, optional): Model registry directory; None serves the paths above. Defaults to None.
+            version (str, optional): 'current' or a version name such as 'v0003'. Defaults to "current".
+            cache (PredictionCache, optional): Cache of predictions keyed on the rows and the model's SHA-256,
+                looked up per row before scoring. Defaults to None.
         """
-        # Loading the pre-trained machine learning model into the 'model' attribute.
-        self.model = joblib.load(Path('artifacts/model_trainer/model.joblib'))
+        # Resolving the registry version, whose artifacts replace the fixed paths.
+        self.version = None
+        if registry_dir is not None:
+            registry = get_registry(registry_dir)
+            self.version = registry.resolve(version)
+            if self.version is not None:
+                model_path = registry.path(self.version, MODEL_ARTIFACT)
+                linear_model_path = registry.path(self.version, LINEAR_MODEL_ARTIFACT)
+
+        # Fetching the pre-trained machine learning model from the shared cache into the 'model' attribute.
+        if linear_model_path is not None and os.path.exists(linear_model_path):
+            from mlproject.pipeline.linear_scorer import LinearScorer  # NumPy-only scorer, imported on first use.
+            entry = model_cache.get_entry(linear_model_path, loader=LinearScorer.load)
+        else:
+            entry = model_cache.get_entry(model_path)
+        self.model = entry.model
+        self.model_id = entry.sha256  # Changes whenever the served artifact does.
+        self.cache = cache
+
+        # Metric series of the served model, looked up once per model label.
+        label = self.version or "default"
+        series = _series.get(label)
+        if series is None:
+            series = _series[label] = (metrics.histogram("mlproject_predict_seconds", model=label),
+                                       metrics.counter("mlproject_predict_rows_total", model=label))
+        self._seconds, self._rows = series
 
     def predict(self, data):
         """
@@ -26,8 +73,15 @@ class PredictionPipeline:
         Returns:
             prediction: Predicted values.
         """
-        # Using the loaded model to make predictions on the input data.
-        prediction = self.model.predict(data)
+        # Using the loaded model to make predictions on the input data, through the prediction cache if any.
+        start = time.perf_counter()
+        if self.cache is not None:
+            prediction = self.cache.predict(self.model_id, self.model.predict, data)
+        else:
+            prediction = self.model.predict(data)
+        if metrics.enabled:
+            self._seconds.observe(time.perf_counter() - start)
+            self._rows.inc(len(data))
 
         # Returning the predicted values.
         return prediction
@@ -0,0 +1,142 @@
+# File: prediction_cache.py
+# Purpose: Definition of the PredictionCache class, a bounded LRU/TTL cache of predictions keyed on quantized
+# feature rows and the model that scored them.
+
+import sys  # Sizes of cached keys.
+import time  # Expiry of cached predictions.
+import threading  # Lock guarding the cache.
+from collections import OrderedDict  # Entries in least-recently-used order.
+import numpy as np  # Numerical operations library.
+
+# Approximate bytes per cache entry besides its key: the OrderedDict slot and links, the (prediction, expiry)
+# tuple and its two floats.
+ENTRY_OVERHEAD = 200
+
+
+class PredictionCache:
+    def __init__(self, max_entries: int = 100_000, ttl_seconds: float = 3600.0, decimals: int = 6):
+        """
+        Initializes an empty prediction cache.
+
+        Rows are canonicalized by rounding to `decimals` places (and mapping -0.0 to 0.0), so resubmissions of the
+        same measurements hit even when their floats differ in the last bits. Keys also include the SHA-256 of
+        the model artifact, so a retrained or newly promoted model never serves a cached prediction of the old
+        one; the old entries simply stop being used and are evicted as least recently used.
+
+        Args:
+            max_entries (int, optional): Largest number of cached rows. Defaults to 100000.
+            ttl_seconds (float, optional): Lifetime of a cached prediction; None keeps it until evicted.
+                Defaults to 3600.
+            decimals (int, optional): Decimal places the features are rounded to. Defaults to 6.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.decimals = decimals
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0  # Approximate memory held by the entries.
+        self.hits = 0  # Rows answered from the cache.
+        self.misses = 0  # Rows scored by the model.
+        self.evictions = 0  # Entries dropped because the cache was full.
+        self.expirations = 0  # Entries dropped because their TTL ran out.
+
+    def keys(self, model_id: str, data) -> list:
+        """
+        Builds the cache key of every row.
+
+        Args:
+            model_id (str): Identity of the model, e.g. the SHA-256 of its artifact.
+            data: Feature matrix of shape (n_rows, n_features).
+
+        Returns:
+            list: One bytes key per row.
+        """
+        rows = np.round(np.asarray(data, dtype=np.float64), self.decimals) + 0.0  # Adding 0.0 maps -0.0 to 0.0.
+        prefix = model_id.encode("utf-8")
+        return [prefix + row.tobytes() for row in np.ascontiguousarray(rows)]
+
+    def predict(self, model_id: str, predict_fn, data):
+        """
+        Scores a feature matrix cache-aside: cached rows are answered from memory and the remaining rows are
+        scored in a single predict_fn call, then cached.
+
+        Args:
+            model_id (str): Identity of the model, e.g. the SHA-256 of its artifact.
+            predict_fn (callable): Function mapping a feature matrix to one prediction per row.
+            data: Feature matrix of shape (n_rows, n_features).
+
+        Returns:
+            np.ndarray: Predicted values, one per row.
+        """
+        data = np.asarray(data, dtype=np.float64)
+        keys = self.keys(model_id, data)
+        predictions = np.empty(len(keys), dtype=np.float64)
+        missing = []
+
+        now = time.monotonic()
+        with self._lock:
+            for i, key in enumerate(keys):
+                entry = self._entries.get(key)
+                if entry is not None and (entry[1] is None or entry[1] > now):
+                    self._entries.move_to_end(key)
+                    predictions[i] = entry[0]
+                elif entry is not None:
+                    self._remove(key)
+                    self.expirations += 1
+                    missing.append(i)
+                else:
+                    missing.append(i)
+            self.hits += len(keys) - len(missing)
+            self.misses += len(missing)
+
+        if missing:
+            scored = np.asarray(predict_fn(data[missing])).ravel()
+            predictions[missing] = scored
+            expires = now + self.ttl_seconds if self.ttl_seconds is not None else None
+            with self._lock:
+                for i, value in zip(missing, scored):
+                    self._store(keys[i], float(value), expires)
+        return predictions
+
+    def _store(self, key: bytes, value: float, expires):
+        """Adds an entry, evicting the least recently used ones beyond max_entries. Called with the lock held."""
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (value, expires)
+        self.bytes += sys.getsizeof(key) + ENTRY_OVERHEAD
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: bytes):
+        """Drops an entry. Called with the lock held."""
+        del self._entries[key]
+        self.bytes -= sys.getsizeof(key) + ENTRY_OVERHEAD
+
+    def clear(self):
+        """Drops every cached prediction."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict:
+        """
+        Returns cache statistics.
+
+        Returns:
+            dict: Size, approximate memory, hit ratio and eviction counts.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "decimals": self.decimals,
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
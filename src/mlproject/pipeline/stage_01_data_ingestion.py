@@ -1,6 +1,6 @@
 from mlproject.config.configuration import ConfigurationManager
 from mlproject.components.data_ingestion import DataIngestion
-from mlproject import logger
+from mlproject import logger, setup_logging
 
 STAGE_NAME = "Data Ingestion stage"
 
@@ -14,10 +14,12 @@ class DataIngestionTrainingPipeline:
         data_ingestion=DataIngestion(config=data_ingestion_config)
         data_ingestion.download_file()
         data_ingestion.extract_zip_file()
+        data_ingestion.append_partitions()
 
 
 
 if __name__ == '__main__':
+    setup_logging()
     try:
         logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
         obj = DataIngestionTrainingPipeline()
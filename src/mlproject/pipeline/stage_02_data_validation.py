@@ -1,6 +1,6 @@
 from mlproject.config.configuration import ConfigurationManager
 from mlproject.components.data_validation import DataValidation
-from mlproject import logger
+from mlproject import logger, setup_logging
 
 STAGE_NAME = "Data Validation stage"
 
@@ -18,11 +18,13 @@ class DataValidationTrainingPipeline:
         # Creating DataValidation object with the obtained configuration.
         data_validation = DataValidation(config=data_validation_config)
 
-        # Performing data validation.
-        data_validation.validate_all_columns()
+        # Performing data validation; schema, dtype, null or bounds violations stop the pipeline here.
+        if not data_validation.validate_all_columns():
+            raise ValueError(f"Data validation failed, see {data_validation_config.REPORT_FILE}")
 
 
 if __name__ == '__main__':
+    setup_logging()
     try:
         logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
         obj = DataValidationTrainingPipeline()
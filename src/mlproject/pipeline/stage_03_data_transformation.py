@@ -31,5 +31,6 @@ class DataTransformationTrainingPipeline:
                 raise Exception("Your data schema is not valid")
 
         except Exception as e:
-            # Handling and printing any exceptions that occur during the process.
-            print(e)
+            # Logging and re-raising, so the pipeline stops and the stage is not recorded as up to date.
+            logger.exception(e)
+            raise e
@@ -1,6 +1,6 @@
 from mlproject.config.configuration import ConfigurationManager
 from mlproject.components.model_trainer import ModelTrainer
-from mlproject import logger
+from mlproject import logger, setup_logging
 from pathlib import Path
 
 STAGE_NAME = "Model Trainer stage"
@@ -25,6 +25,7 @@ class ModelTrainerTrainingPipeline:
 
 
 if __name__ == '__main__':
+    setup_logging()
     try:
         logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
         obj = ModelTrainerTrainingPipeline()
@@ -0,0 +1,36 @@
+from mlproject.config.configuration import ConfigurationManager
+from mlproject.components.cross_validation import CrossValidation
+from mlproject import logger, setup_logging
+from pathlib import Path
+
+STAGE_NAME = "Cross Validation stage"
+
+
+class CrossValidationTrainingPipeline:
+    def __init__(self):
+        pass
+
+    def main(self):
+        # Creating ConfigurationManager to manage project configurations.
+        config = ConfigurationManager()
+
+        # Retrieving cross-validation configuration.
+        cross_validation_config = config.get_cross_validation_config()
+
+        # Creating CrossValidation object with the obtained configuration.
+        cross_validation = CrossValidation(config=cross_validation_config)
+
+        # Running k-fold cross-validation of the trained model.
+        cross_validation.run()
+
+
+if __name__ == '__main__':
+    setup_logging()
+    try:
+        logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
+        obj = CrossValidationTrainingPipeline()
+        obj.main()
+        logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except Exception as e:
+        logger.exception(e)
+        raise e
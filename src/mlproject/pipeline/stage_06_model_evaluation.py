@@ -1,6 +1,6 @@
 from mlproject.config.configuration import ConfigurationManager
 from mlproject.components.model_evaluation import ModelEvaluation
-from mlproject import logger
+from mlproject import logger, setup_logging
 from pathlib import Path
 
 STAGE_NAME = "Model Evaluation stage"
@@ -24,6 +24,7 @@ class ModelEvaluationTrainingPipeline:
 
 
 if __name__ == '__main__':
+    setup_logging()
     try:
         logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
         obj = ModelEvaluationTrainingPipeline()
@@ -0,0 +1,36 @@
+from mlproject.config.configuration import ConfigurationManager
+from mlproject.components.model_registration import ModelRegistration
+from mlproject import logger, setup_logging
+from pathlib import Path
+
+STAGE_NAME = "Model Registration stage"
+
+
+class ModelRegistrationTrainingPipeline:
+    def __init__(self):
+        pass
+
+    def main(self):
+        # Creating ConfigurationManager to manage project configurations.
+        config = ConfigurationManager()
+
+        # Retrieving model registry configuration.
+        model_registry_config = config.get_model_registry_config()
+
+        # Creating ModelRegistration object with the obtained configuration.
+        model_registration = ModelRegistration(config=model_registry_config)
+
+        # Registering the trained model and promoting it when it passes the gate.
+        model_registration.run()
+
+
+if __name__ == '__main__':
+    setup_logging()
+    try:
+        logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
+        obj = ModelRegistrationTrainingPipeline()
+        obj.main()
+        logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except Exception as e:
+        logger.exception(e)
+        raise e
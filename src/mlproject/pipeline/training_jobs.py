@@ -0,0 +1,151 @@
+# File: training_jobs.py
+# Purpose: Runs the training pipeline as background jobs in a worker process, with per-stage progress.
+
+import time  # Job timings.
+import uuid  # Job identifiers.
+import threading  # Background thread driving each job.
+import multiprocessing  # Start method of the worker process.
+from concurrent.futures import ProcessPoolExecutor  # Worker process that runs the stages.
+from concurrent.futures.process import BrokenProcessPool  # Raised once the worker process died.
+from mlproject import logger, setup_logging
+from mlproject.pipeline.dag import PipelineRunner, run_stage
+
+class TrainingInProgressError(RuntimeError):
+    """Raised when a training run is requested while another one is still active."""
+
+
+class TrainingJob:
+    def __init__(self, stage_names):
+        """
+        Initializes a queued training job with one pending entry per stage.
+
+        Args:
+            stage_names: Names of the stages the job runs, in order.
+        """
+        self.id = uuid.uuid4().hex
+        self.status = "queued"  # queued -> running -> succeeded | failed
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self.stages = [{"name": name, "status": "pending", "seconds": None} for name in stage_names]
+
+    def to_dict(self) -> dict:
+        """Returns the job state as a JSON-serializable dict."""
+        done = sum(stage["status"] in ("completed", "cached") for stage in self.stages)
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "progress": f"{done}/{len(self.stages)}",
+            "stages": self.stages,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class TrainingJobRunner:
+    def __init__(self, on_success=None, max_history: int = 20):
+        """
+        Initializes the runner. Each job runs the stage DAG from main.py: up-to-date stages are skipped and the
+        others run one after another in a single long-lived worker process, so the web worker is never blocked
+        and the stage modules are imported once rather than once per run.
+
+        Args:
+            on_success (callable, optional): Called with the job after a successful run, e.g. to hot-swap the model.
+            max_history (int, optional): Number of finished jobs kept for status queries. Defaults to 20.
+        """
+        self.on_success = on_success
+        self.max_history = max_history
+        self._jobs = {}
+        self._active = None
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Creates the worker process on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=setup_logging
+            )
+        return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor):
+        """Drops a broken worker pool, so the next stage or job starts a fresh worker process."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self) -> TrainingJob:
+        """
+        Starts a training run in the background.
+
+        Raises:
+            TrainingInProgressError: If another run is still active, in this process or in another one (e.g. another
+                gunicorn worker), as told by the pipeline's file lock.
+
+        Returns:
+            TrainingJob: The started job.
+        """
+        with self._lock:
+            if self._active is not None:
+                raise TrainingInProgressError(f"Training job {self._active.id} is still running")
+
+            runner = PipelineRunner()
+            if not runner.run_lock.acquire():
+                raise TrainingInProgressError("Another process is running the training pipeline")
+            job = TrainingJob([stage.name for stage in runner.stages])
+            self._active = job
+            self._jobs[job.id] = job
+            # Forget the oldest finished jobs.
+            while len(self._jobs) > self.max_history:
+                self._jobs.pop(next(iter(self._jobs)))
+
+        threading.Thread(target=self._run, args=(job, runner), name=f"training-{job.id}", daemon=True).start()
+        return job
+
+    def get(self, job_id: str):
+        """Returns the job with the given id, or None if it is unknown."""
+        return self._jobs.get(job_id)
+
+    def _run(self, job: TrainingJob, runner: PipelineRunner):
+        """Drives one job through the stage DAG, recording progress and timings."""
+        job.status = "running"
+        stages = {stage["name"]: stage for stage in job.stages}
+
+        def on_stage(name, status, seconds):
+            stages[name]["status"] = status
+            stages[name]["seconds"] = seconds
+
+        def executor(module_name, class_name, profiling_config=None):
+            pool = self._get_executor()
+            try:
+                return pool.submit(run_stage, module_name, class_name, profiling_config).result()
+            except BrokenProcessPool:
+                # The worker died (OOM kill, crash in native code, os._exit): replace it for the next run.
+                self._discard_executor(pool)
+                next(stage for stage in job.stages if stage["status"] == "running")["status"] = "failed"
+                raise
+            except Exception:
+                next(stage for stage in job.stages if stage["status"] == "running")["status"] = "failed"
+                raise
+
+        try:
+            runner.run(executor=executor, on_stage=on_stage)
+
+            job.status = "succeeded"
+            if self.on_success is not None:
+                self.on_success(job)
+
+        except Exception as e:
+            logger.exception(e)
+            job.status = "failed"
+            job.error = repr(e)
+
+        finally:
+            runner.run_lock.release()
+            job.finished_at = time.time()
+            with self._lock:
+                self._active = None
@@ -0,0 +1,179 @@
+# File: artifacts.py
+# Purpose: Reading and writing intermediate datasets as CSV, Parquet, Feather or memory-mappable NumPy files.
+
+import os  # Atomic replacement of merged datasets.
+import json  # Column metadata of NumPy artifacts.
+import shutil  # Streams CSV bodies.
+from pathlib import Path  # Object-oriented interface to filesystem paths.
+import numpy as np  # Numerical operations library.
+import pandas as pd  # Data manipulation library.
+from mlproject.utils.common import FORMATS, dataset_path  # Pure path logic, kept light for the app's startup.
+
+
+def _columns_path(path) -> Path:
+    """Sidecar file holding the column names and schema dtypes of a NumPy artifact."""
+    return Path(str(path) + ".columns.json")
+
+
+def save_dataset(data: pd.DataFrame, path, fmt: str, dtypes: dict = None):
+    """Saves a dataset in the given format, casting its columns to the schema dtypes first.
+
+    NumPy artifacts hold every column in a single float64 matrix so they can be memory-mapped; the column
+    names and the schema dtypes they were cast from go to a '<file>.columns.json' sidecar.
+
+    Args:
+        data (pd.DataFrame): Dataset to save.
+        path (Path): Destination path; its suffix is replaced by the format's.
+        fmt (str): Artifact format, one of FORMATS.
+        dtypes (dict, optional): Column name -> dtype, as declared in schema.yaml COLUMNS.
+
+    Returns:
+        Path: Path the dataset was written to.
+    """
+    path = dataset_path(path, fmt)
+    if dtypes:
+        data = data.astype({col: dtype for col, dtype in dtypes.items() if col in data.columns})
+
+    if fmt == "csv":
+        data.to_csv(path, index=False)
+    elif fmt == "parquet":
+        data.to_parquet(path, index=False)
+    elif fmt == "feather":
+        data.reset_index(drop=True).to_feather(path)
+    else:
+        np.save(path, np.ascontiguousarray(data.to_numpy(dtype=np.float64)))
+        with open(_columns_path(path), "w") as f:
+            json.dump({"columns": list(data.columns), "dtypes": {col: str(data[col].dtype) for col in data.columns}}, f)
+
+    return path
+
+
+def load_dataset(path, fmt: str, dtypes: dict = None) -> pd.DataFrame:
+    """Loads a dataset saved by save_dataset.
+
+    NumPy artifacts are memory-mapped and wrapped without copying (all columns stay float64, so selecting the
+    feature columns is a view too), and Feather artifacts are memory-mapped by Arrow, so the data is paged in
+    only as it is used.
+
+    Args:
+        path (Path): Path of the dataset; its suffix is replaced by the format's.
+        fmt (str): Artifact format, one of FORMATS.
+        dtypes (dict, optional): Column name -> dtype used to parse CSV files.
+
+    Returns:
+        pd.DataFrame: The dataset.
+    """
+    path = dataset_path(path, fmt)
+
+    if fmt == "csv":
+        return pd.read_csv(path, dtype=dtypes)
+    if fmt == "parquet":
+        return pd.read_parquet(path)
+    if fmt == "feather":
+        import pyarrow.feather as feather  # Optional dependency, only needed for Feather artifacts.
+        return feather.read_table(path, memory_map=True).to_pandas()
+
+    with open(_columns_path(path)) as f:
+        meta = json.load(f)
+    matrix = np.load(path, mmap_mode="r")
+    return pd.DataFrame(matrix, columns=meta["columns"], copy=False)
+
+
+
+def iter_dataset_chunks(path, fmt: str, chunk_size: int, dtypes: dict = None):
+    """Yields a dataset saved by save_dataset as DataFrames of at most chunk_size rows.
+
+    Only one chunk is materialized at a time, so memory is bounded by the chunk size rather than the dataset size.
+
+    Args:
+        path (Path): Path of the dataset; its suffix is replaced by the format's.
+        fmt (str): Artifact format, one of FORMATS.
+        chunk_size (int): Largest number of rows per chunk.
+        dtypes (dict, optional): Column name -> dtype used to parse CSV files.
+
+    Yields:
+        pd.DataFrame: Consecutive chunks of the dataset.
+    """
+    path = dataset_path(path, fmt)
+
+    if fmt == "csv":
+        yield from pd.read_csv(path, dtype=dtypes, chunksize=chunk_size)
+    elif fmt == "parquet":
+        import pyarrow.parquet as parquet  # Optional dependency, only needed for Parquet artifacts.
+        for batch in parquet.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    elif fmt == "feather":
+        import pyarrow.feather as feather  # Optional dependency, only needed for Feather artifacts.
+        for batch in feather.read_table(path, memory_map=True).to_batches(max_chunksize=chunk_size):
+            yield batch.to_pandas()
+    else:
+        with open(_columns_path(path)) as f:
+            meta = json.load(f)
+        matrix = np.load(path, mmap_mode="r")
+        for start in range(0, len(matrix), chunk_size):
+            yield pd.DataFrame(matrix[start:start + chunk_size], columns=meta["columns"], copy=False)
+
+
+def concat_datasets(parts, path, fmt: str) -> Path:
+    """Concatenates datasets saved by save_dataset into one, streaming one part at a time.
+
+    Only one part is held in memory (CSV bodies are copied as bytes, NumPy parts are memory-mapped), so the
+    merged dataset can be larger than memory. The result is written to a temporary file and moved into place, so
+    readers and interrupted runs never see a partial file.
+
+    Args:
+        parts (list): Paths of the datasets, in order; their suffixes are replaced by the format's.
+        path (Path): Destination path; its suffix is replaced by the format's.
+        fmt (str): Artifact format, one of FORMATS.
+
+    Raises:
+        ValueError: If there is no part to concatenate.
+
+    Returns:
+        Path: Path the dataset was written to.
+    """
+    if not parts:
+        raise ValueError("No datasets to concatenate")
+    path = dataset_path(path, fmt)
+    parts = [dataset_path(part, fmt) for part in parts]
+    tmp = path.with_name(path.name + ".tmp")
+
+    if fmt == "csv":
+        # Keeping the header line of the first part only.
+        with open(tmp, "wb") as out:
+            for index, part in enumerate(parts):
+                with open(part, "rb") as f:
+                    header = f.readline()
+                    if index == 0:
+                        out.write(header)
+                    shutil.copyfileobj(f, out)
+    elif fmt in ("parquet", "feather"):
+        import pyarrow as pa  # Optional dependency, only needed for Parquet and Feather artifacts.
+        import pyarrow.parquet as parquet
+        import pyarrow.feather as feather
+        writer = schema = None
+        try:
+            for part in parts:
+                table = parquet.read_table(part) if fmt == "parquet" else feather.read_table(part, memory_map=True)
+                if writer is None:
+                    schema = table.schema
+                    writer = (parquet.ParquetWriter(tmp, schema) if fmt == "parquet"
+                              else pa.ipc.new_file(str(tmp), schema))  # Feather V2 is the Arrow IPC file format.
+                writer.write_table(table.cast(schema))
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        matrices = [np.load(part, mmap_mode="r") for part in parts]
+        out = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.float64,
+                                        shape=(sum(len(matrix) for matrix in matrices), matrices[0].shape[1]))
+        start = 0
+        for matrix in matrices:
+            out[start:start + len(matrix)] = matrix
+            start += len(matrix)
+        out.flush()
+        del out
+        shutil.copyfile(_columns_path(parts[0]), _columns_path(path))
+
+    os.replace(tmp, path)
+    return path
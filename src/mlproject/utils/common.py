@@ -6,7 +6,7 @@ from box.exceptions import BoxValueError  # Exception for the box library.
 import yaml  # YAML parser and emitter for Python.
 from mlproject import logger  # Logger specific to the mlProject package.
 import json  # JSON encoder and decoder.
-import joblib  # Library for parallel processing in Python.
+import hashlib  # Content hashing of files.
 from ensure import ensure_annotations  # Decorator for type hints checking.
 from box import ConfigBox  # Dict subclass with attribute-style access.
 from pathlib import Path  # Object-oriented interface to filesystem paths.
@@ -91,6 +91,7 @@ def save_bin(data: Any, path: Path):
         data (Any): Data to be saved as binary.
         path (Path): Path to the binary file.
     """
+    import joblib  # Imported on use so that loading configuration does not pull it in.
     joblib.dump(value=data, filename=path)
     logger.info(f"Binary file saved at: {path}")
 
@@ -105,6 +106,7 @@ def load_bin(path: Path) -> Any:
     Returns:
         Any: Object stored in the file.
     """
+    import joblib  # Imported on use so that loading configuration does not pull it in.
     data = joblib.load(path)
     logger.info(f"Binary file loaded from: {path}")
     return data
@@ -122,3 +124,66 @@ def get_size(path: Path) -> str:
     """
     size_in_kb = round(os.path.getsize(path) / 1024)
     return f"~ {size_in_kb} KB"
+
+
+def file_sha256(path, block_size=1 << 20) -> str:
+    """Computes the SHA-256 hex digest of a file, reading it in blocks.
+
+    Args:
+        path (Path): Path of the file.
+        block_size (int, optional): Number of bytes read per block. Defaults to 1 MiB.
+
+    Returns:
+        str: Hex digest of the file contents.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def expand_grid(value) -> list:
+    """Expands a params.yaml hyperparameter into its list of candidate values.
+
+    Args:
+        value: A single value, a list of values, or a range given as a dict with start, stop, num
+            and optional log (geometric spacing when true).
+
+    Returns:
+        list: Candidate values.
+    """
+    if isinstance(value, dict):
+        import numpy as np  # Only ranges need NumPy.
+        spacing = np.geomspace if value.get("log", False) else np.linspace
+        return [float(v) for v in spacing(value["start"], value["stop"], int(value["num"]))]
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
+
+
+# Supported artifact formats and their file suffixes.
+FORMATS = {
+    "csv": ".csv",
+    "parquet": ".parquet",  # Columnar, compressed; needs pyarrow.
+    "feather": ".feather",  # Arrow IPC, memory-mapped on read; needs pyarrow.
+    "npy": ".npy",  # Raw float64 matrix, memory-mapped on read.
+}
+
+
+def dataset_path(path, fmt: str) -> Path:
+    """Returns the path of a dataset artifact with the suffix of the given format.
+
+    Args:
+        path (Path): Path of the dataset, with or without a suffix (e.g. 'artifacts/data_transformation/train.csv').
+        fmt (str): Artifact format, one of FORMATS.
+
+    Raises:
+        ValueError: If the format is unknown.
+
+    Returns:
+        Path: Path with the format's suffix.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown artifact format '{fmt}', expected one of {list(FORMATS)}")
+    return Path(path).with_suffix(FORMATS[fmt])
@@ -0,0 +1,258 @@
+# File: instrumentation.py
+# Purpose: Lightweight timers, counters and histograms for serving and training, rendered in the Prometheus
+# text format and as JSON timing reports.
+
+import os  # Environment switch.
+import time  # Timers.
+import bisect  # Histogram bucket lookup.
+import threading  # Lock guarding the metric values.
+from contextlib import contextmanager  # Timer context manager.
+from functools import wraps  # Timer decorator.
+
+# Upper bounds (seconds) of the histogram buckets, from 50 us requests to 10 min training stages.
+DEFAULT_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+# Setting MLPROJECT_METRICS=0 switches instrumentation off, whatever the configuration says.
+ENV_SWITCH = "MLPROJECT_METRICS"
+
+
+class _Histogram:
+    """One histogram series: bucket counts, a sum and a count, updated under the lock of its Metrics."""
+    __slots__ = ("owner", "values")
+
+    def __init__(self, owner):
+        self.owner = owner
+        self.values = [0] * (len(owner.buckets) + 1) + [0.0, 0]  # Buckets..., +Inf, sum, count.
+
+    def observe(self, value: float):
+        """Adds an observation."""
+        if not self.owner.enabled:
+            return
+        index = bisect.bisect_left(self.owner.buckets, value)
+        values = self.values
+        with self.owner._lock:
+            values[index] += 1
+            values[-2] += value
+            values[-1] += 1
+
+
+class _Counter:
+    """One counter series."""
+    __slots__ = ("owner", "value")
+
+    def __init__(self, owner):
+        self.owner = owner
+        self.value = 0
+
+    def inc(self, amount: float = 1):
+        """Increments the counter."""
+        if not self.owner.enabled:
+            return
+        with self.owner._lock:
+            self.value += amount
+
+
+class Metrics:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+        Initializes an empty set of metrics.
+
+        Hot paths look up their series once (histogram() and counter() return the same object for the same name
+        and labels) and then only pay for a bisect and a few additions under a lock per observation, so the
+        timers can stay on in production. When disabled, observations return before touching the lock.
+
+        Args:
+            buckets (tuple, optional): Upper bounds of the histogram buckets in seconds.
+        """
+        self.buckets = tuple(buckets)
+        self.enabled = os.environ.get(ENV_SWITCH, "1").lower() not in ("0", "false", "off", "no")
+        self._help = {}  # Metric name -> (type, help text).
+        self._histograms = {}  # (name, labels) -> _Histogram.
+        self._counters = {}  # (name, labels) -> _Counter.
+        self._lock = threading.Lock()
+
+    def configure(self, enabled: bool = True):
+        """Switches instrumentation on or off; the MLPROJECT_METRICS=0 environment switch always wins."""
+        self.enabled = enabled and os.environ.get(ENV_SWITCH, "1").lower() not in ("0", "false", "off", "no")
+
+    def describe(self, name: str, kind: str, help_text: str):
+        """Declares the type ('histogram' or 'counter') and help text of a metric."""
+        self._help[name] = (kind, help_text)
+
+    def histogram(self, name: str, **labels) -> _Histogram:
+        """
+        Returns the histogram series of a metric and label set, creating it on first use.
+
+        Args:
+            name (str): Metric name, e.g. 'mlproject_predict_seconds'.
+            **labels: Label values of the series.
+
+        Returns:
+            _Histogram: Series with an observe(value) method.
+        """
+        key = (name, tuple(sorted(labels.items())))
+        series = self._histograms.get(key)
+        if series is None:
+            with self._lock:
+                series = self._histograms.setdefault(key, _Histogram(self))
+        return series
+
+    def counter(self, name: str, **labels) -> _Counter:
+        """
+        Returns the counter series of a metric and label set, creating it on first use.
+
+        Args:
+            name (str): Metric name, e.g. 'mlproject_predict_rows_total'.
+            **labels: Label values of the series.
+
+        Returns:
+            _Counter: Series with an inc(amount) method.
+        """
+        key = (name, tuple(sorted(labels.items())))
+        series = self._counters.get(key)
+        if series is None:
+            with self._lock:
+                series = self._counters.setdefault(key, _Counter(self))
+        return series
+
+    def observe(self, name: str, value: float, **labels):
+        """Adds an observation to a histogram series; prefer histogram() once on hot paths."""
+        if self.enabled:
+            self.histogram(name, **labels).observe(value)
+
+    def inc(self, name: str, amount: float = 1, **labels):
+        """Increments a counter series; prefer counter() once on hot paths."""
+        if self.enabled:
+            self.counter(name, **labels).inc(amount)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """Context manager observing the wall time of its block in a histogram."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def timed(self, name: str, **labels):
+        """Decorator observing the wall time of every call of the decorated function in a histogram."""
+        def decorator(fn):
+            series = self.histogram(name, **labels)
+
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    series.observe(time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def _copy(self):
+        """Copies the values of every series under the lock."""
+        with self._lock:
+            histograms = {key: list(series.values) for key, series in self._histograms.items() if series.values[-1]}
+            counters = {key: series.value for key, series in self._counters.items()}
+        return histograms, counters
+
+    def snapshot(self) -> dict:
+        """
+        Returns the count and sum of every histogram series and the value of every counter.
+
+        Returns:
+            dict: {'histograms': {series: {count, sum, mean}}, 'counters': {series: value}}, where series is the
+                metric name followed by its labels, e.g. 'mlproject_stage_seconds{stage="Model Trainer stage"}'.
+        """
+        histograms, counters = self._copy()
+        return {
+            "histograms": {_series(*key): {"count": values[-1], "sum": values[-2], "mean": values[-2] / values[-1]}
+                           for key, values in sorted(histograms.items())},
+            "counters": {_series(*key): value for key, value in sorted(counters.items())},
+        }
+
+    def render_prometheus(self) -> str:
+        """
+        Renders every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: Text served on /metrics.
+        """
+        histograms, counters = self._copy()
+
+        lines, described = [], set()
+        for (name, labels), series in sorted(histograms.items()):
+            if name not in described:
+                described.add(name)
+                lines += [f"# HELP {name} {self._help.get(name, ('', name))[1]}", f"# TYPE {name} histogram"]
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-2]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{_series(name + '_bucket', labels + (('le', le),))} {cumulative}")
+            lines.append(f"{_series(name + '_sum', labels)} {series[-2]!r}")
+            lines.append(f"{_series(name + '_count', labels)} {series[-1]}")
+        for (name, labels), value in sorted(counters.items()):
+            if name not in described:
+                described.add(name)
+                lines += [f"# HELP {name} {self._help.get(name, ('', name))[1]}", f"# TYPE {name} counter"]
+            lines.append(f"{_series(name, labels)} {value!r}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """Zeroes every series in place, so the series held by hot paths keep being reported."""
+        with self._lock:
+            for series in self._histograms.values():
+                series.values = [0] * (len(self.buckets) + 1) + [0.0, 0]
+            for series in self._counters.values():
+                series.value = 0
+
+
+def _series(name: str, labels: tuple) -> str:
+    """Formats a series as name{label="value",...}."""
+    if not labels:
+        return name
+    escaped = ",".join(
+        f'{key}="' + str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for key, value in labels
+    )
+    return f"{name}{{{escaped}}}"
+
+
+def snapshot_delta(before: dict, after: dict) -> dict:
+    """
+    Difference of two snapshots: what was recorded between them.
+
+    Args:
+        before (dict): Earlier snapshot.
+        after (dict): Later snapshot.
+
+    Returns:
+        dict: Snapshot of the series that changed, with their counts, sums and values since `before`.
+    """
+    histograms = {}
+    for series, stats in after["histograms"].items():
+        previous = before["histograms"].get(series, {"count": 0, "sum": 0.0})
+        count, total = stats["count"] - previous["count"], stats["sum"] - previous["sum"]
+        if count:
+            histograms[series] = {"count": count, "sum": total, "mean": total / count}
+    counters = {series: value - before["counters"].get(series, 0) for series, value in after["counters"].items()
+                if value != before["counters"].get(series, 0)}
+    return {"histograms": histograms, "counters": counters}
+
+
+# Shared metrics of the process.
+metrics = Metrics()
+metrics.describe("mlproject_predict_seconds", "histogram", "Time spent in PredictionPipeline.predict.")
+metrics.describe("mlproject_predict_rows_total", "counter", "Rows scored by PredictionPipeline.predict.")
+metrics.describe("mlproject_request_parse_seconds", "histogram", "Time spent parsing request inputs.")
+metrics.describe("mlproject_http_request_seconds", "histogram", "Wall time of HTTP requests by endpoint and status.")
+metrics.describe("mlproject_model_load_seconds", "histogram", "Time spent deserializing model artifacts.")
+metrics.describe("mlproject_model_cache_hits_total", "counter", "Model lookups served from the model cache.")
+metrics.describe("mlproject_stage_seconds", "histogram", "Wall time of training stages by stage and status.")
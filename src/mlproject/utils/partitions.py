@@ -0,0 +1,161 @@
+# File: partitions.py
+# Purpose: Append-only data partitions: the partition index, per-partition result caches and stable row hashes.
+
+import os  # Operating system interface.
+import json  # Index and cache files.
+import hashlib  # Partition checksums and settings fingerprints.
+from pathlib import Path  # Object-oriented interface to filesystem paths.
+
+# Name of the file listing the partitions of a partitions directory, in append order.
+INDEX_FILE = "index.json"
+
+# Row hashes are reduced modulo this number of buckets to assign rows to splits.
+HASH_BUCKETS = 10_000
+
+
+def _write_json(path, data):
+    """Writes a JSON file atomically, so an interrupted run never leaves it half written."""
+    tmp_path = Path(str(path) + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=4)
+    os.replace(tmp_path, path)
+
+
+def index_path(partitions_dir) -> Path:
+    """Path of the index file of a partitions directory."""
+    return Path(partitions_dir) / INDEX_FILE
+
+
+def read_index(partitions_dir) -> list:
+    """Lists the partitions of a directory in append order.
+
+    Args:
+        partitions_dir (Path): Directory holding the partitions and their index.
+
+    Returns:
+        list: One dict per partition with its name, file, source, SHA-256 and number of rows.
+    """
+    path = index_path(partitions_dir)
+    if not path.exists():
+        return []
+    with open(path) as f:
+        return json.load(f)["partitions"]
+
+
+def append_partition(partitions_dir, header: bytes, body: bytes, source: str) -> dict:
+    """Writes new CSV rows as the next partition and adds it to the index.
+
+    Partitions are never rewritten once added, so results computed from a partition stay valid for as long
+    as its SHA-256 is unchanged.
+
+    Args:
+        partitions_dir (Path): Directory holding the partitions and their index.
+        header (bytes): CSV header line.
+        body (bytes or iterable): Complete CSV lines of the new rows, or blocks of them written one at a time.
+        source (str): Name of the file the rows came from.
+
+    Returns:
+        dict: Index entry of the new partition.
+    """
+    os.makedirs(partitions_dir, exist_ok=True)
+    partitions = read_index(partitions_dir)
+    name = f"part-{len(partitions):05d}"
+    path = Path(partitions_dir) / f"{name}.csv"
+
+    tmp_path = Path(str(path) + ".tmp")
+    sha256, rows = hashlib.sha256(header), 0
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        for block in ([body] if isinstance(body, bytes) else body):
+            f.write(block)
+            sha256.update(block)
+            rows += block.count(b"\n")
+    os.replace(tmp_path, path)
+
+    entry = {
+        "name": name,
+        "file": str(path),
+        "source": source,
+        "sha256": sha256.hexdigest(),
+        "rows": rows,
+    }
+    partitions.append(entry)
+    write_index(partitions_dir, partitions)
+    return entry
+
+
+def write_index(partitions_dir, partitions: list):
+    """Writes the index of a partitions directory.
+
+    Args:
+        partitions_dir (Path): Directory holding the partitions.
+        partitions (list): One dict per partition, in append order.
+    """
+    os.makedirs(partitions_dir, exist_ok=True)
+    _write_json(index_path(partitions_dir), {"partitions": partitions})
+
+
+def settings_key(*values) -> str:
+    """Fingerprints the settings a cached result depends on."""
+    payload = json.dumps(values, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def row_hashes(data, columns):
+    """Hashes every row from its values, independently of dtypes, column order and row position.
+
+    Values are hashed as float64, so the same row hashes alike whether it was read from CSV with schema dtypes
+    or from a float64 NumPy artifact, and a row keeps its hash across partitions and runs.
+
+    Args:
+        data (pd.DataFrame): Rows to hash.
+        columns: Columns to hash.
+
+    Returns:
+        np.ndarray: uint64 hash of every row.
+    """
+    import numpy as np  # Imported here so that reading the index does not load NumPy and pandas.
+    from pandas.util import hash_array
+
+    hashes = np.zeros(len(data), dtype=np.uint64)
+    for column in sorted(columns):
+        values = data[column].to_numpy(dtype=np.float64) + 0.0  # Adding 0.0 maps -0.0 to 0.0.
+        hashes = hashes * np.uint64(1_000_003) ^ hash_array(values.view(np.uint64))
+    return hashes
+
+
+class PartitionCache:
+    def __init__(self, path, key: str):
+        """
+        Per-partition results of one stage, stored as JSON.
+
+        A result is reused only while its partition's SHA-256 and the fingerprint of the stage settings that
+        produced it are unchanged.
+
+        Args:
+            path (Path): JSON file holding the cache.
+            key (str): Fingerprint of the stage settings, from settings_key.
+        """
+        self.path = Path(path)
+        self.key = key
+        data = {}
+        if self.path.exists():
+            with open(self.path) as f:
+                data = json.load(f)
+        self.entries = data.get("entries", {}) if data.get("key") == key else {}
+        self.state = data.get("state", {}) if data.get("key") == key else {}
+
+    def get(self, partition: dict):
+        """Returns the cached result of a partition, or None when it is missing or stale."""
+        entry = self.entries.get(partition["name"])
+        if entry is None or entry["sha256"] != partition["sha256"]:
+            return None
+        return entry["result"]
+
+    def put(self, partition: dict, result):
+        """Stores the result of a partition."""
+        self.entries[partition["name"]] = {"sha256": partition["sha256"], "result": result}
+
+    def save(self):
+        """Writes the cache to disk."""
+        _write_json(self.path, {"key": self.key, "entries": self.entries, "state": self.state})
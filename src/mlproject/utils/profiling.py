@@ -0,0 +1,217 @@
+# File: profiling.py
+# Purpose: Opt-in profiling of training stages and sampled prediction requests with cProfile or a sampling
+# profiler, plus tracemalloc allocation snapshots, written under artifacts/profiles/.
+
+import os  # Output directories and environment switches.
+import sys  # Stack sampling of the profiled thread.
+import json  # Profile summaries.
+import time  # Timestamps and sampling interval.
+import random  # Request sampling.
+import itertools  # Sequence numbers keeping file names unique.
+import pstats  # cProfile output.
+import cProfile  # Deterministic profiler.
+import threading  # Sampling thread and the one-profile-at-a-time lock.
+import tracemalloc  # Allocation snapshots.
+from collections import Counter  # Folded stack counts.
+from contextlib import contextmanager  # Profile context manager.
+from pathlib import Path  # Object-oriented interface to filesystem paths.
+from mlproject import logger
+
+# MLPROJECT_PROFILE=1 profiles every training stage; MLPROJECT_PROFILE_RATE=0.01 profiles 1% of requests.
+ENV_STAGES = "MLPROJECT_PROFILE"
+ENV_RATE = "MLPROJECT_PROFILE_RATE"
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process since it started, in MB."""
+    import resource  # POSIX only, imported on use.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 1024  # Bytes on macOS, KB on Linux.
+
+
+class StackSampler:
+    def __init__(self, thread_id: int, interval: float):
+        """
+        Samples the stack of one thread every `interval` seconds from a background thread.
+
+        The counts of identical stacks are written in the folded format ('outer;inner;leaf count') read by
+        flamegraph.pl, speedscope and inferno. The profiled thread is never paused, which keeps the overhead low
+        enough to leave on under load.
+
+        Args:
+            thread_id (int): threading.get_ident() of the thread to sample.
+            interval (float): Seconds between samples.
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def write(self, path):
+        """Writes the folded stacks to a file."""
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class Profiler:
+    def __init__(self, output_dir="artifacts/profiles", mode: str = "cprofile", stages: bool = False,
+                 request_sample_rate: float = 0.0, sampling_interval_ms: float = 1.0, trace_memory: bool = True,
+                 trace_memory_requests: bool = False, top_allocations: int = 25, allow_query_flag: bool = False):
+        """
+        Initializes the profiler; nothing is profiled unless stages or request_sample_rate switch it on.
+
+        Every profile writes, under output_dir/<kind>/<name>-<time>-<pid>-<n>:
+            - .prof (cprofile mode): pstats data, e.g. for snakeviz or `flameprof`; or
+              .folded (sampling mode): folded stacks for flamegraph.pl or speedscope;
+            - .json: wall time, the process's peak RSS and how much the block raised it, plus the peak traced memory
+              and the top allocation sites when tracemalloc is on.
+        Only one profile runs at a time in a process; a sampled request arriving while another profile is
+        running is served unprofiled.
+
+        tracemalloc traces every thread of the process, so while a request is profiled it would also slow down and
+        record the other requests being served. It is therefore only on for stage profiles unless
+        trace_memory_requests is set.
+
+        Args:
+            output_dir (Path, optional): Root directory of the profiles. Defaults to "artifacts/profiles".
+            mode (str, optional): 'cprofile' (every call, higher overhead) or 'sampling' (stack samples).
+            stages (bool, optional): Profile every training stage. Defaults to False; MLPROJECT_PROFILE=1 also enables it.
+            request_sample_rate (float, optional): Share of requests profiled. Defaults to 0; MLPROJECT_PROFILE_RATE
+                overrides it.
+            sampling_interval_ms (float, optional): Interval of the sampling profiler. Defaults to 1.
+            trace_memory (bool, optional): Record allocations with tracemalloc in stage profiles. Defaults to True.
+            trace_memory_requests (bool, optional): Record allocations in request profiles too. Defaults to False.
+            top_allocations (int, optional): Number of allocation sites kept in the summary. Defaults to 25.
+            allow_query_flag (bool, optional): Let clients force a profile with ?profile=1. Defaults to False.
+        """
+        self.output_dir = Path(output_dir)
+        self.mode = mode
+        self.stages = stages or os.environ.get(ENV_STAGES, "0").lower() in ("1", "true", "on", "yes")
+        self.request_sample_rate = float(os.environ.get(ENV_RATE, request_sample_rate))
+        self.sampling_interval = sampling_interval_ms / 1000.0
+        self.trace_memory = trace_memory
+        self.trace_memory_requests = trace_memory_requests
+        self.top_allocations = top_allocations
+        self.allow_query_flag = allow_query_flag
+        self._busy = threading.Lock()
+        self._sequence = itertools.count(1)
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Creates a profiler from a ProfilingConfig.
+
+        Args:
+            config (ProfilingConfig): Profiling settings from config.yaml.
+
+        Returns:
+            Profiler: The profiler.
+        """
+        return cls(output_dir=config.output_dir, mode=config.mode, stages=config.stages,
+                   request_sample_rate=config.request_sample_rate, sampling_interval_ms=config.sampling_interval_ms,
+                   trace_memory=config.trace_memory, trace_memory_requests=config.trace_memory_requests,
+                   top_allocations=config.top_allocations,
+                   allow_query_flag=config.allow_query_flag)
+
+    def sample_request(self, flag=None) -> bool:
+        """
+        Decides whether to profile a request.
+
+        Args:
+            flag (str, optional): Value of the request's ?profile= query parameter; '1' or 'true' forces it when
+                allow_query_flag is set.
+
+        Returns:
+            bool: True if the request should be profiled.
+        """
+        if self.allow_query_flag and flag is not None and flag.lower() in ("1", "true", "on", "yes"):
+            return True
+        return self.request_sample_rate > 0 and random.random() < self.request_sample_rate
+
+    @contextmanager
+    def profile(self, kind: str, name: str):
+        """
+        Profiles the block running on the calling thread.
+
+        Args:
+            kind (str): Subdirectory of the output, e.g. 'stages' or 'requests'.
+            name (str): Name of the profiled work, used in the file names.
+
+        Yields:
+            bool: True if the block is being profiled, False if another profile was already running.
+        """
+        if not self._busy.acquire(blocking=False):
+            yield False
+            return
+
+        try:
+            directory = self.output_dir / kind
+            os.makedirs(directory, exist_ok=True)
+            stem = directory / f"{''.join(c if c.isalnum() else '_' for c in name)}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(self._sequence)}"
+
+            # tracemalloc is process-wide: request profiles only use it when trace_memory_requests is set.
+            trace_memory = self.trace_memory_requests if kind == "requests" else self.trace_memory
+            tracing = trace_memory and not tracemalloc.is_tracing()
+            if tracing:
+                tracemalloc.start()
+            elif trace_memory:
+                tracemalloc.reset_peak()
+            peak_rss_before = _peak_rss_mb()
+            profiler = sampler = None
+            if self.mode == "sampling":
+                sampler = StackSampler(threading.get_ident(), self.sampling_interval)
+                sampler.start()
+            else:
+                profiler = cProfile.Profile()
+                profiler.enable()
+
+            start = time.perf_counter()
+            try:
+                yield True
+            finally:
+                seconds = time.perf_counter() - start
+                if profiler is not None:
+                    profiler.disable()
+                    pstats.Stats(profiler).dump_stats(f"{stem}.prof")
+                if sampler is not None:
+                    sampler.stop()
+                    sampler.write(f"{stem}.folded")
+
+                # ru_maxrss is the high-water mark of the whole process, not of the block: the block's own
+                # footprint only shows as the increase, which is 0 when it stayed below an earlier peak.
+                peak_rss = _peak_rss_mb()
+                summary = {"kind": kind, "name": name, "mode": self.mode, "seconds": seconds,
+                           "process_peak_rss_mb": peak_rss, "process_peak_rss_increase_mb": peak_rss - peak_rss_before}
+                if trace_memory:
+                    _, peak = tracemalloc.get_traced_memory()
+                    statistics = tracemalloc.take_snapshot().statistics("lineno")[:self.top_allocations]
+                    summary["peak_traced_mb"] = peak / 2 ** 20
+                    summary["top_allocations"] = [{"site": str(stat.traceback), "size_kb": stat.size / 1024,
+                                                   "count": stat.count} for stat in statistics]
+                    if tracing:
+                        tracemalloc.stop()
+                with open(f"{stem}.json", "w") as f:
+                    json.dump(summary, f, indent=4)
+                logger.info(f"Profile of {name} saved at: {stem}.*")
+        finally:
+            self._busy.release()
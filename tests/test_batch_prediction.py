@@ -0,0 +1,65 @@
+# File: test_batch_prediction.py
+# Purpose: Tests of BatchPredictionPipeline body parsing and row limits.
+
+import json
+import numpy as np
+import pytest
+from mlproject.entity.config_entity import PredictionConfig
+from mlproject.pipeline.batch_prediction import BatchPredictionPipeline, BatchTooLargeError
+
+COLUMNS = ("fixed acidity", "volatile acidity", "alcohol")
+
+
+@pytest.fixture
+def pipeline():
+    config = PredictionConfig(model_path=None, linear_model_path=None, feature_columns=COLUMNS, max_batch_rows=3,
+                              chunk_size=2, micro_batching=False, micro_batch_wait_ms=2.0, micro_batch_rows=64)
+    return BatchPredictionPipeline(config)
+
+
+def test_json_ndjson_and_csv_bodies_give_the_same_matrix(pipeline):
+    expected = np.array([[7.4, 0.7, 9.4], [7.8, 0.88, 9.8]])
+    json_rows = json.dumps([{"fixed acidity": 7.4, "volatile_acidity": 0.7, "alcohol": 9.4},
+                            [7.8, 0.88, 9.8]]).encode()
+    ndjson = b'{"fixed_acidity": 7.4, "volatile acidity": 0.7, "alcohol": 9.4}\n\n[7.8, 0.88, 9.8]\n'
+    csv = b"alcohol,fixed_acidity,volatile acidity\n9.4,7.4,0.7\n9.8,7.8,0.88\n"
+
+    for body, content_type in ((json_rows, "application/json"),
+                               (json.dumps({"instances": json.loads(json_rows)}).encode(), "application/json"),
+                               (ndjson, "application/x-ndjson"), (csv, "text/csv; charset=utf-8")):
+        matrix = pipeline.parse(body, content_type)
+        assert matrix.dtype == np.float64 and matrix.flags["C_CONTIGUOUS"]
+        assert np.array_equal(matrix, expected)
+
+
+def test_rows_past_the_limit_are_rejected(pipeline):
+    rows = [[1.0, 2.0, 3.0]] * 4
+    with pytest.raises(BatchTooLargeError):
+        pipeline.parse(json.dumps(rows).encode(), "application/json")
+    with pytest.raises(BatchTooLargeError):
+        pipeline.parse(b"a,b,c\n" + b"1,2,3\n" * 4, "text/csv")
+    assert len(pipeline.parse(json.dumps(rows[:3]).encode(), "application/json")) == 3
+
+
+def test_ndjson_parsing_stops_at_the_first_row_past_the_limit(pipeline):
+    # The fifth line is not even JSON: it is never parsed.
+    body = b"[1, 2, 3]\n" * 4 + b"not json\n"
+    with pytest.raises(BatchTooLargeError):
+        pipeline.parse(body, "application/x-ndjson")
+
+
+@pytest.mark.parametrize("body, content_type, message", [
+    (b'[[1, NaN, 3]]', "application/json", "Row 0: column 'volatile acidity'"),
+    (b'[[1, 2, 3], [1, 2, Infinity]]', "application/json", "Row 1: column 'alcohol'"),
+    (b'[[1, true, 3]]', "application/json", "Row 0: column 'volatile acidity' is a boolean"),
+    (b'{"fixed acidity": false, "volatile acidity": 1, "alcohol": 2}\n', "application/x-ndjson",
+     "Row 0: column 'fixed acidity' is a boolean"),
+    (b"fixed acidity,volatile acidity,alcohol\n1,2,3\n1,,3\n", "text/csv", "Row 1: column 'volatile acidity'"),
+    (b"fixed acidity,volatile acidity,alcohol\n1,True,3\n", "text/csv", "booleans"),
+    (b'[{"fixed acidity": 1, "sugar": 2, "alcohol": 3}]', "application/json", "unknown column 'sugar'"),
+    (b'[[1, 2]]', "application/json", "Row 0: expected"),
+    (b'[[1, 2, 3]]', "text/plain", "Unsupported content type"),
+])
+def test_invalid_values_are_rejected_naming_the_row_and_column(pipeline, body, content_type, message):
+    with pytest.raises(ValueError, match=message):
+        pipeline.parse(body, content_type)
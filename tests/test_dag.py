@@ -0,0 +1,121 @@
+# File: test_dag.py
+# Purpose: Tests of the PipelineRunner skip and rerun decisions.
+
+import os  # Deletes an output.
+import pytest
+from box import ConfigBox
+from mlproject.pipeline import dag
+from mlproject.pipeline.dag import PipelineRunner, PipelineStage, PipelineLockedError
+
+
+class FakeConfigurationManager:
+    """Configuration with only the pipeline files and one parameter section per stage."""
+
+    def __init__(self, tmp_path):
+        self.config = ConfigBox({"pipeline": {"lock_file": str(tmp_path / "pipeline.lock"),
+                                              "report_file": str(tmp_path / "report.json")},
+                                 "instrumentation": {"enabled": False}})
+        self.params = ConfigBox({"prepare": {"scale": 1}, "train": {"alpha": 0.1}})
+        self.schema = ConfigBox({})
+
+    def get_profiling_config(self):
+        return None
+
+
+class Stages:
+    """Two stages, prepare (source -> prepared) and train (prepared -> model), run by a recording executor."""
+
+    def __init__(self, tmp_path):
+        self.source, self.prepared, self.model = (str(tmp_path / name) for name in ("source", "prepared", "model"))
+        self.stages = [
+            PipelineStage(name="prepare", module="prepare", class_name="Prepare", deps=(self.source,),
+                          params=(("params", "prepare"),), outs=(self.prepared,)),
+            PipelineStage(name="train", module="train", class_name="Train", deps=(self.prepared,),
+                          params=(("params", "train"),), outs=(self.model,)),
+        ]
+        self.ran = []
+        self.fail = set()
+
+    def executor(self, module_name, class_name, profiling_config=None):
+        self.ran.append(module_name)
+        if module_name in self.fail:
+            raise RuntimeError(f"{module_name} failed")
+        if module_name == "prepare":
+            with open(self.source) as src, open(self.prepared, "w") as out:
+                out.write(src.read().strip())  # Whitespace-only source changes give the same output.
+        else:
+            with open(self.prepared) as src, open(self.model, "w") as out:
+                out.write(f"model of {src.read()}")
+        return 0.0
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    stages = Stages(tmp_path)
+    monkeypatch.setattr(dag, "build_stages", lambda config_manager: stages.stages)
+    with open(stages.source, "w") as f:
+        f.write("rows")
+    manager = FakeConfigurationManager(tmp_path)
+
+    def run(**kwargs):
+        stages.ran.clear()
+        report = PipelineRunner(manager, **kwargs).run(executor=stages.executor)
+        return [entry["status"] for entry in report]
+
+    return stages, manager, run
+
+
+def test_unchanged_stages_are_skipped(pipeline):
+    stages, manager, run = pipeline
+    assert run() == ["ran", "ran"]
+    assert run() == ["cached", "cached"]
+    assert stages.ran == []
+    assert run(force=True) == ["ran", "ran"]
+
+
+def test_changed_deps_rerun_the_stage_and_only_changed_outs_propagate(pipeline):
+    stages, manager, run = pipeline
+    run()
+
+    # Same output: the downstream stage stays cached.
+    with open(stages.source, "w") as f:
+        f.write("rows\n")
+    assert run() == ["ran", "cached"]
+
+    with open(stages.source, "w") as f:
+        f.write("more rows")
+    assert run() == ["ran", "ran"]
+
+
+def test_changed_params_and_missing_outs_rerun_the_stage(pipeline):
+    stages, manager, run = pipeline
+    run()
+    manager.params.train.alpha = 0.5
+    assert run() == ["cached", "ran"]
+
+    os.remove(stages.model)
+    assert run() == ["cached", "ran"]
+
+
+def test_failed_stage_runs_again_next_time(pipeline):
+    stages, manager, run = pipeline
+    run()
+    manager.params.train.alpha = 0.5
+    stages.fail.add("train")
+    with pytest.raises(RuntimeError):
+        run()
+
+    # Restoring the parameters the lock recorded does not make the failed stage look up to date.
+    manager.params.train.alpha = 0.1
+    stages.fail.clear()
+    assert run() == ["cached", "ran"]
+
+
+def test_run_is_refused_while_another_run_holds_the_lock(pipeline):
+    stages, manager, run = pipeline
+    other = PipelineRunner(manager)
+    assert other.run_lock.acquire()
+    with pytest.raises(PipelineLockedError):
+        run()
+    other.run_lock.release()
+    assert run() == ["ran", "ran"]
@@ -0,0 +1,97 @@
+# File: test_data_ingestion.py
+# Purpose: Tests of DataIngestion downloads and of appending the new rows of the extracted data files as partitions.
+
+import urllib.error  # Simulates an unreachable source.
+import pytest
+from mlproject.components import data_ingestion
+from mlproject.components.data_ingestion import DataIngestion
+from mlproject.entity.config_entity import DataIngestionConfig
+from mlproject.utils.partitions import read_index
+
+HEADER = b"a;b;quality\n"
+
+
+def ingest(tmp_path):
+    """Appends the new rows of tmp_path/unzip/data.csv and returns the partitions added."""
+    config = DataIngestionConfig(
+        root_dir=tmp_path, source_URL=str(tmp_path / "data.zip"), local_data_file=tmp_path / "data.zip",
+        unzip_dir=tmp_path / "unzip", manifest_file=tmp_path / "manifest.json", source_sha256=None,
+        partitions_dir=tmp_path / "partitions",
+    )
+    ingestion = DataIngestion(config)
+    ingestion.manifest["members"] = {"data.csv": 0}
+    return ingestion.append_partitions()
+
+
+def partition_bytes(entry):
+    """Contents of a partition file."""
+    with open(entry["file"], "rb") as f:
+        return f.read()
+
+
+@pytest.fixture
+def data_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_ingestion, "BLOCK_SIZE", 4)  # Several blocks per partition.
+    (tmp_path / "unzip").mkdir()
+    path = tmp_path / "unzip" / "data.csv"
+    path.write_bytes(HEADER + b"1;2;5\n3;4;6\n")
+    return path
+
+
+def test_only_new_rows_become_a_partition(tmp_path, data_file):
+    first = ingest(tmp_path)
+    assert [entry["rows"] for entry in first] == [2]
+    assert ingest(tmp_path) == []  # Nothing new.
+
+    with open(data_file, "ab") as f:
+        f.write(b"5;6;7\n")
+    second = ingest(tmp_path)
+    assert partition_bytes(second[0]) == HEADER + b"5;6;7\n"
+    assert [entry["rows"] for entry in read_index(tmp_path / "partitions")] == [2, 1]
+
+
+def test_last_line_without_newline_is_partitioned(tmp_path, data_file):
+    with open(data_file, "ab") as f:
+        f.write(b"5;6;7")
+    first = ingest(tmp_path)
+    assert partition_bytes(first[0]) == HEADER + b"1;2;5\n3;4;6\n5;6;7\n"
+
+    # Rows appended later start on a new line and are not merged into the last one.
+    with open(data_file, "ab") as f:
+        f.write(b"\r\n8;9;4\r\n")
+    second = ingest(tmp_path)
+    assert partition_bytes(second[0]) == HEADER + b"8;9;4\r\n"
+
+
+def test_extending_an_unterminated_last_line_is_rejected(tmp_path, data_file):
+    with open(data_file, "ab") as f:
+        f.write(b"5;6;7")
+    ingest(tmp_path)
+    with open(data_file, "ab") as f:
+        f.write(b"0\n")
+    with pytest.raises(ValueError):
+        ingest(tmp_path)
+
+
+def test_rewritten_rows_are_rejected(tmp_path, data_file):
+    ingest(tmp_path)
+    data_file.write_bytes(HEADER + b"1;2;5\n3;4;9\n5;6;7\n")
+    with pytest.raises(ValueError):
+        ingest(tmp_path)
+
+
+def test_offline_run_keeps_a_local_copy_that_fails_verification(tmp_path, monkeypatch):
+    def unreachable(self):
+        raise urllib.error.URLError("offline")
+
+    monkeypatch.setattr(DataIngestion, "_probe", unreachable)
+    local_copy = tmp_path / "data.zip"
+    local_copy.write_bytes(b"not a zip archive")
+    config = DataIngestionConfig(
+        root_dir=tmp_path, source_URL="https://example.com/data.zip", local_data_file=local_copy,
+        unzip_dir=tmp_path / "unzip", manifest_file=tmp_path / "manifest.json", source_sha256=None,
+        partitions_dir=tmp_path / "partitions",
+    )
+    with pytest.raises(IOError):
+        DataIngestion(config).download_file()
+    assert local_copy.read_bytes() == b"not a zip archive"
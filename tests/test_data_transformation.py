@@ -0,0 +1,117 @@
+# File: test_data_transformation.py
+# Purpose: Tests of DataTransformation splitting the data partitions and merging their train/test sets.
+
+import numpy as np
+import pandas as pd
+import pytest
+from mlproject.components.data_transformation import DataTransformation
+from mlproject.entity.config_entity import DataTransformationConfig
+from mlproject.utils.artifacts import dataset_path, load_dataset
+from mlproject.utils.partitions import append_partition
+
+SCHEMA = {"a": "float64", "b": "float64", "quality": "int64"}
+
+
+def add_partition(tmp_path, rows, seed):
+    """Appends a partition of random rows with qualities 5 (two thirds) and 6 (one third)."""
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame({"a": rng.normal(size=rows).round(6), "b": rng.normal(size=rows).round(6),
+                         "quality": np.where(np.arange(rows) % 3 == 0, 6, 5)})
+    body = data.to_csv(index=False, header=False).encode()
+    return append_partition(tmp_path / "partitions", b"a,b,quality\n", body, source="data.csv")
+
+
+def transformation(tmp_path, strategy="hash", fmt="csv", root="split"):
+    return DataTransformation(DataTransformationConfig(
+        root_dir=tmp_path / root, partitions_dir=tmp_path / "partitions",
+        partition_cache_file=tmp_path / root / "cache.json", split_manifest_file=tmp_path / root / "manifest.csv",
+        split_strategy=strategy, test_size=0.25, random_state=42, stratify_column="quality", artifact_format=fmt,
+        all_schema=SCHEMA,
+    ))
+
+
+def read(tmp_path, name, root="split"):
+    return pd.read_csv(tmp_path / root / f"{name}.csv")
+
+
+@pytest.mark.parametrize("strategy", ["hash", "random", "stratified"])
+def test_existing_rows_never_move_when_partitions_are_added(tmp_path, strategy):
+    (tmp_path / "split").mkdir()
+    add_partition(tmp_path, 600, seed=0)
+    transformation(tmp_path, strategy).train_test_splitting()
+    first = read(tmp_path, "manifest")
+
+    add_partition(tmp_path, 300, seed=1)
+    transformation(tmp_path, strategy).train_test_splitting()
+    second = read(tmp_path, "manifest")
+
+    assert second.iloc[:len(first)].equals(first)
+    train, test = read(tmp_path, "train"), read(tmp_path, "test")
+    assert len(train) + len(test) == 900
+    assert (second["split"] == "test").sum() == len(test)
+    assert abs(len(test) / 900 - 0.25) < 0.05
+
+
+def test_random_and_stratified_splits_are_reproducible(tmp_path):
+    add_partition(tmp_path, 600, seed=0)
+    for root in ("one", "two"):
+        (tmp_path / root).mkdir()
+        transformation(tmp_path, "stratified", root=root).train_test_splitting()
+    assert read(tmp_path, "test", "one").equals(read(tmp_path, "test", "two"))
+
+
+def test_stratified_split_keeps_the_share_of_every_class(tmp_path):
+    (tmp_path / "split").mkdir()
+    add_partition(tmp_path, 600, seed=0)
+    transformation(tmp_path, "stratified").train_test_splitting()
+
+    test = read(tmp_path, "test")
+    assert test["quality"].value_counts().to_dict() == {5: 100, 6: 50}
+
+
+def test_hash_split_depends_only_on_the_row(tmp_path):
+    (tmp_path / "split").mkdir()
+    append_partition(tmp_path / "partitions", b"a,b,quality\n", b"1.5,2.5,5\n", source="data.csv")
+    add_partition(tmp_path, 200, seed=0)
+    append_partition(tmp_path / "partitions", b"a,b,quality\n", b"1.5,2.5,5\n", source="data.csv")
+    transformation(tmp_path, "hash").train_test_splitting()
+
+    manifest = read(tmp_path, "manifest")
+    assert manifest["split"].iloc[0] == manifest["split"].iloc[-1]
+
+
+def test_unknown_strategy_is_rejected(tmp_path):
+    (tmp_path / "split").mkdir()
+    add_partition(tmp_path, 10, seed=0)
+    with pytest.raises(ValueError, match="Unknown split strategy"):
+        transformation(tmp_path, "sorted").train_test_splitting()
+
+
+def test_interrupted_append_is_not_duplicated(tmp_path):
+    (tmp_path / "split").mkdir()
+    add_partition(tmp_path, 300, seed=0)
+    transformation(tmp_path).train_test_splitting()
+    # An earlier run appended rows but died before recording the merge.
+    with open(tmp_path / "split" / "train.csv", "a") as f:
+        f.write("9.0,9.0,5\n")
+
+    add_partition(tmp_path, 300, seed=1)
+    transformation(tmp_path).train_test_splitting()
+    train = read(tmp_path, "train")
+    assert len(train) + len(read(tmp_path, "test")) == 600
+    assert not (train["a"] == 9.0).any()
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "npy"])
+def test_merged_sets_match_across_formats(tmp_path, fmt):
+    pytest.importorskip("pyarrow")
+    for root in ("csv", fmt):
+        (tmp_path / root).mkdir()
+    add_partition(tmp_path, 200, seed=0)
+    add_partition(tmp_path, 100, seed=1)
+    transformation(tmp_path, fmt="csv", root="csv").train_test_splitting()
+    transformation(tmp_path, fmt=fmt, root=fmt).train_test_splitting()
+
+    expected = read(tmp_path, "train", "csv")
+    merged = load_dataset(dataset_path(tmp_path / fmt / "train", fmt), fmt)
+    assert np.allclose(merged.to_numpy(dtype=np.float64), expected.to_numpy(dtype=np.float64))
@@ -0,0 +1,36 @@
+# File: test_hyperparameter_search.py
+# Purpose: Tests of the cross-validated ElasticNet grid search.
+
+import numpy as np
+from sklearn.linear_model import ElasticNet
+from sklearn.metrics import mean_squared_error
+from mlproject.components.hyperparameter_search import ElasticNetSearch
+
+
+def data():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(300, 4))
+    return x, x @ [1.0, 0.0, -2.0, 0.5] + rng.normal(scale=0.5, size=300)
+
+
+def test_duplicate_candidates_are_scored_once():
+    x, y = data()
+    leaderboard = ElasticNetSearch([0.1, 0.01, 0.1], [0.5, 0.2, 0.5, 0.5], cv=3, n_jobs=1).fit(x, y)
+
+    pairs = [(candidate["alpha"], candidate["l1_ratio"]) for candidate in leaderboard["candidates"]]
+    assert sorted(pairs) == [(0.01, 0.2), (0.01, 0.5), (0.1, 0.2), (0.1, 0.5)]
+    assert [candidate["rank"] for candidate in leaderboard["candidates"]] == [1, 2, 3, 4]
+
+
+def test_scores_match_fitting_each_fold():
+    x, y = data()
+    search = ElasticNetSearch([0.1, 0.01], [0.5], cv=3, n_jobs=1, random_state=7)
+    leaderboard = search.fit(x, y)
+
+    folds = np.random.default_rng(7).permutation(np.arange(len(y)) % 3)
+    for candidate in leaderboard["candidates"]:
+        rmse = []
+        for fold in range(3):
+            model = ElasticNet(alpha=candidate["alpha"], l1_ratio=0.5).fit(x[folds != fold], y[folds != fold])
+            rmse.append(np.sqrt(mean_squared_error(y[folds == fold], model.predict(x[folds == fold]))))
+        assert np.isclose(candidate["cv_rmse_mean"], np.mean(rmse), rtol=1e-3)
@@ -0,0 +1,46 @@
+# File: test_micro_batching.py
+# Purpose: Tests of MicroBatcher when its batching thread dies.
+
+import threading  # Concurrent requests.
+import numpy as np
+import pytest
+from mlproject.pipeline.micro_batching import MicroBatcher, BatcherStoppedError
+
+
+def test_dead_batching_thread_fails_waiting_and_later_requests():
+    release = threading.Event()
+
+    def predict_fn(data):
+        if threading.current_thread().name == "micro-batcher":
+            raise SystemExit("batching thread killed")  # Not an Exception, so _score does not catch it.
+        release.wait(10)
+        return data.sum(axis=1)
+
+    batcher = MicroBatcher(predict_fn, max_wait_ms=1)
+
+    # The first request is scored directly and keeps the batcher busy, so the second one is queued.
+    direct = threading.Thread(target=batcher.predict, args=(np.ones((1, 2)),))
+    direct.start()
+    while batcher.stats()["in_flight"] == 0:
+        pass
+    errors = []
+
+    def queued():
+        try:
+            batcher.predict(np.ones((1, 2)))
+        except BaseException as e:
+            errors.append(e)
+
+    waiting = threading.Thread(target=queued)
+    waiting.start()
+    waiting.join(10)
+    release.set()
+    direct.join(10)
+
+    # The queued request gets the error instead of hanging, and new requests fail at once.
+    assert not waiting.is_alive()
+    assert len(errors) == 1 and isinstance(errors[0], BatcherStoppedError)
+    with pytest.raises(BatcherStoppedError):
+        batcher.predict(np.ones((1, 2)))
+    assert batcher.stats()["running"] is False
+    assert batcher.stats()["direct_calls"] == 1
@@ -0,0 +1,26 @@
+# File: test_model_cache.py
+# Purpose: Tests of the ModelCache hit counting.
+
+import os  # Touches the artifact.
+from mlproject.pipeline import model_cache as model_cache_module
+from mlproject.pipeline.model_cache import ModelCache
+
+
+def test_every_hit_path_counts_in_the_attribute_and_the_metric(tmp_path, monkeypatch):
+    monkeypatch.setattr(model_cache_module.metrics, "enabled", True)
+    counter = model_cache_module._cache_hits
+    path = tmp_path / "model.bin"
+    path.write_bytes(b"model")
+    cache = ModelCache()
+    loader = lambda p: p.read_bytes()
+
+    hits_before = counter.value
+    cache.get(path, loader)  # Load.
+    cache.get(path, loader)  # Hit on the lock-free path.
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    cache.get(path, loader)  # Touched but unchanged: hit under the lock.
+
+    assert cache.load_count == 1
+    assert cache.cache_hits == 2
+    assert counter.value - hits_before == 2
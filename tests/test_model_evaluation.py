@@ -0,0 +1,51 @@
+# File: test_model_evaluation.py
+# Purpose: Tests of the streaming ModelEvaluation metrics.
+
+import json
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import ElasticNet
+from mlproject.entity.config_entity import ModelEvaluationConfig
+from mlproject.components.model_evaluation import ModelEvaluation
+
+
+def evaluate(tmp_path, chunk_size):
+    """Evaluates the saved model with the given chunk size and returns metrics.json."""
+    config = ModelEvaluationConfig(
+        root_dir=tmp_path, test_data_path=tmp_path / "test.csv", artifact_format="csv",
+        model_path=tmp_path / "model.joblib", all_params={}, metric_file_name=tmp_path / f"metrics-{chunk_size}.json",
+        target_column="quality", chunk_size=chunk_size, n_bootstrap=1000, confidence_level=0.95, random_state=42,
+    )
+    ModelEvaluation(config).save_results()
+    with open(config.metric_file_name) as f:
+        return json.load(f)
+
+
+def write_data(tmp_path, rows):
+    """Writes a test split of the given number of rows and a model fitted on it."""
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(max(rows, 10), 3))
+    y = np.rint(x @ [1.0, 2.0, 3.0] + 5)
+    data = pd.DataFrame(x[:rows], columns=["a", "b", "c"])
+    data["quality"] = y[:rows]
+    data.to_csv(tmp_path / "test.csv", index=False)
+    joblib.dump(ElasticNet(alpha=0.1).fit(x, y), tmp_path / "model.joblib")
+
+
+def test_empty_test_split_is_rejected(tmp_path):
+    write_data(tmp_path, 0)
+    with pytest.raises(ValueError, match="empty"):
+        evaluate(tmp_path, 100)
+
+
+def test_confidence_intervals_do_not_depend_on_chunk_size(tmp_path):
+    # 5000 rows span three bootstrap blocks of 2000 rows at 1000 replicates.
+    write_data(tmp_path, 5000)
+
+    expected = evaluate(tmp_path, 100000)["confidence_intervals"]
+    for chunk_size in (7, 1999, 2500):
+        intervals = evaluate(tmp_path, chunk_size)["confidence_intervals"]
+        for name in ("rmse", "mae", "r2"):
+            assert np.allclose(intervals[name], expected[name])
@@ -0,0 +1,74 @@
+# File: test_model_registration.py
+# Purpose: Tests of ModelRegistration registering trained models and gating their promotion.
+
+import json
+import pytest
+from mlproject.components.model_registration import ModelRegistration
+from mlproject.entity.config_entity import ModelRegistryConfig
+
+
+def registration(tmp_path, min_improvement=0.01, threshold=None, auto_promote=True):
+    """ModelRegistration of tmp_path/model.joblib gated on a lower-is-better rmse."""
+    return ModelRegistration(ModelRegistryConfig(
+        root_dir=tmp_path / "registry", model_path=tmp_path / "model.joblib",
+        linear_model_path=tmp_path / "linear_model.npz", metric_file_name=tmp_path / "metrics.json",
+        cv_metric_file_name=tmp_path / "cv_metrics.json", report_file=tmp_path / "report.json", data_files=(),
+        all_params={}, auto_promote=auto_promote, gate_metric="rmse", gate_mode="min",
+        min_improvement=min_improvement, threshold=threshold,
+    ))
+
+
+def train(tmp_path, model, rmse):
+    """Writes a model artifact and its evaluation metrics."""
+    (tmp_path / "model.joblib").write_bytes(model)
+    with open(tmp_path / "metrics.json", "w") as f:
+        json.dump({"rmse": rmse}, f)
+
+
+def test_first_version_is_promoted_and_better_ones_replace_it(tmp_path):
+    train(tmp_path, b"first", 0.70)
+    first = registration(tmp_path).run()
+    assert first["gate"]["promoted"] and first["current"] == first["version"]
+
+    train(tmp_path, b"second", 0.60)
+    second = registration(tmp_path).run()
+    assert second["gate"]["promoted"] and second["current"] == second["version"]
+
+
+@pytest.mark.parametrize("rmse", [0.80, 0.695])  # Worse, and better by less than min_improvement.
+def test_version_failing_the_gate_is_registered_but_not_promoted(tmp_path, rmse):
+    train(tmp_path, b"first", 0.70)
+    first = registration(tmp_path).run()
+
+    train(tmp_path, b"second", rmse)
+    second = registration(tmp_path).run()
+    assert second["registered"] and not second["gate"]["promoted"]
+    assert second["current"] == first["version"]
+
+    # A forced promotion, e.g. a manual rollback, skips the gate.
+    forced = registration(tmp_path).promote(second["version"], force=True)
+    assert forced["promoted"] and not forced["passed"]
+    assert registration(tmp_path).registry.current() == second["version"]
+
+
+def test_threshold_applies_without_a_current_version(tmp_path):
+    train(tmp_path, b"first", 0.90)
+    report = registration(tmp_path, threshold=0.8).run()
+    assert not report["gate"]["promoted"] and report["current"] is None
+
+
+def test_gate_decision_is_only_reported_when_auto_promote_is_off(tmp_path):
+    train(tmp_path, b"first", 0.70)
+    report = registration(tmp_path, auto_promote=False).run()
+    assert report["gate"]["passed"] and not report["gate"]["promoted"]
+    assert report["current"] is None
+
+
+def test_retrained_identical_model_reuses_its_version(tmp_path):
+    train(tmp_path, b"first", 0.70)
+    first = registration(tmp_path).run()
+    second = registration(tmp_path).run()
+
+    assert not second["registered"] and second["version"] == first["version"]
+    assert second["gate"]["reason"] == "already current"
+    assert registration(tmp_path).registry.versions() == [first["version"]]
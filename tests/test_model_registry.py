@@ -0,0 +1,31 @@
+# File: test_model_registry.py
+# Purpose: Tests of ModelRegistry promotions and rollbacks.
+
+import pytest
+from mlproject.pipeline.model_registry import ModelRegistry
+
+
+@pytest.fixture
+def registry(tmp_path):
+    """Registry with three versions, v0001 to v0003, each promoted in turn."""
+    registry = ModelRegistry(tmp_path / "registry")
+    for number in range(3):
+        artifact = tmp_path / f"model-{number}.joblib"
+        artifact.write_bytes(f"model {number}".encode())
+        registry.promote(registry.register({"model.joblib": artifact}, {"number": number}))
+    return registry
+
+
+def test_repeated_rollbacks_keep_walking_back(registry):
+    assert registry.current() == "v0003"
+    assert registry.rollback()["version"] == "v0002"
+    assert registry.rollback()["version"] == "v0001"
+    with pytest.raises(ValueError):
+        registry.rollback()
+
+
+def test_promotion_after_rollback_can_be_rolled_back(registry):
+    registry.rollback()
+    registry.promote("v0003")
+    assert registry.rollback()["version"] == "v0002"
+    assert registry.rollback()["version"] == "v0001"
@@ -0,0 +1,88 @@
+# File: test_model_trainer.py
+# Purpose: Tests of the streaming ModelTrainer over partitioned training splits.
+
+import json
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import ElasticNet
+from mlproject.entity.config_entity import ModelTrainerConfig
+from mlproject.components.model_trainer import ModelTrainer
+from mlproject.utils.artifacts import save_dataset
+from mlproject.utils.partitions import INDEX_FILE
+
+FEATURES = ("a", "b", "c")
+
+
+def write_partitions(partitions_dir, fmt, n_partitions=2, rows=400):
+    """Writes the training splits of a few partitions and their index; returns all training rows."""
+    rng = np.random.default_rng(0)
+    parts, index = [], []
+    for number in range(n_partitions):
+        x = rng.uniform(0.0, 5.0, size=(rows, len(FEATURES)))
+        data = pd.DataFrame(x, columns=list(FEATURES))
+        data["quality"] = x @ [1.0, -2.0, 0.5] + 3.0 + rng.normal(scale=0.1, size=rows)
+        name = f"part-{number:05d}"
+        (partitions_dir / name).mkdir(parents=True)
+        save_dataset(data, partitions_dir / name / "train", fmt)
+        index.append({"name": name, "sha256": f"{number:064d}", "rows": rows})
+        parts.append(data)
+    with open(partitions_dir / INDEX_FILE, "w") as f:
+        json.dump({"partitions": index}, f)
+    return pd.concat(parts, ignore_index=True)
+
+
+def trainer(tmp_path, fmt, log_columns=()):
+    """Streaming trainer over tmp_path/partitions with a single hyperparameter candidate."""
+    return ModelTrainer(ModelTrainerConfig(
+        root_dir=tmp_path, train_data_path=tmp_path / "train", test_data_path=tmp_path / "test",
+        artifact_format=fmt, model_name="model.joblib", linear_model_name="linear_model.npz",
+        leaderboard_file=tmp_path / "leaderboard.json", alpha=(0.01,), l1_ratio=(0.5,), target_column="quality",
+        feature_columns=FEATURES, search_cv=3, search_n_jobs=1, search_random_state=42,
+        training_mode="streaming", chunk_size=128, partitions_dir=tmp_path / "partitions",
+        moments_cache_dir=tmp_path / "moments", log_columns=tuple(log_columns), standardize=False,
+        pca_components=None,
+    ))
+
+
+@pytest.mark.parametrize("fmt", ["csv", "npy"])
+@pytest.mark.parametrize("log_columns", [(), ("b",)])
+def test_streaming_fit_matches_in_memory_fit(tmp_path, fmt, log_columns):
+    data = write_partitions(tmp_path / "partitions", fmt)
+    (tmp_path / "moments").mkdir()
+
+    trainer(tmp_path, fmt, log_columns).train()
+    model = joblib.load(tmp_path / "model.joblib")
+
+    # The same fit on the whole training data loaded at once, with the same log transform.
+    x = np.array(data[list(FEATURES)], dtype=np.float64)
+    for column in log_columns:
+        position = FEATURES.index(column)
+        x[:, position] = np.log1p(x[:, position])
+    expected = ElasticNet(alpha=0.01, l1_ratio=0.5).fit(x, data["quality"])
+
+    assert np.allclose(model.predict(data[list(FEATURES)]), expected.predict(x), atol=1e-3)
+
+
+def test_cached_moments_are_reused_when_a_partition_is_added(tmp_path, monkeypatch):
+    data = write_partitions(tmp_path / "partitions", "csv", n_partitions=3)
+    index_file = tmp_path / "partitions" / INDEX_FILE
+    full_index = index_file.read_text()
+    with open(index_file, "w") as f:
+        json.dump({"partitions": json.loads(full_index)["partitions"][:2]}, f)
+    (tmp_path / "moments").mkdir()
+    trainer(tmp_path, "csv").train()
+
+    # The third partition arrives; only its training split is read.
+    index_file.write_text(full_index)
+    read = []
+    original = ModelTrainer.partition_moments
+    monkeypatch.setattr(ModelTrainer, "partition_moments",
+                        lambda self, partition, *args: read.append(partition["name"]) or original(self, partition, *args))
+    trainer(tmp_path, "csv").train()
+    assert read == ["part-00002"]
+    model = joblib.load(tmp_path / "model.joblib")
+
+    expected = ElasticNet(alpha=0.01, l1_ratio=0.5).fit(data[list(FEATURES)], data["quality"])
+    assert np.allclose(model.coef_, expected.coef_, atol=1e-3)
@@ -0,0 +1,67 @@
+# File: test_model_variants.py
+# Purpose: Tests of VariantRouter routing and shadow scoring.
+
+import threading  # Concurrent requests and a blocked shadow.
+import numpy as np
+import pytest
+from mlproject.pipeline.model_variants import VariantRouter
+
+
+class FakePipeline:
+    """Prediction pipeline of one version: predicts the version number, after `gate` opens if one is set."""
+
+    def __init__(self, version, gate=None):
+        self.version, self.gate = version, gate
+
+    def predict(self, data):
+        if self.gate is not None:
+            self.gate.wait(10)
+        return np.full(len(data), float(self.version))
+
+
+def router(monkeypatch, routes, shadow=None, gate=None, shadow_queue_size=1000):
+    monkeypatch.setattr(VariantRouter, "pipeline",
+                        lambda self, version: FakePipeline(version, gate if version == shadow else None))
+    return VariantRouter(routes, shadow=shadow, shadow_queue_size=shadow_queue_size)
+
+
+def test_duplicate_variant_names_are_rejected(monkeypatch):
+    with pytest.raises(ValueError, match="unique"):
+        router(monkeypatch, [{"name": "a", "version": "1", "weight": 1}, {"name": "a", "version": "2", "weight": 1}])
+
+
+def test_routing_key_always_gets_the_same_variant(monkeypatch):
+    routes = [{"name": "a", "version": "1", "weight": 1}, {"name": "b", "version": "2", "weight": 1}]
+    variants = router(monkeypatch, routes)
+    for key in ("user-1", "user-2", "user-3"):
+        answers = {variants.predict(np.ones((1, 2)), key=key)[0] for _ in range(20)}
+        assert len(answers) == 1
+    names = {variants.predict(np.ones((1, 2)))[0] for _ in range(200)}
+    assert names == {"a", "b"}
+
+
+def test_dropped_shadow_requests_are_all_counted(monkeypatch):
+    gate = threading.Event()  # Keeps the shadow busy, so the queue fills up.
+    variants = router(monkeypatch, [{"name": "a", "version": "1", "weight": 1}], shadow="2", gate=gate,
+                      shadow_queue_size=1)
+
+    # The first request is taken by the shadow thread, which then blocks.
+    variants.predict(np.ones((1, 2)))
+    while variants.stats()["shadow"]["queue_depth"]:
+        pass
+
+    def requests():
+        for _ in range(200):
+            variants.predict(np.ones((1, 2)))
+
+    threads = [threading.Thread(target=requests) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # One more request fits in the queue; every other one was dropped.
+    stats = variants.stats()["shadow"]
+    assert stats["queue_depth"] == 1
+    assert stats["dropped"] == 8 * 200 - 1
+    gate.set()
@@ -0,0 +1,76 @@
+# File: test_prediction_cache.py
+# Purpose: Tests of the PredictionCache keys, expiry and eviction.
+
+import types  # Fake clock.
+import numpy as np
+import pytest
+from mlproject.pipeline import prediction_cache
+from mlproject.pipeline.prediction_cache import PredictionCache
+
+
+class Model:
+    """Scorer recording the rows it is asked to predict."""
+
+    def __init__(self):
+        self.scored = []
+
+    def __call__(self, data):
+        self.scored.extend(map(tuple, data))
+        return data.sum(axis=1)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(prediction_cache, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_rows_equal_after_rounding_share_a_key():
+    cache = PredictionCache(decimals=3)
+    keys = cache.keys("model", [[1.0, 0.0], [1.0000004, -0.0], [1.001, 0.0]])
+    assert keys[0] == keys[1]
+    assert keys[0] != keys[2]
+
+
+def test_keys_include_the_model():
+    cache, model = PredictionCache(), Model()
+    cache.predict("old", model, [[1.0, 2.0]])
+    cache.predict("new", model, [[1.0, 2.0]])
+    assert len(model.scored) == 2
+    assert cache.stats()["misses"] == 2
+
+
+def test_only_missing_rows_are_scored():
+    cache, model = PredictionCache(), Model()
+    cache.predict("model", model, [[1.0, 2.0]])
+    predictions = cache.predict("model", model, [[1.0, 2.0], [3.0, 4.0]])
+
+    assert np.array_equal(predictions, [3.0, 7.0])
+    assert model.scored == [(1.0, 2.0), (3.0, 4.0)]
+    assert cache.stats()["hits"] == 1
+
+
+def test_entries_expire_after_the_ttl(clock):
+    cache, model = PredictionCache(ttl_seconds=10.0), Model()
+    cache.predict("model", model, [[1.0, 2.0]])
+    clock[0] = 9.0
+    cache.predict("model", model, [[1.0, 2.0]])
+    assert len(model.scored) == 1
+
+    clock[0] = 10.0
+    cache.predict("model", model, [[1.0, 2.0]])
+    assert len(model.scored) == 2
+    assert cache.stats()["expirations"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache, model = PredictionCache(max_entries=2), Model()
+    cache.predict("model", model, [[1.0], [2.0]])
+    cache.predict("model", model, [[1.0]])  # 2.0 is now the least recently used.
+    cache.predict("model", model, [[3.0]])
+
+    model.scored.clear()
+    cache.predict("model", model, [[1.0], [2.0], [3.0]])
+    assert model.scored == [(2.0,)]
+    assert cache.stats()["entries"] == 2 and cache.stats()["evictions"] == 2
@@ -0,0 +1,80 @@
+# File: test_training_jobs.py
+# Purpose: Tests of TrainingJobRunner recovering from a worker process that dies mid-stage.
+
+import os  # Kills the worker process.
+import time  # Waits for background jobs.
+import pytest
+from mlproject.pipeline import training_jobs
+from mlproject.pipeline.dag import RunLock
+
+
+def crash_stage(module_name, class_name, profiling_config=None):
+    """Stage that kills its worker process, as an OOM kill or a native crash would."""
+    os._exit(1)
+
+
+def quick_stage(module_name, class_name, profiling_config=None):
+    """Stage that succeeds at once."""
+    return 0.0
+
+
+class FakePipelineRunner:
+    """PipelineRunner with a single stage, run through the job's executor."""
+    stages = [type("Stage", (), {"name": "Only stage"})()]
+    lock_path = None  # Set by the tests.
+
+    def __init__(self):
+        self.run_lock = RunLock(self.lock_path)
+
+    def run(self, executor, on_stage=None):
+        on_stage("Only stage", "running", None)
+        seconds = executor("module", "Stage")
+        on_stage("Only stage", "completed", seconds)
+
+
+def wait(job, timeout=60):
+    """Waits until the job finished."""
+    deadline = time.monotonic() + timeout
+    while job.finished_at is None and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return job
+
+
+@pytest.fixture(autouse=True)
+def fake_pipeline(tmp_path, monkeypatch):
+    monkeypatch.setattr(FakePipelineRunner, "lock_path", tmp_path / "pipeline.lock.json.running")
+    monkeypatch.setattr(training_jobs, "PipelineRunner", FakePipelineRunner)
+
+
+def test_worker_is_replaced_after_it_dies(monkeypatch):
+    runner = training_jobs.TrainingJobRunner()
+
+    monkeypatch.setattr(training_jobs, "run_stage", crash_stage)
+    job = wait(runner.submit())
+    assert job.status == "failed"
+    assert "BrokenProcessPool" in job.error
+    assert job.stages[0]["status"] == "failed"
+    assert runner._executor is None
+
+    # The next run starts a fresh worker instead of failing on the broken pool.
+    monkeypatch.setattr(training_jobs, "run_stage", quick_stage)
+    job = wait(runner.submit())
+    assert job.status == "succeeded", job.error
+    runner._executor.shutdown()
+
+
+def test_run_in_another_process_is_refused(tmp_path, monkeypatch):
+    monkeypatch.setattr(training_jobs, "run_stage", quick_stage)
+    other = RunLock(FakePipelineRunner.lock_path)  # A separate open file: flock treats it like another process.
+    assert other.acquire()
+    runner = training_jobs.TrainingJobRunner()
+    with pytest.raises(training_jobs.TrainingInProgressError):
+        runner.submit()
+
+    # Once the other run finished, training starts and releases the lock when it is done.
+    other.release()
+    job = wait(runner.submit())
+    assert job.status == "succeeded", job.error
+    assert other.acquire()
+    other.release()
+    runner._executor.shutdown()